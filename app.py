@@ -22,8 +22,9 @@ from compliance.excel_import import (
 )
 from compliance.models import CaliforniaMealRules
 from compliance.normalize import (
+    EmployeeIndex,
+    RawCardStore,
     assign_legal_workdays,
-    employee_dimension_map,
     job_code_dimension_map,
     load_control_totals_csv,
     load_employee_policy_csv,
@@ -50,8 +51,18 @@ from compliance.snapshot import (
     load_snapshot_bytes,
 )
 from compliance.validation import build_data_quality_report, build_source_coverage
-from oracle_bi.client import OracleBIClient, OracleBIConfig, OracleBIError
+from oracle_bi.cache import DIMENSION_CACHE
+from oracle_bi.client import (
+    OracleBIClient,
+    OracleBIConfig,
+    OracleBIError,
+    config_fingerprint,
+    payload_timecard_count,
+    timecard_units,
+)
+from oracle_bi.planner import RangePlanner
 from oracle_bi.settings import config_from_secret_mapping, config_from_toml_file
+from oracle_bi.warmer import cache_warmer_for, ensure_cache_warmer
 
 
 APP_VERSION = "3.8.1"
@@ -175,13 +186,6 @@ def config_from_secrets() -> OracleBIConfig:
     )
 
 
-def config_fingerprint(config: OracleBIConfig) -> str:
-    material = "|".join(
-        [config.auth_server, config.application_server, config.org_identifier, config.client_id, config.username]
-    )
-    return hashlib.sha256(material.encode("utf-8")).hexdigest()
-
-
 def get_or_create_client(config: OracleBIConfig) -> OracleBIClient:
     fingerprint = config_fingerprint(config)
     if st.session_state.get("oracle_client_fingerprint") != fingerprint:
@@ -198,6 +202,7 @@ def reset_state() -> None:
         "locations_payload",
         "analysis_bundle",
         "dimension_payloads",
+        "raw_cards",
         "analysis_context",
         "adjustment_audit",
         "adjustment_result_history",
@@ -703,10 +708,11 @@ def analyze_payloads(
     control_totals: pd.DataFrame,
     default_workday_start: str,
     default_classification: str,
+    failed_units: dict[tuple[str, date], str] | None = None,
 ) -> tuple[AnalysisBundle, pd.DataFrame, pd.DataFrame]:
     normalized = normalize_timecards(
         timecard_payloads,
-        employees=employee_dimension_map(employees_payloads),
+        employees=EmployeeIndex.from_payloads(employees_payloads),
         job_codes=job_code_dimension_map(jobs_payloads),
         locations=location_dimension_map(locations_payload),
     )
@@ -720,6 +726,7 @@ def analyze_payloads(
         expected_locations=selected_locations,
         start_date=start_date,
         end_date=end_date,
+        failed_units=failed_units,
     )
     selected_set = {str(value) for value in selected_locations}
     authorized_set = {str(value) for value in (authorized_locations or [])}
@@ -764,16 +771,11 @@ def analyze_payloads(
     return bundle, adjustment_audit, adjustment_history
 
 
-def _payload_timecard_count(payload: dict[str, Any]) -> int:
-    total = 0
-    for business_day in payload.get("businessDates", []) or []:
-        if isinstance(business_day, dict):
-            cards = business_day.get("timeCardDetails", []) or []
-            if isinstance(cards, list):
-                total += len(cards)
-    if not payload.get("businessDates") and isinstance(payload.get("timeCardDetails"), list):
-        total += len(payload.get("timeCardDetails") or [])
-    return total
+def max_range_days(client: OracleBIClient) -> int:
+    """Longest range one run may request; beyond 31 days a run journal is required."""
+    if str(client.config.journal_directory).strip():
+        return max(MAX_RANGE_DAYS, int(client.config.max_planned_range_days))
+    return MAX_RANGE_DAYS
 
 
 def analyze_api_source(
@@ -790,28 +792,47 @@ def analyze_api_source(
     jobs_payloads: list[dict[str, Any]] = []
     timecard_payloads: list[dict[str, Any]] = []
     locations_payload = st.session_state.get("locations_payload") or client.get_locations()
-    for loc_ref in loc_refs:
-        employees = client.get_employees(loc_ref)
-        employees.setdefault("locRef", loc_ref)
-        jobs = client.get_job_codes(loc_ref)
-        jobs.setdefault("locRef", loc_ref)
-        employees_payloads.append(employees)
-        jobs_payloads.append(jobs)
-        timecard_payloads.extend(
-            client.get_timecards_range(
-                loc_ref,
-                start_date,
-                end_date,
-                include_adjustments=True,
-                maximum_days=MAX_RANGE_DAYS,
+    warmer = cache_warmer_for(client.config)
+    if warmer is not None:
+        # Closed days the warmer already cached are then read from disk without
+        # asking Oracle for each location's latest business date first.
+        warmer.seed(client)
+    range_limit = max_range_days(client)
+    planned = (end_date - start_date).days + 1 > MAX_RANGE_DAYS
+    units = timecard_units(loc_refs, start_date, end_date, maximum_days=range_limit)
+    # Dimensions and timecards do not depend on each other; only normalization
+    # needs both. Employee and job code requests for every location are queued
+    # first on one worker pool and the (location, business date) units follow
+    # on the same pool, so both kinds of request are in flight together while
+    # total concurrency stays at max_workers. Payloads come back in unit order,
+    # location first and then date. A store that keeps failing trips its
+    # circuit breaker: the days already fetched are kept and the rest are
+    # reported as missing coverage.
+    with client.worker_pool() as pool:
+        dimensions = client.prefetch_dimensions(loc_refs, pool)
+        if planned:
+            # Long look-backs run in 31-day chunks checkpointed to the run journal,
+            # so re-running the same range resumes instead of starting over.
+            planner = RangePlanner(client, client.config.journal_directory, chunk_days=MAX_RANGE_DAYS)
+            fetched, unit_failures = planner.run(
+                loc_refs, start_date, end_date, include_adjustments=True, executor=pool
             )
-        )
+        else:
+            fetched, unit_failures = client.get_timecards_partial(units, include_adjustments=True, executor=pool)
+        for loc_ref, employees_future, jobs_future in dimensions:
+            employees = employees_future.result()
+            employees.setdefault("locRef", loc_ref)
+            jobs = jobs_future.result()
+            jobs.setdefault("locRef", loc_ref)
+            employees_payloads.append(employees)
+            jobs_payloads.append(jobs)
+    timecard_payloads.extend(fetched)
 
     oracle_counts = {ref: 0 for ref in loc_refs}
     for payload in timecard_payloads:
         ref = str(payload.get("locRef") or "")
         if ref in oracle_counts:
-            oracle_counts[ref] += _payload_timecard_count(payload)
+            oracle_counts[ref] += payload_timecard_count(payload)
     zero_oracle_refs = [ref for ref in loc_refs if oracle_counts.get(ref, 0) == 0]
 
     excel_diagnostics: dict[str, Any] | None = None
@@ -843,6 +864,9 @@ def analyze_api_source(
                 payload for payload in jobs_payloads
                 if str(payload.get("locRef") or "") not in excel_used_refs
             ] + converted.job_payloads
+    unit_failures = [
+        failure for failure in unit_failures if failure.loc_ref not in excel_used_refs
+    ]
 
     bundle, adjustment_audit, adjustment_history = analyze_payloads(
         timecard_payloads=timecard_payloads,
@@ -857,6 +881,10 @@ def analyze_api_source(
         ],
         start_date=start_date,
         end_date=end_date,
+        failed_units={
+            (failure.loc_ref, failure.business_date): failure.source_label
+            for failure in unit_failures
+        },
         **kwargs,
     )
     metadata = {
@@ -871,10 +899,107 @@ def analyze_api_source(
             ref for ref in zero_oracle_refs if ref not in excel_used_refs
         ],
         "excel_import_diagnostics": excel_diagnostics,
+        "oracle_failed_units": [
+            {
+                "locRef": failure.loc_ref,
+                "busDt": failure.business_date.isoformat(),
+                "skipped": failure.skipped,
+                "error": failure.error,
+            }
+            for failure in unit_failures
+        ],
     }
     return bundle, metadata, adjustment_audit, adjustment_history
 
 
+def analyze_employee_payloads(
+    *,
+    timecard_payloads: list[dict[str, Any]],
+    employees_payloads: list[dict[str, Any]],
+    jobs_payloads: list[dict[str, Any]],
+    locations_payload: dict[str, Any],
+    rules: CaliforniaMealRules,
+    policy_records: dict[str, list[dict[str, Any]]],
+    workday_records: dict[str, Any],
+    rate_records: dict[str, list[dict[str, Any]]],
+    default_workday_start: str,
+    default_classification: str,
+) -> AnalysisBundle:
+    """Normalize, build legal workdays and run the engine for one employee's cards.
+
+    The payloads are filtered to one employee on purpose, so source coverage,
+    MICROS reconciliation and location scope are not checked: every other
+    employee's day would look missing and block the result. Only the
+    per-timecard data-quality checks apply.
+    """
+    normalized = normalize_timecards(
+        timecard_payloads,
+        employees=EmployeeIndex.from_payloads(employees_payloads),
+        job_codes=job_code_dimension_map(jobs_payloads),
+        locations=location_dimension_map(locations_payload),
+    )
+    legal = assign_legal_workdays(
+        normalized,
+        workday_configs=workday_records,
+        default_workday_start=default_workday_start,
+    )
+    validation = build_data_quality_report(legal)
+    bundle = analyze_timecards(
+        legal,
+        rules=rules,
+        policy_records=policy_records,
+        regular_rate_records=rate_records,
+        default_classification=default_classification,
+        global_data_blocked=validation.blocking_global,
+    )
+    bundle.data_quality = validation.issues
+    return bundle
+
+
+def recheck_employee_source(
+    client: OracleBIClient,
+    payroll_id: str,
+    loc_refs: list[str],
+    start_date: date,
+    end_date: date,
+    **kwargs: Any,
+) -> AnalysisBundle:
+    """Re-run the engine for one employee using only their timecards.
+
+    Timecards are filtered by extPayrollID on the Oracle side for every selected
+    location, so a multi-location workday is still consolidated while a
+    disputed case is verified without repeating the full audit. Dimensions and
+    the filtered timecards share one worker pool, as in ``analyze_api_source``.
+    """
+    locations_payload = st.session_state.get("locations_payload") or client.get_locations()
+    employees_payloads: list[dict[str, Any]] = []
+    jobs_payloads: list[dict[str, Any]] = []
+    with client.worker_pool() as pool:
+        dimensions = client.prefetch_dimensions(loc_refs, pool)
+        timecard_payloads = client.get_employee_timecards(
+            payroll_id,
+            loc_refs,
+            start_date,
+            end_date,
+            maximum_days=max_range_days(client),
+            executor=pool,
+        )
+        for loc_ref, employees_future, jobs_future in dimensions:
+            employees = employees_future.result()
+            employees.setdefault("locRef", loc_ref)
+            jobs = jobs_future.result()
+            jobs.setdefault("locRef", loc_ref)
+            employees_payloads.append(employees)
+            jobs_payloads.append(jobs)
+    return analyze_employee_payloads(
+        timecard_payloads=timecard_payloads,
+        employees_payloads=employees_payloads,
+        jobs_payloads=jobs_payloads,
+        locations_payload=locations_payload,
+        **kwargs,
+    )
+
+
 def save_analysis(
     bundle: AnalysisBundle,
     metadata: dict[str, Any],
@@ -892,6 +1017,9 @@ def save_analysis(
     comparison = compare_snapshot_to_bundle(previous_snapshot, bundle) if previous_snapshot else pd.DataFrame()
     st.session_state.analysis_bundle = bundle
     st.session_state.dimension_payloads = metadata
+    # Original cards are looked up on demand from the payloads already held in
+    # metadata, instead of riding along in every row of the normalized frames.
+    st.session_state.raw_cards = RawCardStore(metadata.get("timecard_payloads") or [])
     st.session_state.adjustment_audit = adjustment_audit
     st.session_state.adjustment_result_history = adjustment_history
     st.session_state.snapshot_comparison = comparison
@@ -1160,6 +1288,9 @@ def render_oracle_mode(
         st.error("Falta configurar los Secrets de Streamlit con la cuenta Business Intelligence API.")
         return
     client = get_or_create_client(config)
+    if config.warm_cache and config.cache_directory:
+        # One warmer per process pre-fetches newly closed days for every session.
+        ensure_cache_warmer(config)
     with st.container(border=True):
         st.markdown("### Consulta a Oracle MICROS")
         c1, c2 = st.columns([1, 3])
@@ -1230,8 +1361,9 @@ def render_oracle_mode(
         if end_date < start_date:
             st.error("La fecha final no puede ser anterior a la inicial.")
             return
-        if (end_date - start_date).days + 1 > MAX_RANGE_DAYS:
-            st.error(f"El rango máximo por ejecución es de {MAX_RANGE_DAYS} días.")
+        range_limit = max_range_days(client)
+        if (end_date - start_date).days + 1 > range_limit:
+            st.error(f"El rango máximo por ejecución es de {range_limit} días.")
             return
         if st.button("Consultar, reconciliar y analizar", type="primary", use_container_width=True):
             if not loc_refs:
@@ -1291,6 +1423,18 @@ def render_oracle_mode(
                 else:
                     st.session_state.pop("excel_fallback_required", None)
 
+                failed_units = metadata.get("oracle_failed_units") or []
+                if failed_units:
+                    failed_refs = sorted({item["locRef"] for item in failed_units})
+                    skipped = sum(1 for item in failed_units if item["skipped"])
+                    st.warning(
+                        f"Oracle no respondió para {len(failed_units)} día(s) de ubicación "
+                        f"({skipped} omitidos por el circuit breaker): "
+                        + ", ".join(location_labels.get(ref, ref) for ref in failed_refs)
+                        + ". Se conservaron los días obtenidos; los faltantes aparecen como "
+                        "cobertura API incompleta."
+                    )
+
                 if excel_used_refs:
                     labels = [location_labels.get(ref, ref) for ref in excel_used_refs]
                     st.success(
@@ -1302,6 +1446,37 @@ def render_oracle_mode(
             except Exception as error:
                 st.error(f"No fue posible completar el análisis: {type(error).__name__}: {error}")
 
+        with st.expander("Verificación rápida de un empleado"):
+            st.caption(
+                "Consulta solo los timecards de un empleado (por External Payroll ID) en las "
+                "ubicaciones y fechas seleccionadas y recalcula sus jornadas. No reemplaza el "
+                "análisis guardado."
+            )
+            payroll_id = st.text_input("External Payroll ID", key="recheck_payroll_id")
+            if st.button("Verificar empleado", use_container_width=True, disabled=not payroll_id.strip()):
+                try:
+                    with st.spinner("Consultando timecards del empleado..."):
+                        recheck = recheck_employee_source(
+                            client,
+                            payroll_id,
+                            loc_refs,
+                            start_date,
+                            end_date,
+                            rules=rules,
+                            policy_records=policy_records,
+                            workday_records=workday_records,
+                            rate_records=rate_records,
+                            default_workday_start=default_workday_start,
+                            default_classification=default_classification,
+                        )
+                    r1, r2 = st.columns(2)
+                    r1.metric("Jornadas", len(recheck.workdays))
+                    r2.metric("Violaciones", len(recheck.violations))
+                    st.dataframe(recheck.violations, use_container_width=True, hide_index=True)
+                    st.dataframe(recheck.workdays, use_container_width=True, hide_index=True)
+                except (OracleBIError, ValueError) as error:
+                    st.error(str(error))
+
 
 def _load_json(file_obj: Any) -> Any:
     return None if file_obj is None else json.loads(file_obj.getvalue().decode("utf-8-sig"))
@@ -2223,6 +2398,19 @@ def render_results(bundle: AnalysisBundle, *, show_advanced: bool) -> None:
                             else value
                         )
                     st.dataframe(raw, use_container_width=True, hide_index=True)
+                    raw_cards = st.session_state.get("raw_cards")
+                    if raw_cards is not None and not raw.empty:
+                        st.markdown("**Timecard Oracle original**")
+                        loc_column, tc_column = st.columns(2)
+                        lookup_loc = loc_column.text_input("locRef", key="raw_card_loc_ref")
+                        lookup_tc = tc_column.text_input("tcId", key="raw_card_tc_id")
+                        if lookup_loc.strip() and lookup_tc.strip():
+                            # Split segments are labelled <tcId>::SEGn; the original card is <tcId>.
+                            card = raw_cards.get((lookup_loc.strip(), lookup_tc.strip().split("::")[0]))
+                            if card is None:
+                                st.info("El timecard no está en los payloads de esta sesión.")
+                            else:
+                                st.json(dict(card), expanded=False)
             with nested[4]:
                 if comparison.empty:
                     st.info("No hay baseline anterior o no se detectaron cambios.")
@@ -2230,6 +2418,34 @@ def render_results(bundle: AnalysisBundle, *, show_advanced: bool) -> None:
                     st.dataframe(comparison, use_container_width=True, hide_index=True)
 
 
+def render_bi_metrics_panel() -> None:
+    client = st.session_state.get("oracle_client")
+    with st.expander("Rendimiento Oracle BI API"):
+        if client is None:
+            st.info("Todavía no hay una conexión Oracle en esta sesión.")
+            return
+        rows = client.metrics.summary()
+        if not rows:
+            st.info("Todavía no se registraron llamadas a Oracle en esta sesión.")
+            return
+        metrics = pd.DataFrame(rows)
+        transfer = client.transfer.snapshot()
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Llamadas HTTP", int(metrics["Attempts"].sum()))
+        c2.metric("Reintentos", int(metrics["Retries"].sum()))
+        c3.metric("Tiempo en Oracle (s)", f"{metrics['Total Latency s'].sum():,.1f}")
+        c4.metric("MB transferidos", f"{transfer['wire_bytes'] / (1024 * 1024):,.2f}")
+        st.caption(
+            "Latencia medida por intento HTTP, incluida la descarga de la respuesta. "
+            "Si el tiempo total de la consulta es mucho mayor que el tiempo en Oracle, "
+            "la diferencia corresponde al procesamiento local."
+        )
+        st.dataframe(metrics, use_container_width=True, hide_index=True)
+        if st.button("Reiniciar métricas", key="reset_bi_metrics"):
+            client.metrics.reset()
+            st.rerun()
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -2250,6 +2466,12 @@ def main() -> None:
     if st.sidebar.button("Cerrar conexión y borrar resultados", use_container_width=True):
         reset_state()
         st.rerun()
+    if show_advanced and st.sidebar.button("Actualizar dimensiones Oracle", use_container_width=True):
+        # Dimension responses are shared by every session; this forces the next
+        # run in any session to reload locations, employees and job codes.
+        DIMENSION_CACHE.invalidate()
+        st.session_state.pop("locations_payload", None)
+        st.rerun()
 
     (
         policy_records, workday_records, rate_records, control_totals,
@@ -2300,6 +2522,7 @@ def main() -> None:
         render_results(bundle, show_advanced=show_advanced)
 
     if show_advanced:
+        render_bi_metrics_panel()
         with st.expander("Alcance y límites"):
             st.markdown(
                 """
@@ -0,0 +1,89 @@
+"""Allocation benchmark for ``iter_timecards`` enrichment.
+
+Compares the previous copy-per-card enrichment with the ``TimecardView``
+overlay on a synthetic payload. Run from the repository root::
+
+    python -m benchmarks.bench_iter_timecards --cards 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+from oracle_bi.client import iter_timecards
+
+
+def synthetic_payload(cards: int, *, per_day: int = 2000) -> dict[str, Any]:
+    days = []
+    for start in range(0, cards, per_day):
+        days.append(
+            {
+                "busDt": f"2026-07-{1 + (start // per_day) % 28:02d}",
+                "timeCardDetails": [
+                    {
+                        "tcId": index,
+                        "empNum": 1000 + index % 500,
+                        "jcNum": 10,
+                        "rvcNum": 1,
+                        "shftType": 0,
+                        "clkInLcl": "2026-07-01T08:00:00",
+                        "clkOutLcl": "2026-07-01T14:30:00",
+                        "clkInUTC": "2026-07-01T15:00:00Z",
+                        "clkOutUTC": "2026-07-01T21:30:00Z",
+                        "clkInStatus": 84,
+                        "clkOutStatus": 84,
+                        "payRt": 20.0,
+                        "regHrs": 6.5,
+                        "lastUpdatedUTC": "2026-07-01T21:30:00Z",
+                        "addedUTC": "2026-07-01T15:00:00Z",
+                        "adjustments": [],
+                    }
+                    for index in range(start, min(cards, start + per_day))
+                ],
+            }
+        )
+    return {"locRef": "8", "_includeAdjustmentsRequested": True, "businessDates": days}
+
+
+def copying_iter_timecards(payloads: Iterable[dict[str, Any]]):
+    """The enrichment ``iter_timecards`` used before ``TimecardView``."""
+    for payload in payloads:
+        loc_ref = str(payload.get("locRef") or "")
+        adjustments_requested = payload.get("_includeAdjustmentsRequested")
+        for business_day in payload.get("businessDates", []) or []:
+            bus_dt = str(business_day.get("busDt") or "")
+            for timecard in business_day.get("timeCardDetails", []) or []:
+                enriched = dict(timecard)
+                enriched["_adjustmentsRequested"] = adjustments_requested
+                yield loc_ref, bus_dt, enriched
+
+
+def measure(label: str, iterate: Callable[[list[dict[str, Any]]], Iterable], payloads: list[dict[str, Any]]) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    # Retain the yielded cards, as the RawCardStore index does.
+    rows = [card for _, _, card in iterate(payloads)]
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    flags = sum(1 for card in rows if card.get("_adjustmentsRequested") is True)
+    print(
+        f"{label:<22} cards={len(rows):>9,}  retained={current / 1024 / 1024:8.1f} MiB  "
+        f"peak={peak / 1024 / 1024:8.1f} MiB  time={elapsed:6.3f}s  flagged={flags:,}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100_000)
+    args = parser.parse_args()
+    payloads = [synthetic_payload(args.cards)]
+    measure("dict copy per card", copying_iter_timecards, payloads)
+    measure("TimecardView overlay", iter_timecards, payloads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Throughput benchmark for ``assign_legal_workdays``.
+
+Compares the previous row-at-a-time splitter, which walked every timecard
+with ``iterrows`` and localized each boundary separately, with the vectorized
+splitter. The synthetic shifts cover overnight and multi-day spans, open and
+inverted cards, missing UTC stamps and both 2026 DST transitions, at two
+locations with different workday starts and timezones. Both frames are
+checked for equality before timing is reported; above
+``--baseline-max-cards`` the row-wise splitter is timed on a sample and scaled
+linearly. Run from the repository root::
+
+    python -m benchmarks.bench_legal_workdays --cards 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time as clock
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Callable
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import pandas as pd
+
+from compliance.models import WorkdayConfigRecord
+from compliance.normalize import (
+    _active_workday_config,
+    _clean_identifier,
+    _float,
+    _parse_time,
+    assign_legal_workdays,
+    categorize_columns,
+    normalize_timecards,
+)
+
+LOCATIONS = {"8": "America/Los_Angeles", "9": "America/New_York"}
+SHIFT_DAYS = (date(2026, 3, 7), date(2026, 3, 8), date(2026, 7, 1), date(2026, 10, 31), date(2026, 11, 1))
+
+
+def _legal_workday_date(moment: pd.Timestamp, workday_start: time) -> date:
+    boundary = pd.Timestamp(datetime.combine(moment.date(), workday_start))
+    return (moment - pd.Timedelta(days=1)).date() if moment < boundary else moment.date()
+
+
+def _next_boundary(moment: pd.Timestamp, workday_start: time) -> pd.Timestamp:
+    current_date = _legal_workday_date(moment, workday_start)
+    return pd.Timestamp(datetime.combine(current_date + timedelta(days=1), workday_start))
+
+
+def _local_to_utc(
+    moment: pd.Timestamp,
+    timezone_name: str,
+    *,
+    range_start: pd.Timestamp | None = None,
+    range_end: pd.Timestamp | None = None,
+) -> pd.Timestamp:
+    if pd.isna(moment):
+        return pd.NaT
+    value = pd.Timestamp(moment)
+    if value.tzinfo is not None:
+        return value.tz_convert("UTC")
+    candidates: list[pd.Timestamp] = []
+    for ambiguous in (True, False):
+        try:
+            candidate = value.tz_localize(
+                timezone_name, ambiguous=ambiguous, nonexistent="shift_forward"
+            ).tz_convert("UTC")
+        except (TypeError, ValueError, ZoneInfoNotFoundError):
+            continue
+        if candidate not in candidates:
+            candidates.append(candidate)
+    if not candidates:
+        return pd.NaT
+    start_utc = pd.to_datetime(range_start, errors="coerce", utc=True)
+    end_utc = pd.to_datetime(range_end, errors="coerce", utc=True)
+    in_range = [
+        candidate
+        for candidate in candidates
+        if (pd.isna(start_utc) or candidate >= start_utc)
+        and (pd.isna(end_utc) or candidate <= end_utc)
+    ]
+    return (in_range or candidates)[0]
+
+
+def rowwise_assign_legal_workdays(
+    timecards: pd.DataFrame,
+    *,
+    workday_configs: dict[str, list[WorkdayConfigRecord]] | None = None,
+    default_workday_start: str = "00:00",
+    default_timezone: str = "America/Los_Angeles",
+) -> pd.DataFrame:
+    """The row-at-a-time splitter ``assign_legal_workdays`` replaced."""
+    if timecards.empty:
+        return timecards.copy()
+    configs = workday_configs or {}
+    default_start = _parse_time(default_workday_start)
+    output: list[dict[str, Any]] = []
+
+    for _, source in timecards.iterrows():
+        row = source.to_dict()
+        start = pd.to_datetime(row.get("clock_in_local"), errors="coerce")
+        end = pd.to_datetime(row.get("clock_out_local"), errors="coerce")
+        original_start_utc = pd.to_datetime(row.get("clock_in_utc"), errors="coerce", utc=True)
+        original_end_utc = pd.to_datetime(row.get("clock_out_utc"), errors="coerce", utc=True)
+        loc_ref = _clean_identifier(row.get("location_ref"))
+        reference_date = start.date() if pd.notna(start) else row.get("business_date")
+        if not isinstance(reference_date, date):
+            reference_date = date.today()
+        config = _active_workday_config(configs, loc_ref, reference_date)
+        workday_start = config.workday_start if config else default_start
+        timezone_name = config.timezone if config else (str(row.get("location_timezone") or "") or default_timezone)
+        verified = config is not None and config.is_verified
+
+        if pd.isna(start):
+            segment = dict(row)
+            segment.update(
+                {
+                    "legal_workday_date": row.get("business_date"),
+                    "workday_start": workday_start.strftime("%H:%M"),
+                    "workday_timezone": timezone_name,
+                    "workday_config_verified": verified,
+                    "business_date_match": False,
+                    "segment_index": 1,
+                    "segment_count": 1,
+                    "is_primary_segment": True,
+                    "source_timecard_id": row.get("timecard_id"),
+                    "calculation_clock_in": pd.NaT,
+                    "calculation_clock_out": pd.NaT,
+                    "utc_duration_adjustment_minutes": 0.0,
+                }
+            )
+            output.append(segment)
+            continue
+
+        if pd.isna(end) or end <= start:
+            windows = [(start, end)]
+        else:
+            windows: list[tuple[pd.Timestamp, pd.Timestamp]] = []
+            cursor = start
+            while cursor < end:
+                boundary = _next_boundary(cursor, workday_start)
+                segment_end = min(end, boundary)
+                windows.append((cursor, segment_end))
+                if segment_end >= end:
+                    break
+                cursor = segment_end
+
+        total_seconds = max(0.0, (end - start).total_seconds()) if pd.notna(end) else 0.0
+        for index, (segment_start, segment_end) in enumerate(windows, start=1):
+            segment = dict(row)
+            segment["original_clock_in_local"] = start
+            segment["original_clock_out_local"] = end
+            segment["clock_in_local"] = segment_start
+            segment["clock_out_local"] = segment_end
+            if segment_start == start and pd.notna(original_start_utc):
+                calculation_start = original_start_utc
+            else:
+                calculation_start = _local_to_utc(
+                    segment_start, timezone_name, range_start=original_start_utc, range_end=original_end_utc
+                )
+            if pd.isna(segment_end):
+                calculation_end = pd.NaT
+            elif segment_end == end and pd.notna(original_end_utc):
+                calculation_end = original_end_utc
+            else:
+                calculation_end = _local_to_utc(
+                    segment_end, timezone_name, range_start=original_start_utc, range_end=original_end_utc
+                )
+            segment["calculation_clock_in"] = calculation_start
+            segment["calculation_clock_out"] = calculation_end
+            local_minutes = (
+                max(0.0, (segment_end - segment_start).total_seconds() / 60.0)
+                if pd.notna(segment_end) else 0.0
+            )
+            actual_minutes = (
+                max(0.0, (calculation_end - calculation_start).total_seconds() / 60.0)
+                if pd.notna(calculation_start) and pd.notna(calculation_end) else local_minutes
+            )
+            segment["utc_duration_adjustment_minutes"] = round(actual_minutes - local_minutes, 2)
+            segment["legal_workday_date"] = _legal_workday_date(segment_start, workday_start)
+            segment["workday_start"] = workday_start.strftime("%H:%M")
+            segment["workday_timezone"] = timezone_name
+            segment["workday_config_verified"] = verified
+            segment["business_date_match"] = segment["legal_workday_date"] == row.get("business_date")
+            segment["segment_index"] = index
+            segment["segment_count"] = len(windows)
+            segment["is_primary_segment"] = index == 1
+            segment["source_timecard_id"] = row.get("timecard_id")
+            if len(windows) > 1:
+                segment["timecard_id"] = f"{row.get('timecard_id')}::SEG{index}"
+            segment_seconds = (
+                max(0.0, (segment_end - segment_start).total_seconds()) if pd.notna(segment_end) else 0.0
+            )
+            ratio = (segment_seconds / total_seconds) if total_seconds > 0 else (1.0 if index == 1 else 0.0)
+            for field in ("regular_hours", "overtime_hours"):
+                segment[field] = _float(row.get(field)) * ratio
+            if index > 1:
+                segment["premium_hours"] = 0.0
+                segment["premium_pay"] = 0.0
+                segment["adjustment_count"] = 0
+                segment["adjustments"] = []
+            output.append(segment)
+
+    result = categorize_columns(pd.DataFrame(output))
+    return result.sort_values(
+        ["employee_key", "legal_workday_date", "clock_in_local", "location_ref", "timecard_id"],
+        na_position="last",
+    ).reset_index(drop=True)
+
+
+def _iso(moment: datetime | None, zone: str | None = None) -> str | None:
+    if moment is None:
+        return None
+    if zone is None:
+        return moment.isoformat()
+    return moment.replace(tzinfo=ZoneInfo(zone)).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def shift_payloads(cards: int, *, seed: int = 7) -> list[dict[str, Any]]:
+    """Timecards with the shapes the splitter has to handle."""
+    rng = random.Random(seed)
+    per_location: dict[str, dict[str, list[dict[str, Any]]]] = {loc_ref: {} for loc_ref in LOCATIONS}
+    for index in range(cards):
+        loc_ref = "8" if index % 3 else "9"
+        zone = LOCATIONS[loc_ref]
+        day = SHIFT_DAYS[index % len(SHIFT_DAYS)]
+        start = datetime.combine(day, time(rng.randrange(24), rng.choice((0, 15, 30, 45)), rng.choice((0, 0, 17))))
+        shape = rng.random()
+        if shape < 0.02:
+            end = None
+        elif shape < 0.03:
+            end = start - timedelta(minutes=rng.randrange(0, 90))
+        elif shape < 0.05:
+            end = start + timedelta(hours=rng.randrange(24, 60))
+        else:
+            end = start + timedelta(minutes=rng.randrange(30, 14 * 60))
+        card: dict[str, Any] = {
+            "tcId": index,
+            "empNum": 1000 + index % 500,
+            "jcNum": 10,
+            "shftType": 0,
+            "clkInLcl": _iso(start),
+            "clkOutLcl": _iso(end),
+            "clkInStatus": 84,
+            "clkOutStatus": 84 if end is not None else None,
+            "payRt": 20.0,
+            "regHrs": round(rng.uniform(0, 10), 2),
+            "ovt1Hrs": round(rng.uniform(0, 2), 2) if rng.random() < 0.2 else 0,
+            "premHrs": 1.0 if rng.random() < 0.05 else 0,
+            "premPay": 20.0 if rng.random() < 0.05 else 0,
+            "adjustments": [{"adjNum": index}] if rng.random() < 0.1 else [],
+        }
+        if rng.random() < 0.9:
+            card["clkInUTC"] = _iso(start, zone)
+            card["clkOutUTC"] = _iso(end, zone)
+        if shape > 0.995:
+            card["clkInLcl"] = None
+        per_location[loc_ref].setdefault(day.isoformat(), []).append(card)
+    return [
+        {
+            "locRef": loc_ref,
+            "_includeAdjustmentsRequested": True,
+            "businessDates": [{"busDt": bus_dt, "timeCardDetails": details} for bus_dt, details in days.items()],
+        }
+        for loc_ref, days in per_location.items()
+    ]
+
+
+def shift_timecards(cards: int) -> pd.DataFrame:
+    locations = {
+        loc_ref: {"locRef": loc_ref, "name": f"Store {loc_ref}", "tz": zone} for loc_ref, zone in LOCATIONS.items()
+    }
+    return normalize_timecards(shift_payloads(cards), locations=locations)
+
+
+def workday_configs() -> dict[str, list[WorkdayConfigRecord]]:
+    return {
+        "9": [
+            WorkdayConfigRecord(
+                location_ref="9",
+                workday_start=time(4, 0),
+                timezone="America/New_York",
+                effective_date=date(2026, 7, 1),
+                verified_by="Payroll",
+                source="Workday policy",
+            )
+        ]
+    }
+
+
+def timed(splitter: Callable[..., pd.DataFrame], timecards: pd.DataFrame) -> tuple[pd.DataFrame, float]:
+    started = clock.perf_counter()
+    frame = splitter(timecards, workday_configs=workday_configs())
+    return frame, clock.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument(
+        "--baseline-max-cards",
+        type=int,
+        default=100_000,
+        help="Time the row-wise splitter on at most this many cards and scale linearly above it.",
+    )
+    args = parser.parse_args()
+    for cards in args.cards:
+        timecards = shift_timecards(cards)
+        after, vectorized = timed(assign_legal_workdays, timecards)
+        sample = min(cards, args.baseline_max_cards)
+        sample_timecards = timecards if sample == cards else shift_timecards(sample)
+        before, rowwise = timed(rowwise_assign_legal_workdays, sample_timecards)
+        expected = after if sample == cards else timed(assign_legal_workdays, sample_timecards)[0]
+        pd.testing.assert_frame_equal(before, expected)
+        rowwise *= cards / sample
+        estimated = " (est.)" if sample < cards else "       "
+        print(
+            f"cards={cards:>9,}  segments={len(after):>9,}  row-wise={rowwise:8.2f}s{estimated}  "
+            f"vectorized={vectorized:7.2f}s  speedup={rowwise / vectorized:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Throughput benchmark for ``normalize_timecards``.
+
+Compares the previous row-at-a-time builder, which parsed six timestamps per
+card with ``pd.to_datetime`` and then re-parsed the columns, with the columnar
+builder that parses each timestamp column once. Both frames are checked for
+equality before timing is reported. The row-wise builder takes milliseconds
+per card, so above ``--baseline-max-cards`` it is timed on a sample and scaled
+linearly. Run from the repository root::
+
+    python -m benchmarks.bench_normalize --cards 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable, Iterable
+
+import pandas as pd
+
+from benchmarks.bench_iter_timecards import synthetic_payload
+from compliance.normalize import (
+    CLOCK_IN_STATUS,
+    CLOCK_OUT_STATUS,
+    SHIFT_TYPE,
+    _clean_identifier,
+    _employee_display_name,
+    _float,
+    _location_name,
+    _resolve_employee,
+    categorize_columns,
+    employee_dimension_map,
+    normalize_timecards,
+)
+from oracle_bi.client import iter_timecards
+
+
+def rowwise_normalize_timecards(
+    payloads: Iterable[dict[str, Any]],
+    *,
+    employees: dict[Any, dict[str, Any]] | None = None,
+    job_codes: dict[Any, dict[str, Any]] | None = None,
+    locations: dict[str, dict[str, Any]] | None = None,
+) -> pd.DataFrame:
+    """The row-at-a-time builder ``normalize_timecards`` replaced."""
+    employees = employees or {}
+    job_codes = job_codes or {}
+    locations = locations or {}
+    rows: list[dict[str, Any]] = []
+
+    for loc_ref, bus_dt, card in iter_timecards(payloads):
+        try:
+            emp_num = int(card.get("empNum"))
+        except (TypeError, ValueError):
+            emp_num = -1
+        try:
+            jc_num = int(card.get("jcNum"))
+        except (TypeError, ValueError):
+            jc_num = -1
+
+        employee, employee_match_method = _resolve_employee(employees, emp_num=emp_num, card=card)
+        loc_ref_clean = _clean_identifier(loc_ref)
+        job = job_codes.get(f"{loc_ref_clean}::{jc_num}") or job_codes.get(jc_num, {})
+        location = locations.get(loc_ref_clean, {})
+        employee_name = _employee_display_name(employee, card, emp_num)
+        payroll_id = _clean_identifier(
+            card.get("payrollID")
+            or card.get("extPayrollID")
+            or employee.get("payrollId")
+            or employee.get("externalPayrollID")
+        )
+        employee_key = payroll_id or (f"EMP::{emp_num}" if emp_num >= 0 else "UNKNOWN")
+        shift_type = int(card.get("shftType", 0) or 0)
+        clock_in_status = int(card.get("clkInStatus", 0) or 0)
+        clock_out_raw = card.get("clkOutStatus")
+        clock_out_status = None if clock_out_raw is None else int(clock_out_raw or 0)
+        clock_in_local = pd.to_datetime(card.get("clkInLcl"), errors="coerce")
+        clock_out_local = pd.to_datetime(card.get("clkOutLcl"), errors="coerce")
+        adjustment_items = card.get("adjustments", []) or []
+        if not isinstance(adjustment_items, list):
+            adjustment_items = []
+
+        rows.append(
+            {
+                "location_ref": loc_ref_clean,
+                "location_name": _location_name(location, loc_ref_clean),
+                "location_timezone": str(
+                    location.get("tz") or location.get("timeZone") or location.get("timezone") or ""
+                ),
+                "business_date": pd.to_datetime(bus_dt, errors="coerce").date() if bus_dt else pd.NaT,
+                "timecard_id": _clean_identifier(card.get("tcId")),
+                "employee_num": emp_num,
+                "employee_key": employee_key,
+                "employee_name": employee_name,
+                "employee_name_resolved": bool(employee),
+                "employee_match_method": employee_match_method,
+                "payroll_id": payroll_id,
+                "oracle_employee_class": str(employee.get("className") or ""),
+                "job_code_num": jc_num,
+                "job_code": str(job.get("name") or job.get("jobCodeName") or card.get("jobCodeRef") or jc_num),
+                "rvc_num": _clean_identifier(card.get("rvcNum")),
+                "shift_num": _clean_identifier(card.get("shftNum")),
+                "shift_type": shift_type,
+                "shift_type_label": SHIFT_TYPE.get(shift_type, f"Unknown ({shift_type})"),
+                "clock_in_local": clock_in_local,
+                "clock_out_local": clock_out_local,
+                "clock_in_utc": pd.to_datetime(card.get("clkInUTC"), errors="coerce", utc=True),
+                "clock_out_utc": pd.to_datetime(card.get("clkOutUTC"), errors="coerce", utc=True),
+                "clock_in_status": clock_in_status,
+                "clock_in_status_label": CLOCK_IN_STATUS.get(clock_in_status, f"Unknown ({clock_in_status})"),
+                "clock_out_status": clock_out_status,
+                "clock_out_status_label": (
+                    "Still Clocked In"
+                    if clock_out_status is None and pd.isna(clock_out_local)
+                    else "Clock Out Status Missing"
+                    if clock_out_status is None
+                    else CLOCK_OUT_STATUS.get(clock_out_status, f"Unknown ({clock_out_status})")
+                ),
+                "regular_hours": _float(card.get("regHrs")),
+                "overtime_hours": sum(_float(card.get(f"ovt{i}Hrs")) for i in range(1, 5)),
+                "pay_rate": _float(card.get("payRt")) or None,
+                "premium_hours": _float(card.get("premHrs")),
+                "premium_pay": _float(card.get("premPay")),
+                "adjustment_count": len(adjustment_items),
+                "adjustments_field_present": "adjustments" in card,
+                "adjustments_request_verified": card.get("_adjustmentsRequested") is True,
+                "adjustments": adjustment_items,
+                "added_utc": pd.to_datetime(card.get("addedUTC"), errors="coerce", utc=True),
+                "last_updated_utc": pd.to_datetime(card.get("lastUpdatedUTC"), errors="coerce", utc=True),
+                "source_system": str(card.get("_sourceSystem") or "Oracle BI API"),
+                "source_file": str(card.get("_sourceFile") or ""),
+                "source_row": card.get("_sourceRow"),
+                "raw": card,
+            }
+        )
+
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return df
+    for column in (
+        "clock_in_local",
+        "clock_out_local",
+        "clock_in_utc",
+        "clock_out_utc",
+        "added_utc",
+        "last_updated_utc",
+    ):
+        df[column] = pd.to_datetime(df[column], errors="coerce")
+    return df.sort_values(
+        ["location_ref", "employee_key", "business_date", "clock_in_local", "timecard_id"],
+        na_position="last",
+    ).reset_index(drop=True)
+
+
+def dimensions() -> dict[str, Any]:
+    return {
+        "employees": employee_dimension_map(
+            {
+                "locRef": "8",
+                "employees": [
+                    {"num": 1000 + index, "fName": "Employee", "lName": str(index), "payrollId": f"P{index}"}
+                    for index in range(500)
+                ],
+            }
+        ),
+        "job_codes": {10: {"num": 10, "name": "Server"}},
+        "locations": {"8": {"locRef": "8", "name": "Store 8", "tz": "America/Los_Angeles"}},
+    }
+
+
+def timed(builder: Callable[..., pd.DataFrame], payloads: list[dict[str, Any]], **kwargs: Any) -> tuple[pd.DataFrame, float]:
+    started = time.perf_counter()
+    frame = builder(payloads, **kwargs)
+    return frame, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument(
+        "--baseline-max-cards",
+        type=int,
+        default=100_000,
+        help="Time the row-wise builder on at most this many cards and scale linearly above it.",
+    )
+    args = parser.parse_args()
+    kwargs = dimensions()
+    for cards in args.cards:
+        payloads = [synthetic_payload(cards)]
+        after, columnar = timed(normalize_timecards, payloads, **kwargs)
+        sample = min(cards, args.baseline_max_cards)
+        sample_payloads = payloads if sample == cards else [synthetic_payload(sample)]
+        before, rowwise = timed(rowwise_normalize_timecards, sample_payloads, **kwargs)
+        expected = after if sample == cards else normalize_timecards(sample_payloads, **kwargs)
+        # The row-wise builder predates categorical text columns and RawCardStore.
+        pd.testing.assert_frame_equal(categorize_columns(before.drop(columns=["raw"])), expected)
+        rowwise *= cards / sample
+        estimated = " (est.)" if sample < cards else "       "
+        print(
+            f"cards={cards:>9,}  row-wise={rowwise:8.2f}s{estimated}  columnar={columnar:7.2f}s  "
+            f"speedup={rowwise / columnar:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
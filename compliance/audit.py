@@ -308,7 +308,7 @@ def build_adjustment_result_history(
     group_date = "legal_workday_date" if "legal_workday_date" in timecards.columns else "business_date"
     rows: list[dict[str, Any]] = []
 
-    for (_, _), group in timecards.groupby([group_date, "employee_key"], dropna=False):
+    for (_, _), group in timecards.groupby([group_date, "employee_key"], dropna=False, observed=True):
         rolling = group.copy(deep=True)
         events: list[tuple[pd.Timestamp, str, dict[str, Any], str]] = []
         primary = rolling[rolling.get("is_primary_segment", pd.Series(True, index=rolling.index)).fillna(True)]
@@ -645,7 +645,7 @@ def analyze_timecards(
 
     group_date = "legal_workday_date" if "legal_workday_date" in timecards.columns else "business_date"
     analyses: list[WorkdayAnalysis] = []
-    grouped = timecards.groupby([group_date, "employee_key"], sort=True, dropna=False)
+    grouped = timecards.groupby([group_date, "employee_key"], sort=True, dropna=False, observed=True)
     for _, group in grouped:
         analyses.append(
             analyze_workday_group(
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta
-from typing import Any, Iterable, Sequence
+import threading
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import numpy as np
 import pandas as pd
 
 from compliance.models import EmployeePolicyRecord, RegularRateRecord, WorkdayConfigRecord
-from oracle_bi.client import iter_timecards
+from oracle_bi.client import TimecardView, iter_timecards
 
 
 CLOCK_IN_STATUS = {
@@ -52,7 +54,7 @@ def _clean_identifier(value: Any) -> str:
     return text
 
 
-def _lookup_keys(prefix: str, value: Any) -> list[str]:
+def _lookup_variants(value: Any) -> list[str]:
     cleaned = _clean_identifier(value)
     if not cleaned:
         return []
@@ -61,7 +63,11 @@ def _lookup_keys(prefix: str, value: Any) -> list[str]:
         normalized_numeric = str(int(cleaned))
         if normalized_numeric not in variants:
             variants.append(normalized_numeric)
-    return [f"{prefix}::{variant}" for variant in variants]
+    return variants
+
+
+def _lookup_keys(prefix: str, value: Any) -> list[str]:
+    return [f"{prefix}::{variant}" for variant in _lookup_variants(value)]
 
 
 def _payload_list(payload_or_payloads: Any) -> list[dict[str, Any]]:
@@ -98,30 +104,119 @@ def employee_dimension_map(payload_or_payloads: Any) -> dict[Any, dict[str, Any]
     return result
 
 
+# Fallback order for cards whose empNum is not an employee.num: (index prefix,
+# card field, match method recorded on the row).
+EMPLOYEE_MATCH_CANDIDATES = (
+    ("NUM", "empNum", "employee.num (normalized)"),
+    ("EMPLOYEE_ID", "empNum", "empNum matched employee.employeeId"),
+    ("PAYROLL", "payrollID", "employee.payrollId"),
+    ("EXTERNAL_PAYROLL", "extPayrollID", "employee.externalPayrollID"),
+    ("PAYROLL", "extPayrollID", "external ID matched payrollId"),
+    ("EXTERNAL_PAYROLL", "payrollID", "payrollID matched externalPayrollID"),
+    ("EMPLOYEE_ID", "payrollID", "payrollID matched employeeId"),
+    ("EMPLOYEE_ID", "extPayrollID", "external payroll ID matched employeeId"),
+    ("PAYROLL", "empNum", "empNum matched payrollId"),
+    ("EXTERNAL_PAYROLL", "empNum", "empNum matched externalPayrollID"),
+)
+
+
 def _resolve_employee(
     employees: dict[Any, dict[str, Any]], *, emp_num: int, card: dict[str, Any]
 ) -> tuple[dict[str, Any], str]:
     if emp_num >= 0 and emp_num in employees:
         return employees[emp_num], "employee.num"
-    candidates = (
-        ("NUM", card.get("empNum"), "employee.num (normalized)"),
-        ("EMPLOYEE_ID", card.get("empNum"), "empNum matched employee.employeeId"),
-        ("PAYROLL", card.get("payrollID"), "employee.payrollId"),
-        ("EXTERNAL_PAYROLL", card.get("extPayrollID"), "employee.externalPayrollID"),
-        ("PAYROLL", card.get("extPayrollID"), "external ID matched payrollId"),
-        ("EXTERNAL_PAYROLL", card.get("payrollID"), "payrollID matched externalPayrollID"),
-        ("EMPLOYEE_ID", card.get("payrollID"), "payrollID matched employeeId"),
-        ("EMPLOYEE_ID", card.get("extPayrollID"), "external payroll ID matched employeeId"),
-        ("PAYROLL", card.get("empNum"), "empNum matched payrollId"),
-        ("EXTERNAL_PAYROLL", card.get("empNum"), "empNum matched externalPayrollID"),
-    )
-    for prefix, value, method in candidates:
-        for key in _lookup_keys(prefix, value):
+    for prefix, field, method in EMPLOYEE_MATCH_CANDIDATES:
+        for key in _lookup_keys(prefix, card.get(field)):
             if key in employees:
                 return employees[key], method
     return {}, "unresolved"
 
 
+class EmployeeIndex:
+    """Employee lookup split by identifier kind, built once per run.
+
+    ``employee_dimension_map`` keys every identifier variant as a prefixed
+    string in one dict. Here the integer ``num`` keys and each prefix get their
+    own map keyed by the bare variant, so resolving a column of cards derives
+    the lookup variants once per distinct card value instead of once per card
+    and candidate. Resolution order and first-match-wins semantics are the
+    same as ``_resolve_employee``.
+    """
+
+    def __init__(self, employees: dict[Any, dict[str, Any]] | None = None) -> None:
+        self.by_num: dict[int, dict[str, Any]] = {}
+        self.by_prefix: dict[str, dict[str, dict[str, Any]]] = {}
+        for key, employee in (employees or {}).items():
+            if isinstance(key, str):
+                prefix, separator, variant = key.partition("::")
+                if separator:
+                    self.by_prefix.setdefault(prefix, {})[variant] = employee
+            elif isinstance(key, int) and not isinstance(key, bool):
+                self.by_num[key] = employee
+
+    @classmethod
+    def from_payloads(cls, payload_or_payloads: Any) -> "EmployeeIndex":
+        return cls(employee_dimension_map(payload_or_payloads))
+
+    def resolve(
+        self, emp_nums: Sequence[int], card_fields: dict[str, Sequence[Any]]
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Resolve every card at once.
+
+        ``emp_nums`` holds each card's integer empNum (-1 when missing) and
+        ``card_fields`` the raw ``empNum``, ``payrollID`` and ``extPayrollID``
+        columns. Returns the matched employee (``{}`` when unresolved) and the
+        match method for every row.
+        """
+        count = len(emp_nums)
+        matches = np.empty(count, dtype=object)
+        methods = np.full(count, "unresolved", dtype=object)
+        pending = np.ones(count, dtype=bool)
+
+        # Non-numeric, negative or out-of-range empNums skip the num lookup
+        # and go on to the payroll-ID candidates, as the per-row path did.
+        nums = pd.to_numeric(pd.Series(list(emp_nums), dtype=object), errors="coerce").to_numpy(dtype=float)
+        usable = np.isfinite(nums) & (nums >= 0) & (nums < 2.0**53) & (nums == np.floor(nums))
+        codes, uniques = pd.factorize(np.where(usable, nums, -1).astype(np.int64))
+        by_num = np.array(
+            [self.by_num.get(int(num)) if num >= 0 else None for num in uniques] + [None], dtype=object
+        )
+        hits = by_num[codes]
+        found = pd.notna(hits) & pending
+        matches[found] = hits[found]
+        methods[found] = "employee.num"
+        pending &= ~found
+
+        # Lookup variants per distinct raw value of each card field.
+        variants: dict[str, tuple[np.ndarray, list[list[str]]]] = {}
+        for field in {field for _, field, _ in EMPLOYEE_MATCH_CANDIDATES}:
+            field_codes, field_uniques = pd.factorize(pd.Series(list(card_fields[field]), dtype=object))
+            variants[field] = (
+                field_codes,
+                [_lookup_variants(value) for value in field_uniques],
+            )
+
+        for prefix, field, method in EMPLOYEE_MATCH_CANDIDATES:
+            if not pending.any():
+                break
+            lookup = self.by_prefix.get(prefix)
+            if not lookup:
+                continue
+            field_codes, field_variants = variants[field]
+            resolved = np.array(
+                [next((lookup[key] for key in keys if key in lookup), None) for keys in field_variants] + [None],
+                dtype=object,
+            )
+            hits = resolved[field_codes]
+            found = pd.notna(hits) & pending
+            matches[found] = hits[found]
+            methods[found] = method
+            pending &= ~found
+
+        matches[pending] = [{} for _ in range(int(pending.sum()))]
+        return matches.tolist(), methods.tolist()
+
+
 def job_code_dimension_map(payload_or_payloads: Any) -> dict[Any, dict[str, Any]]:
     """Index job codes globally and, when possible, by location."""
     result: dict[Any, dict[str, Any]] = {}
@@ -178,17 +273,150 @@ def _float(value: Any) -> float:
         return 0.0
 
 
+# Low-cardinality text columns of the normalized frame, stored as categoricals.
+CATEGORICAL_COLUMNS = (
+    "location_ref",
+    "location_name",
+    "employee_key",
+    "employee_name",
+    "job_code",
+    "shift_type_label",
+    "clock_in_status_label",
+    "clock_out_status_label",
+    "source_system",
+)
+
+
+def categorize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store ``CATEGORICAL_COLUMNS`` as categoricals with sorted categories.
+
+    Categories are the distinct values in lexical order, so the same data
+    always gets the same codes and sorting by a column still sorts by text.
+    Group by these columns with ``observed=True``. Converts ``df`` in place and
+    returns it.
+    """
+    for column in CATEGORICAL_COLUMNS:
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(object)
+        df[column] = pd.Categorical(values, categories=sorted(values.dropna().unique(), key=str))
+    return df
+
+
+# Timecard fields parsed as timestamps: output column, card field, parse as UTC.
+TIMESTAMP_FIELDS = (
+    ("clock_in_local", "clkInLcl", False),
+    ("clock_out_local", "clkOutLcl", False),
+    ("clock_in_utc", "clkInUTC", True),
+    ("clock_out_utc", "clkOutUTC", True),
+    ("added_utc", "addedUTC", True),
+    ("last_updated_utc", "lastUpdatedUTC", True),
+)
+
+
+def _parse_timestamp_column(values: list[Any], *, utc: bool) -> pd.Series:
+    """Parse one column of Oracle timestamps in a single pass.
+
+    Oracle sends ISO 8601 strings, so the whole column goes through the ISO
+    parser at once. Only the values it rejects (free-form Excel text, bad
+    punches) get the lenient per-value parse the row-wise builder always used.
+    """
+    raw = pd.Series(values, dtype=object)
+    try:
+        parsed = pd.to_datetime(raw, format="ISO8601", errors="coerce", utc=utc)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is None or parsed.dtype.kind != "M":
+        # Mixed offsets in a local column: parse every value leniently.
+        return _parse_timestamps_leniently(values, utc=utc)
+    missed = parsed.isna() & raw.notna() & (raw != "")
+    if not missed.any():
+        return parsed
+    retried = _parse_timestamps_leniently(raw[missed].tolist(), utc=utc)
+    if retried.isna().all():
+        return parsed
+    if retried.dtype != parsed.dtype:
+        return _parse_timestamps_leniently(values, utc=utc)
+    retried.index = raw.index[missed]
+    parsed[missed] = retried
+    return parsed
+
+
+def _parse_timestamps_leniently(values: list[Any], *, utc: bool) -> pd.Series:
+    return pd.to_datetime(
+        pd.Series([pd.to_datetime(value, errors="coerce", utc=utc) for value in values], dtype=object),
+        errors="coerce",
+        utc=utc,
+    )
+
+
 def normalize_timecards(
     payloads: Iterable[dict[str, Any]],
     *,
-    employees: dict[Any, dict[str, Any]] | None = None,
+    employees: dict[Any, dict[str, Any]] | EmployeeIndex | None = None,
     job_codes: dict[Any, dict[str, Any]] | None = None,
     locations: dict[str, dict[str, Any]] | None = None,
 ) -> pd.DataFrame:
-    employees = employees or {}
+    index = employees if isinstance(employees, EmployeeIndex) else EmployeeIndex(employees)
     job_codes = job_codes or {}
     locations = locations or {}
-    rows: list[dict[str, Any]] = []
+    columns: dict[str, list[Any]] = {
+        name: []
+        for name in (
+            "location_ref",
+            "location_name",
+            "location_timezone",
+            "business_date",
+            "timecard_id",
+            "employee_num",
+            "employee_key",
+            "employee_name",
+            "employee_name_resolved",
+            "employee_match_method",
+            "payroll_id",
+            "oracle_employee_class",
+            "job_code_num",
+            "job_code",
+            "rvc_num",
+            "shift_num",
+            "shift_type",
+            "shift_type_label",
+            "clock_in_local",
+            "clock_out_local",
+            "clock_in_utc",
+            "clock_out_utc",
+            "clock_in_status",
+            "clock_in_status_label",
+            "clock_out_status",
+            "clock_out_status_label",
+            "regular_hours",
+            "overtime_hours",
+            "pay_rate",
+            "premium_hours",
+            "premium_pay",
+            "adjustment_count",
+            "adjustments_field_present",
+            "adjustments_request_verified",
+            "adjustments",
+            "added_utc",
+            "last_updated_utc",
+            "source_system",
+            "source_file",
+            "source_row",
+        )
+    }
+    # Cards are only needed for display-name fallbacks; the original payloads
+    # stay reachable by (locRef, tcId) through RawCardStore.
+    cards: list[Mapping[str, Any]] = []
+    # Raw timestamp strings are collected per column and parsed once below.
+    timestamp_values = {card_field: columns[column] for column, card_field, _ in TIMESTAMP_FIELDS}
+    # Raw identifier columns, resolved against the employee index in one pass.
+    card_ids: dict[str, list[Any]] = {field: [] for field in ("empNum", "payrollID", "extPayrollID")}
+    # Every card of a location-day shares these; resolve them once.
+    business_dates: dict[str, Any] = {}
+    location_fields: dict[str, tuple[str, str, str]] = {}
 
     for loc_ref, bus_dt, card in iter_timecards(payloads):
         try:
@@ -200,100 +428,139 @@ def normalize_timecards(
         except (TypeError, ValueError):
             jc_num = -1
 
-        employee, employee_match_method = _resolve_employee(employees, emp_num=emp_num, card=card)
-        loc_ref_clean = _clean_identifier(loc_ref)
+        if loc_ref not in location_fields:
+            loc_ref_clean = _clean_identifier(loc_ref)
+            location = locations.get(loc_ref_clean, {})
+            location_fields[loc_ref] = (
+                loc_ref_clean,
+                _location_name(location, loc_ref_clean),
+                str(location.get("tz") or location.get("timeZone") or location.get("timezone") or ""),
+            )
+        loc_ref_clean, location_name, location_timezone = location_fields[loc_ref]
+        if bus_dt not in business_dates:
+            business_dates[bus_dt] = pd.to_datetime(bus_dt, errors="coerce").date() if bus_dt else pd.NaT
         job = job_codes.get(f"{loc_ref_clean}::{jc_num}") or job_codes.get(jc_num, {})
-        location = locations.get(loc_ref_clean, {})
-        employee_name = _employee_display_name(employee, card, emp_num)
-        payroll_id = _clean_identifier(
-            card.get("payrollID")
-            or card.get("extPayrollID")
-            or employee.get("payrollId")
-            or employee.get("externalPayrollID")
-        )
-        employee_key = payroll_id or (f"EMP::{emp_num}" if emp_num >= 0 else "UNKNOWN")
+        for field, values in card_ids.items():
+            values.append(card.get(field))
         shift_type = int(card.get("shftType", 0) or 0)
         clock_in_status = int(card.get("clkInStatus", 0) or 0)
         clock_out_raw = card.get("clkOutStatus")
-        clock_out_status = None if clock_out_raw is None else int(clock_out_raw or 0)
-        clock_in_local = pd.to_datetime(card.get("clkInLcl"), errors="coerce")
-        clock_out_local = pd.to_datetime(card.get("clkOutLcl"), errors="coerce")
         adjustment_items = card.get("adjustments", []) or []
         if not isinstance(adjustment_items, list):
             adjustment_items = []
 
-        rows.append(
-            {
-                "location_ref": loc_ref_clean,
-                "location_name": _location_name(location, loc_ref_clean),
-                "location_timezone": str(
-                    location.get("tz") or location.get("timeZone") or location.get("timezone") or ""
-                ),
-                "business_date": pd.to_datetime(bus_dt, errors="coerce").date() if bus_dt else pd.NaT,
-                "timecard_id": _clean_identifier(card.get("tcId")),
-                "employee_num": emp_num,
-                "employee_key": employee_key,
-                "employee_name": employee_name,
-                "employee_name_resolved": bool(employee),
-                "employee_match_method": employee_match_method,
-                "payroll_id": payroll_id,
-                "oracle_employee_class": str(employee.get("className") or ""),
-                "job_code_num": jc_num,
-                "job_code": str(job.get("name") or job.get("jobCodeName") or card.get("jobCodeRef") or jc_num),
-                "rvc_num": _clean_identifier(card.get("rvcNum")),
-                "shift_num": _clean_identifier(card.get("shftNum")),
-                "shift_type": shift_type,
-                "shift_type_label": SHIFT_TYPE.get(shift_type, f"Unknown ({shift_type})"),
-                "clock_in_local": clock_in_local,
-                "clock_out_local": clock_out_local,
-                "clock_in_utc": pd.to_datetime(card.get("clkInUTC"), errors="coerce", utc=True),
-                "clock_out_utc": pd.to_datetime(card.get("clkOutUTC"), errors="coerce", utc=True),
-                "clock_in_status": clock_in_status,
-                "clock_in_status_label": CLOCK_IN_STATUS.get(clock_in_status, f"Unknown ({clock_in_status})"),
-                "clock_out_status": clock_out_status,
-                "clock_out_status_label": (
-                    "Still Clocked In"
-                    if clock_out_status is None and pd.isna(clock_out_local)
-                    else "Clock Out Status Missing"
-                    if clock_out_status is None
-                    else CLOCK_OUT_STATUS.get(clock_out_status, f"Unknown ({clock_out_status})")
-                ),
-                "regular_hours": _float(card.get("regHrs")),
-                "overtime_hours": sum(_float(card.get(f"ovt{i}Hrs")) for i in range(1, 5)),
-                "pay_rate": _float(card.get("payRt")) or None,
-                "premium_hours": _float(card.get("premHrs")),
-                "premium_pay": _float(card.get("premPay")),
-                "adjustment_count": len(adjustment_items),
-                "adjustments_field_present": "adjustments" in card,
-                "adjustments_request_verified": card.get("_adjustmentsRequested") is True,
-                "adjustments": adjustment_items,
-                "added_utc": pd.to_datetime(card.get("addedUTC"), errors="coerce", utc=True),
-                "last_updated_utc": pd.to_datetime(card.get("lastUpdatedUTC"), errors="coerce", utc=True),
-                "source_system": str(card.get("_sourceSystem") or "Oracle BI API"),
-                "source_file": str(card.get("_sourceFile") or ""),
-                "source_row": card.get("_sourceRow"),
-                "raw": card,
-            }
+        columns["location_ref"].append(loc_ref_clean)
+        columns["location_name"].append(location_name)
+        columns["location_timezone"].append(location_timezone)
+        columns["business_date"].append(business_dates[bus_dt])
+        columns["timecard_id"].append(_clean_identifier(card.get("tcId")))
+        columns["employee_num"].append(emp_num)
+        columns["job_code_num"].append(jc_num)
+        columns["job_code"].append(
+            str(job.get("name") or job.get("jobCodeName") or card.get("jobCodeRef") or jc_num)
         )
-
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return df
-    for column in (
-        "clock_in_local",
-        "clock_out_local",
-        "clock_in_utc",
-        "clock_out_utc",
-        "added_utc",
-        "last_updated_utc",
+        columns["rvc_num"].append(_clean_identifier(card.get("rvcNum")))
+        columns["shift_num"].append(_clean_identifier(card.get("shftNum")))
+        columns["shift_type"].append(shift_type)
+        columns["shift_type_label"].append(SHIFT_TYPE.get(shift_type, f"Unknown ({shift_type})"))
+        for card_field, values in timestamp_values.items():
+            values.append(card.get(card_field))
+        columns["clock_in_status"].append(clock_in_status)
+        columns["clock_in_status_label"].append(
+            CLOCK_IN_STATUS.get(clock_in_status, f"Unknown ({clock_in_status})")
+        )
+        columns["clock_out_status"].append(None if clock_out_raw is None else int(clock_out_raw or 0))
+        columns["regular_hours"].append(_float(card.get("regHrs")))
+        columns["overtime_hours"].append(sum(_float(card.get(f"ovt{i}Hrs")) for i in range(1, 5)))
+        columns["pay_rate"].append(_float(card.get("payRt")) or None)
+        columns["premium_hours"].append(_float(card.get("premHrs")))
+        columns["premium_pay"].append(_float(card.get("premPay")))
+        columns["adjustment_count"].append(len(adjustment_items))
+        columns["adjustments_field_present"].append("adjustments" in card)
+        columns["adjustments_request_verified"].append(card.get("_adjustmentsRequested") is True)
+        columns["adjustments"].append(adjustment_items)
+        columns["source_system"].append(str(card.get("_sourceSystem") or "Oracle BI API"))
+        columns["source_file"].append(str(card.get("_sourceFile") or ""))
+        columns["source_row"].append(card.get("_sourceRow"))
+        cards.append(card)
+
+    if not cards:
+        return pd.DataFrame()
+    matched, columns["employee_match_method"] = index.resolve(columns["employee_num"], card_ids)
+    for employee, emp_num, card, card_payroll, card_external in zip(
+        matched, columns["employee_num"], cards, card_ids["payrollID"], card_ids["extPayrollID"]
     ):
-        df[column] = pd.to_datetime(df[column], errors="coerce")
+        payroll_id = _clean_identifier(
+            card_payroll or card_external or employee.get("payrollId") or employee.get("externalPayrollID")
+        )
+        columns["employee_key"].append(payroll_id or (f"EMP::{emp_num}" if emp_num >= 0 else "UNKNOWN"))
+        columns["employee_name"].append(_employee_display_name(employee, card, emp_num))
+        columns["employee_name_resolved"].append(bool(employee))
+        columns["payroll_id"].append(payroll_id)
+        columns["oracle_employee_class"].append(str(employee.get("className") or ""))
+    parsed = {
+        column: _parse_timestamp_column(columns[column], utc=utc) for column, _, utc in TIMESTAMP_FIELDS
+    }
+    clock_out_missing = parsed["clock_out_local"].isna().tolist()
+    columns["clock_out_status_label"] = [
+        "Still Clocked In"
+        if status is None and missing
+        else "Clock Out Status Missing"
+        if status is None
+        else CLOCK_OUT_STATUS.get(status, f"Unknown ({status})")
+        for status, missing in zip(columns["clock_out_status"], clock_out_missing)
+    ]
+    df = categorize_columns(pd.DataFrame({name: parsed.get(name, values) for name, values in columns.items()}))
     return df.sort_values(
         ["location_ref", "employee_key", "business_date", "clock_in_local", "timecard_id"],
         na_position="last",
     ).reset_index(drop=True)
 
 
+class RawCardStore(Mapping[tuple[str, str], Mapping[str, Any]]):
+    """Original Oracle timecards by (locRef, tcId), kept beside the normalized frame.
+
+    The store references the fetched payloads instead of copying them into a
+    ``raw`` column of every frame, and builds its index on the first lookup.
+    Cards come back as read-only ``TimecardView`` objects; when a timecard ID
+    repeats within a location the first occurrence wins.
+    """
+
+    def __init__(self, payloads: Iterable[dict[str, Any]]) -> None:
+        self._payloads = tuple(payload for payload in payloads if isinstance(payload, dict))
+        self._index: dict[tuple[str, str], Mapping[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def _cards(self) -> dict[tuple[str, str], Mapping[str, Any]]:
+        with self._lock:
+            if self._index is None:
+                index: dict[tuple[str, str], Mapping[str, Any]] = {}
+                for loc_ref, _, card in iter_timecards(self._payloads):
+                    if not isinstance(card, TimecardView):
+                        # Payloads without request metadata (e.g. Excel) yield plain dicts.
+                        card = TimecardView(card, {})
+                    index.setdefault((_clean_identifier(loc_ref), _clean_identifier(card.get("tcId"))), card)
+                self._index = index
+            return self._index
+
+    def __getitem__(self, key: tuple[str, str]) -> Mapping[str, Any]:
+        loc_ref, timecard_id = key
+        return self._cards()[(_clean_identifier(loc_ref), _clean_identifier(timecard_id))]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self._cards())
+
+    def __len__(self) -> int:
+        return len(self._cards())
+
+    def for_row(self, row: Mapping[str, Any]) -> Mapping[str, Any] | None:
+        """The card behind a normalized or split row, if it is in the store."""
+        timecard_id = row.get("source_timecard_id")
+        if timecard_id is None or (isinstance(timecard_id, float) and pd.isna(timecard_id)):
+            timecard_id = row.get("timecard_id")
+        return self.get((str(row.get("location_ref") or ""), timecard_id))
+
+
 def _parse_bool(value: Any) -> bool:
     return str(value).strip().casefold() in {"1", "true", "yes", "y", "si", "sí", "x"}
 
@@ -487,55 +754,137 @@ def _active_workday_config(
     return max(active, key=lambda record: record.effective_date or date.min)
 
 
-def _legal_workday_date(moment: pd.Timestamp, workday_start: time) -> date:
-    boundary = pd.Timestamp(datetime.combine(moment.date(), workday_start))
-    return (moment - pd.Timedelta(days=1)).date() if moment < boundary else moment.date()
+_NAT = np.iinfo(np.int64).min
+_NS_PER_DAY = 86_400 * 1_000_000_000
+_EPOCH = date(1970, 1, 1)
+
+
+def _time_ns(value: time) -> int:
+    seconds = (value.hour * 60 + value.minute) * 60 + value.second
+    return seconds * 1_000_000_000 + value.microsecond * 1_000
 
 
-def _next_boundary(moment: pd.Timestamp, workday_start: time) -> pd.Timestamp:
-    current_date = _legal_workday_date(moment, workday_start)
-    return pd.Timestamp(datetime.combine(current_date + timedelta(days=1), workday_start))
+def _timestamp_ns(values: pd.Series | None, count: int, *, utc: bool) -> np.ndarray:
+    """Parse a timestamp column to int64 nanoseconds, ``_NAT`` where missing."""
+    if values is None:
+        return np.full(count, _NAT, dtype=np.int64)
+    if values.dtype.kind == "M":
+        parsed = pd.to_datetime(values, utc=True) if utc else values
+    else:
+        parsed = _parse_timestamp_column(values.tolist(), utc=utc)
+    return pd.DatetimeIndex(parsed).as_unit("ns").asi8
+
+
+def _seconds(delta_ns: np.ndarray) -> np.ndarray:
+    # Timedelta.total_seconds() drops nanoseconds; match it.
+    return (delta_ns // 1_000) / 1e6
+
+
+def _map_distinct(values: pd.Series, function: Any) -> np.ndarray:
+    """Apply ``function`` once per distinct value of ``values``."""
+    codes, uniques = pd.factorize(values)
+    mapped = np.array([function(value) for value in uniques] + [None], dtype=object)[codes]
+    for position in np.flatnonzero(codes < 0):
+        mapped[position] = function(values.iloc[position])
+    return mapped
 
 
 def _local_to_utc(
-    moment: pd.Timestamp,
-    timezone_name: str,
-    *,
-    range_start: pd.Timestamp | None = None,
-    range_end: pd.Timestamp | None = None,
-) -> pd.Timestamp:
-    """Convert a naive store-local timestamp to UTC, handling DST folds/gaps.
+    moments: np.ndarray, timezones: np.ndarray, range_start: np.ndarray, range_end: np.ndarray
+) -> np.ndarray:
+    """Convert naive store-local nanoseconds to UTC, handling DST folds/gaps.
 
     For an ambiguous fall-back time, choose the candidate that falls inside the
     original Oracle UTC interval when available. For a nonexistent spring-forward
-    time, pandas shifts to the first valid local instant.
+    time, pandas shifts to the first valid local instant. Each timezone is
+    localized in one pass; unknown zones give ``_NAT``.
     """
-    if pd.isna(moment):
-        return pd.NaT
-    value = pd.Timestamp(moment)
-    if value.tzinfo is not None:
-        return value.tz_convert("UTC")
-    candidates: list[pd.Timestamp] = []
-    for ambiguous in (True, False):
+    result = np.full(len(moments), _NAT, dtype=np.int64)
+    codes, names = pd.factorize(timezones)
+    for code, timezone_name in enumerate(names):
+        rows = np.flatnonzero((codes == code) & (moments != _NAT))
+        if not len(rows):
+            continue
+        local = pd.DatetimeIndex(moments[rows].view("datetime64[ns]"))
         try:
-            candidate = value.tz_localize(
-                timezone_name, ambiguous=ambiguous, nonexistent="shift_forward"
-            ).tz_convert("UTC")
+            candidates = [
+                local.tz_localize(
+                    timezone_name, ambiguous=np.full(len(rows), ambiguous), nonexistent="shift_forward"
+                ).asi8
+                for ambiguous in (True, False)
+            ]
         except (TypeError, ValueError, ZoneInfoNotFoundError):
             continue
-        if candidate not in candidates:
-            candidates.append(candidate)
-    if not candidates:
-        return pd.NaT
-    start_utc = pd.to_datetime(range_start, errors="coerce", utc=True)
-    end_utc = pd.to_datetime(range_end, errors="coerce", utc=True)
-    in_range = [
-        candidate
-        for candidate in candidates
-        if (pd.isna(start_utc) or candidate >= start_utc)
-        and (pd.isna(end_utc) or candidate <= end_utc)
-    ]
-    return (in_range or candidates)[0]
+        start_utc, end_utc = range_start[rows], range_end[rows]
+        in_range = [
+            ((start_utc == _NAT) | (candidate >= start_utc)) & ((end_utc == _NAT) | (candidate <= end_utc))
+            for candidate in candidates
+        ]
+        dst, standard = candidates
+        result[rows] = np.where(in_range[0] | ~in_range[1], dst, standard)
+    return result
+
+
+def _overlay(base: pd.Series, mask: np.ndarray, values: Any) -> pd.Series:
+    """``base`` with ``values`` written where ``mask`` holds."""
+    numeric = np.asarray(values).dtype.kind in "iuf"
+    if numeric and isinstance(base.dtype, np.dtype) and base.dtype.kind in "iuf":
+        result = base.to_numpy(dtype=np.result_type(base.dtype, np.asarray(values).dtype), copy=True)
+        result[mask] = values
+        return pd.Series(result)
+    result = base.to_numpy(dtype=object, copy=True)
+    result[mask] = values
+    return pd.Series(result).infer_objects()
+
+
+def _calendar_dates(days: np.ndarray) -> np.ndarray:
+    distinct, inverse = np.unique(days, return_inverse=True)
+    return np.array([_EPOCH + timedelta(days=int(day)) for day in distinct], dtype=object)[inverse.ravel()]
+
+
+# Columns each kind of output row adds, in the order the row-wise splitter
+# created them; a frame built from those rows ordered new columns this way.
+_UNTIMED_COLUMNS = (
+    "legal_workday_date",
+    "workday_start",
+    "workday_timezone",
+    "workday_config_verified",
+    "business_date_match",
+    "segment_index",
+    "segment_count",
+    "is_primary_segment",
+    "source_timecard_id",
+    "calculation_clock_in",
+    "calculation_clock_out",
+    "utc_duration_adjustment_minutes",
+)
+_SEGMENT_COLUMNS = (
+    "original_clock_in_local",
+    "original_clock_out_local",
+    "clock_in_local",
+    "clock_out_local",
+    "calculation_clock_in",
+    "calculation_clock_out",
+    "utc_duration_adjustment_minutes",
+    "legal_workday_date",
+    "workday_start",
+    "workday_timezone",
+    "workday_config_verified",
+    "business_date_match",
+    "segment_index",
+    "segment_count",
+    "is_primary_segment",
+    "source_timecard_id",
+)
+_SPLIT_COLUMNS = _SEGMENT_COLUMNS + (
+    "timecard_id",
+    "regular_hours",
+    "overtime_hours",
+    "premium_hours",
+    "premium_pay",
+    "adjustment_count",
+    "adjustments",
+)
 
 
 def assign_legal_workdays(
@@ -550,119 +899,188 @@ def assign_legal_workdays(
     Rows crossing a workday boundary are split proportionally. The original Oracle
     timecard identifier is retained and only the first segment carries adjustments,
     preventing duplicate adjustment audit rows.
+
+    Boundaries are computed for all rows at once on nanosecond arrays; only rows
+    that cross one are repeated, and segment times, UTC conversions and prorated
+    hours are filled in column by column.
     """
     if timecards.empty:
         return timecards.copy()
     configs = workday_configs or {}
     default_start = _parse_time(default_workday_start)
-    output: list[dict[str, Any]] = []
-
-    for _, source in timecards.iterrows():
-        row = source.to_dict()
-        start = pd.to_datetime(row.get("clock_in_local"), errors="coerce")
-        end = pd.to_datetime(row.get("clock_out_local"), errors="coerce")
-        original_start_utc = pd.to_datetime(row.get("clock_in_utc"), errors="coerce", utc=True)
-        original_end_utc = pd.to_datetime(row.get("clock_out_utc"), errors="coerce", utc=True)
-        loc_ref = _clean_identifier(row.get("location_ref"))
-        reference_date = start.date() if pd.notna(start) else row.get("business_date")
+    frame = timecards.reset_index(drop=True)
+    count = len(frame)
+
+    def column(name: str) -> pd.Series:
+        return frame[name] if name in frame.columns else pd.Series([None] * count, dtype=object)
+
+    start = _timestamp_ns(frame.get("clock_in_local"), count, utc=False)
+    end = _timestamp_ns(frame.get("clock_out_local"), count, utc=False)
+    start_utc = _timestamp_ns(frame.get("clock_in_utc"), count, utc=True)
+    end_utc = _timestamp_ns(frame.get("clock_out_utc"), count, utc=True)
+    timed = start != _NAT
+    business_dates = column("business_date").to_numpy(dtype=object)
+
+    # Workday settings are resolved once per (location, reference date): the
+    # clock-in date, or the business date for rows without a clock-in.
+    loc_refs = _map_distinct(column("location_ref"), _clean_identifier)
+    settings: list[WorkdayConfigRecord | None] = []
+    setting_ids = np.empty(count, dtype=np.int64)
+    timed_rows = np.flatnonzero(timed)
+    if len(timed_rows):
+        loc_codes, _ = pd.factorize(loc_refs[timed_rows])
+        days = start[timed_rows] // _NS_PER_DAY
+        keys = loc_codes * (days.max() - days.min() + 1) + (days - days.min())
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        for row in timed_rows[first]:
+            reference_date = _EPOCH + timedelta(days=int(start[row] // _NS_PER_DAY))
+            settings.append(_active_workday_config(configs, loc_refs[row], reference_date))
+        setting_ids[timed_rows] = inverse.ravel()
+    for row in np.flatnonzero(~timed):
+        reference_date = business_dates[row]
         if not isinstance(reference_date, date):
             reference_date = date.today()
-        config = _active_workday_config(configs, loc_ref, reference_date)
-        workday_start = config.workday_start if config else default_start
-        timezone = config.timezone if config else (str(row.get("location_timezone") or "") or default_timezone)
-        verified = config is not None and config.is_verified
-
-        if pd.isna(start):
-            segment = dict(row)
-            segment.update(
-                {
-                    "legal_workday_date": row.get("business_date"),
-                    "workday_start": workday_start.strftime("%H:%M"),
-                    "workday_timezone": timezone,
-                    "workday_config_verified": verified,
-                    "business_date_match": False,
-                    "segment_index": 1,
-                    "segment_count": 1,
-                    "is_primary_segment": True,
-                    "source_timecard_id": row.get("timecard_id"),
-                    "calculation_clock_in": pd.NaT,
-                    "calculation_clock_out": pd.NaT,
-                    "utc_duration_adjustment_minutes": 0.0,
-                }
-            )
-            output.append(segment)
-            continue
+        setting_ids[row] = len(settings)
+        settings.append(_active_workday_config(configs, loc_refs[row], reference_date))
+    workday_starts = [config.workday_start if config else default_start for config in settings]
+    workday_ns = np.array([_time_ns(value) for value in workday_starts], dtype=np.int64)[setting_ids]
+    configured = np.array([config is not None for config in settings], dtype=bool)[setting_ids]
+    timezones = np.where(
+        configured,
+        np.array([config.timezone if config else None for config in settings], dtype=object)[setting_ids],
+        _map_distinct(column("location_timezone"), lambda value: str(value or "") or default_timezone),
+    )
 
-        if pd.isna(end) or end <= start:
-            windows = [(start, end)]
-        else:
-            windows: list[tuple[pd.Timestamp, pd.Timestamp]] = []
-            cursor = start
-            while cursor < end:
-                boundary = _next_boundary(cursor, workday_start)
-                segment_end = min(end, boundary)
-                windows.append((cursor, segment_end))
-                if segment_end >= end:
-                    break
-                cursor = segment_end
-
-        total_seconds = max(0.0, (end - start).total_seconds()) if pd.notna(end) else 0.0
-        for index, (segment_start, segment_end) in enumerate(windows, start=1):
-            segment = dict(row)
-            segment["original_clock_in_local"] = start
-            segment["original_clock_out_local"] = end
-            segment["clock_in_local"] = segment_start
-            segment["clock_out_local"] = segment_end
-            if segment_start == start and pd.notna(original_start_utc):
-                calculation_start = original_start_utc
+    # Legal date of a moment: the calendar day of (moment - workday start).
+    # A row is split at each boundary strictly before its clock-out.
+    legal_start = np.where(timed, (start - workday_ns) // _NS_PER_DAY, 0)
+    splittable = timed & (end != _NAT) & (end > start)
+    overshoot = np.where(splittable, end - ((legal_start + 1) * _NS_PER_DAY + workday_ns), 0)
+    counts = np.where(overshoot > 0, (overshoot - 1) // _NS_PER_DAY + 2, 1)
+    positions = np.repeat(np.arange(count), counts)
+    segment_index = np.arange(len(positions)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+    segment_count = counts[positions]
+    first_segment = segment_index == 1
+    last_segment = segment_index == segment_count
+    segment_timed = timed[positions]
+    segment_workday = workday_ns[positions]
+    legal_day = legal_start[positions] + segment_index - 1
+    segment_start = np.where(first_segment, start[positions], legal_day * _NS_PER_DAY + segment_workday)
+    segment_end = np.where(last_segment, end[positions], (legal_day + 1) * _NS_PER_DAY + segment_workday)
+    segment_closed = segment_timed & (segment_end != _NAT)
+
+    # Segments that start or end where the card does keep Oracle's UTC stamp;
+    # inner boundaries are localized in the location's timezone.
+    row_start_utc, row_end_utc = start_utc[positions], end_utc[positions]
+    segment_timezones = timezones[positions]
+    calculation_in = np.full(len(positions), _NAT, dtype=np.int64)
+    calculation_out = np.full(len(positions), _NAT, dtype=np.int64)
+    for calculation, moments, original, present, edge in (
+        (calculation_in, segment_start, row_start_utc, segment_timed, first_segment),
+        (calculation_out, segment_end, row_end_utc, segment_closed, last_segment),
+    ):
+        keep = present & edge & (original != _NAT)
+        calculation[keep] = original[keep]
+        convert = present & ~keep
+        calculation[convert] = _local_to_utc(
+            moments[convert], segment_timezones[convert], row_start_utc[convert], row_end_utc[convert]
+        )
+
+    segment_seconds = np.where(segment_closed, np.maximum(_seconds(segment_end - segment_start), 0.0), 0.0)
+    local_minutes = segment_seconds / 60.0
+    converted = segment_timed & (calculation_in != _NAT) & (calculation_out != _NAT)
+    actual_minutes = np.where(
+        converted, np.maximum(_seconds(calculation_out - calculation_in) / 60.0, 0.0), local_minutes
+    )
+    adjustment = np.where(segment_timed, actual_minutes - local_minutes, 0.0)
+    adjusted = np.flatnonzero(adjustment != 0)
+    adjustment[adjusted] = [round(value, 2) for value in adjustment[adjusted]]
+
+    total_seconds = np.where(timed & (end != _NAT), np.maximum(_seconds(end - start), 0.0), 0.0)[positions]
+    ratio = np.divide(
+        segment_seconds, total_seconds, out=np.where(first_segment, 1.0, 0.0), where=total_seconds > 0
+    )
+
+    legal_dates = business_dates[positions]
+    legal_dates[segment_timed] = _calendar_dates(legal_day[segment_timed])
+    start_labels = np.array([value.strftime("%H:%M") for value in workday_starts], dtype=object)
+
+    result = frame.take(positions).reset_index(drop=True)
+    result["legal_workday_date"] = legal_dates
+    result["workday_start"] = start_labels[setting_ids][positions]
+    result["workday_timezone"] = segment_timezones
+    result["workday_config_verified"] = np.array(
+        [config is not None and config.is_verified for config in settings], dtype=bool
+    )[setting_ids][positions]
+    result["business_date_match"] = segment_timed & np.asarray(legal_dates == business_dates[positions], dtype=bool)
+    result["segment_index"] = segment_index
+    result["segment_count"] = segment_count
+    result["is_primary_segment"] = first_segment
+    result["source_timecard_id"] = column("timecard_id").take(positions).to_numpy()
+    result["calculation_clock_in"] = pd.DatetimeIndex(calculation_in.view("datetime64[ns]")).tz_localize("UTC")
+    result["calculation_clock_out"] = pd.DatetimeIndex(calculation_out.view("datetime64[ns]")).tz_localize("UTC")
+    result["utc_duration_adjustment_minutes"] = adjustment
+
+    if segment_timed.any():
+        result["original_clock_in_local"] = start[positions].view("datetime64[ns]")
+        result["original_clock_out_local"] = np.where(segment_timed, end[positions], _NAT).view("datetime64[ns]")
+        for name, values in (("clock_in_local", segment_start), ("clock_out_local", segment_end)):
+            stamps = values.view("datetime64[ns]")
+            base = result.get(name)
+            if base is None or (base.dtype.kind == "M" and getattr(base.dtype, "tz", None) is None):
+                # Untimed rows already hold the parsed original value.
+                result[name] = stamps
             else:
-                calculation_start = _local_to_utc(
-                    segment_start, timezone, range_start=original_start_utc, range_end=original_end_utc
-                )
-            if pd.isna(segment_end):
-                calculation_end = pd.NaT
-            elif segment_end == end and pd.notna(original_end_utc):
-                calculation_end = original_end_utc
+                result[name] = _overlay(base, segment_timed, pd.DatetimeIndex(stamps[segment_timed]).astype(object))
+        for name in ("regular_hours", "overtime_hours"):
+            if name in frame.columns and isinstance(frame[name].dtype, np.dtype) and frame[name].dtype.kind in "biuf":
+                hours = frame[name].to_numpy(dtype=float)
             else:
-                calculation_end = _local_to_utc(
-                    segment_end, timezone, range_start=original_start_utc, range_end=original_end_utc
-                )
-            segment["calculation_clock_in"] = calculation_start
-            segment["calculation_clock_out"] = calculation_end
-            local_minutes = (
-                max(0.0, (segment_end - segment_start).total_seconds() / 60.0)
-                if pd.notna(segment_end) else 0.0
-            )
-            actual_minutes = (
-                max(0.0, (calculation_end - calculation_start).total_seconds() / 60.0)
-                if pd.notna(calculation_start) and pd.notna(calculation_end) else local_minutes
-            )
-            segment["utc_duration_adjustment_minutes"] = round(actual_minutes - local_minutes, 2)
-            segment["legal_workday_date"] = _legal_workday_date(segment_start, workday_start)
-            segment["workday_start"] = workday_start.strftime("%H:%M")
-            segment["workday_timezone"] = timezone
-            segment["workday_config_verified"] = verified
-            segment["business_date_match"] = segment["legal_workday_date"] == row.get("business_date")
-            segment["segment_index"] = index
-            segment["segment_count"] = len(windows)
-            segment["is_primary_segment"] = index == 1
-            segment["source_timecard_id"] = row.get("timecard_id")
-            if len(windows) > 1:
-                segment["timecard_id"] = f"{row.get('timecard_id')}::SEG{index}"
-            segment_seconds = (
-                max(0.0, (segment_end - segment_start).total_seconds()) if pd.notna(segment_end) else 0.0
-            )
-            ratio = (segment_seconds / total_seconds) if total_seconds > 0 else (1.0 if index == 1 else 0.0)
-            for field in ("regular_hours", "overtime_hours"):
-                segment[field] = _float(row.get(field)) * ratio
-            if index > 1:
-                segment["premium_hours"] = 0.0
-                segment["premium_pay"] = 0.0
-                segment["adjustment_count"] = 0
-                segment["adjustments"] = []
-            output.append(segment)
-
-    result = pd.DataFrame(output)
+                hours = np.array([_float(value) for value in column(name)], dtype=float)
+            base = result[name] if name in result.columns else pd.Series(np.nan, index=result.index)
+            result[name] = _overlay(base, segment_timed, hours[positions][segment_timed] * ratio[segment_timed])
+
+    split = segment_count > 1
+    if split.any():
+        base = result["timecard_id"] if "timecard_id" in result.columns else pd.Series(np.nan, index=result.index)
+        labels = [
+            f"{timecard_id}::SEG{index}"
+            for timecard_id, index in zip(result["source_timecard_id"][split], segment_index[split])
+        ]
+        result["timecard_id"] = _overlay(base, split, np.array(labels, dtype=object))
+    secondary = ~first_segment
+    if secondary.any():
+        for name, value in (("premium_hours", 0.0), ("premium_pay", 0.0), ("adjustment_count", 0)):
+            base = result[name] if name in result.columns else pd.Series(np.nan, index=result.index)
+            result[name] = _overlay(base, secondary, value)
+        adjustments = (
+            result["adjustments"].to_numpy(dtype=object, copy=True)
+            if "adjustments" in result.columns
+            else np.full(len(result), np.nan, dtype=object)
+        )
+        for row in np.flatnonzero(secondary):
+            adjustments[row] = []
+        result["adjustments"] = pd.Series(adjustments).infer_objects()
+
+    # Keep the column order a frame built from one dict per segment had.
+    first_rows = [
+        (np.flatnonzero(mask)[0], columns)
+        for mask, columns in (
+            (~timed, _UNTIMED_COLUMNS),
+            (timed & (counts == 1), _SEGMENT_COLUMNS + ("regular_hours", "overtime_hours")),
+            (counts > 1, _SPLIT_COLUMNS),
+        )
+        if mask.any()
+    ]
+    order = dict.fromkeys(frame.columns)
+    for _, columns in sorted(first_rows, key=lambda item: item[0]):
+        order.update(dict.fromkeys(columns))
+    result = result[list(order)]
+    for name in result.columns:
+        # Timezone-aware columns holding only NaT were naive in the row-wise frame.
+        if getattr(result[name].dtype, "tz", None) is not None and result[name].isna().all():
+            result[name] = result[name].dt.tz_localize(None)
+    result = categorize_columns(result)
     return result.sort_values(
         ["employee_key", "legal_workday_date", "clock_in_local", "location_ref", "timecard_id"],
         na_position="last",
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Any, Iterable
+from typing import Any, Iterable, Mapping
 
 import pandas as pd
 
@@ -64,7 +64,11 @@ def build_source_coverage(
     expected_locations: Iterable[str] | None = None,
     start_date: date | None = None,
     end_date: date | None = None,
+    failed_units: Mapping[tuple[str, date], str] | None = None,
 ) -> pd.DataFrame:
+    # failed_units maps units the API client could not fetch to a short reason
+    # that replaces the generic "Missing" source label on those rows.
+    failed_units = {(str(loc), day): str(reason) for (loc, day), reason in (failed_units or {}).items()}
     rows: list[dict[str, Any]] = []
     seen: set[tuple[str, date]] = set()
     for payload in payloads:
@@ -116,7 +120,7 @@ def build_source_coverage(
                             "Response Present": False,
                             "Timecards Returned": 0,
                             "Oracle Cursor UTC": "",
-                            "Source": "Missing",
+                            "Source": failed_units.get(key, "Missing"),
                         }
                     )
             current += timedelta(days=1)
@@ -160,14 +164,14 @@ def reconcile_control_totals(timecards: pd.DataFrame, controls: pd.DataFrame) ->
         ).dt.total_seconds().div(3600)
     source["worked_clock_hours"] = source["worked_clock_hours"].clip(lower=0).fillna(0)
 
-    grouped = source.groupby(["location_ref", "business_date"], dropna=False).agg(
+    grouped = source.groupby(["location_ref", "business_date"], dropna=False, observed=True).agg(
         timecards=("source_timecard_id" if "source_timecard_id" in source.columns else "timecard_id", "nunique"),
         employees=("employee_key", "nunique"),
         worked_hours=("worked_clock_hours", "sum"),
     )
     if "adjustment_count" in primary.columns:
         adjusted = primary.assign(_adjusted=pd.to_numeric(primary["adjustment_count"], errors="coerce").fillna(0) > 0)
-        adjusted = adjusted.groupby(["location_ref", "business_date"])["_adjusted"].sum()
+        adjusted = adjusted.groupby(["location_ref", "business_date"], observed=True)["_adjusted"].sum()
         grouped["adjusted_timecards"] = adjusted
     else:
         grouped["adjusted_timecards"] = 0
@@ -390,7 +394,7 @@ def build_data_quality_report(
             _fingerprint=primary[["clock_in_local", "clock_out_local", "employee_key", "shift_type"]]
             .astype(str)
             .agg("|".join, axis=1)
-        ).groupby(["location_ref", id_column])["_fingerprint"].nunique()
+        ).groupby(["location_ref", id_column], observed=True)["_fingerprint"].nunique()
         conflicts = fingerprints[fingerprints > 1]
         for (loc_ref, timecard_id), count in conflicts.items():
             issues.append(
@@ -405,7 +409,7 @@ def build_data_quality_report(
             )
 
         if {"employee_key", "legal_workday_date", "location_ref"}.issubset(timecards.columns):
-            multi = timecards.groupby(["employee_key", "legal_workday_date"])["location_ref"].nunique()
+            multi = timecards.groupby(["employee_key", "legal_workday_date"], observed=True)["location_ref"].nunique()
             for (employee_key, workday_date), count in multi[multi > 1].items():
                 sample = timecards[(timecards["employee_key"] == employee_key) & (timecards["legal_workday_date"] == workday_date)].iloc[0]
                 issues.append(
@@ -422,12 +426,17 @@ def build_data_quality_report(
     if not coverage.empty:
         missing_coverage = coverage[~coverage["Response Present"].fillna(False)]
         for _, row in missing_coverage.iterrows():
+            reason = str(row.get("Source") or "Missing")
             issues.append(
                 _issue(
                     severity="Critical",
                     blocking=True,
                     code="SOURCE_COVERAGE_INCOMPLETE",
-                    detail="No Oracle response was captured for this requested location/date.",
+                    detail=(
+                        "No Oracle response was captured for this requested location/date."
+                        if reason == "Missing"
+                        else f"No Oracle response was captured for this requested location/date ({reason})."
+                    ),
                     action="Re-run the API request before using period totals.",
                     row={"location_ref": row.get("Location Ref"), "business_date": row.get("Business Date")},
                 )
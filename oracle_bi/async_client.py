@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import date
+from typing import Any, Iterable
+
+try:
+    import httpx
+except ModuleNotFoundError as exc:  # pragma: no cover - optional async stack
+    raise RuntimeError(
+        "AsyncOracleBIClient requires httpx. Install the packages in requirements.txt."
+    ) from exc
+
+from oracle_bi.client import (
+    TOKEN_BROKER,
+    OracleBIConfig,
+    OracleBIError,
+    TokenBundle,
+    _OracleBIClientBase,
+    config_fingerprint,
+)
+
+
+class AsyncOracleBIClient(_OracleBIClientBase):
+    """Asyncio Oracle MICROS Business Intelligence API client (experimental).
+
+    Mirrors ``OracleBIClient``: the same PKCE authentication, refresh and ``post``
+    semantics, with tokens held in process memory only. Tokens come from the
+    tenant's ``TOKEN_BROKER`` slot and requests draw from the tenant's shared
+    rate limiter, so this client and synchronous clients of the same config
+    authenticate once and throttle together. At most ``config.max_workers`` API
+    requests are in flight at once.
+
+    The dashboard does not use this client. It has no request coalescing, disk
+    or empty-day cache, circuit breaker or latency history.
+    """
+
+    def __init__(self, config: OracleBIConfig, *, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        super().__init__(config)
+        self.session = httpx.AsyncClient(
+            headers={
+                "Accept": "application/json",
+                "User-Agent": "MealComplianceDashboard/3.3",
+            },
+            timeout=config.timeout_seconds,
+            verify=config.verify_ssl,
+            limits=httpx.Limits(max_connections=max(1, int(config.max_workers))),
+            transport=transport,
+        )
+        self._token_slot = TOKEN_BROKER.slot(config_fingerprint(config))
+        self._auth_lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(max(1, int(config.max_workers)))
+
+    async def __aenter__(self) -> "AsyncOracleBIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
+
+    async def authenticate(
+        self, *, force_full: bool = False, rejected: TokenBundle | None = None
+    ) -> TokenBundle:
+        """Return valid tokens, renewing them under the tenant's broker slot lock.
+
+        Follows ``OracleBIClient.authenticate``. Coroutines of this client queue
+        on an asyncio lock; the slot lock shared with other clients is taken in
+        a worker thread so the event loop keeps running while it waits.
+        """
+        current = self.tokens
+        if not force_full and current and current.is_valid():
+            return current
+
+        async with self._auth_lock:
+            await self._acquire_slot_lock()
+            try:
+                current = self.tokens
+                if current is not None and current.is_valid():
+                    if not force_full:
+                        return current
+                    if rejected is not None and current is not rejected:
+                        return current
+
+                if not force_full and current and current.refresh_token:
+                    try:
+                        return await self._refresh_tokens(current.refresh_token)
+                    except OracleBIError:
+                        # A missed refresh window or post-upgrade invalidation requires PKCE again.
+                        self.tokens = None
+
+                return await self._full_pkce_authentication()
+            finally:
+                self._token_slot.lock.release()
+
+    async def _acquire_slot_lock(self) -> None:
+        lock = self._token_slot.lock
+        if lock.acquire(blocking=False):
+            return
+        acquiring = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The worker thread still takes the lock; give it back once it does.
+            acquiring.add_done_callback(lambda _: lock.release())
+            raise
+
+    async def _full_pkce_authentication(self) -> TokenBundle:
+        verifier, challenge = self._new_pkce_pair()
+        response = await self.session.get(self.authorize_url, params=self._authorize_params(challenge))
+        self._check_authorize_response(response)
+
+        response = await self.session.post(
+            self.signin_url,
+            data=self._signin_data(),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        auth_code = self._authorization_code(response)
+
+        response = await self.session.post(
+            self.token_url,
+            data=self._authorization_code_grant(verifier, auth_code),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        return self._consume_token_response(response)
+
+    async def _refresh_tokens(self, refresh_token: str) -> TokenBundle:
+        response = await self.session.post(
+            self.token_url,
+            data=self._refresh_token_grant(refresh_token),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        return self._consume_token_response(response)
+
+    async def post(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
+        attempt = 0
+        reauthenticated = False
+        while True:
+            tokens = await self.authenticate()
+            wait = self.rate_limiter.bucket(endpoint).reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                async with self._in_flight:
+                    started = time.perf_counter()
+                    response = await self.session.post(
+                        self._api_url(endpoint), json=payload, headers=self._bearer_headers(tokens)
+                    )
+            except httpx.TransportError as error:
+                self.metrics.record_attempt(
+                    endpoint,
+                    latency_seconds=time.perf_counter() - started,
+                    status=type(error).__name__,
+                    error=True,
+                )
+                delay = self._transport_retry_delay(endpoint, attempt, error)
+                self.metrics.record_retry(endpoint)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self._record_response(endpoint, started, response)
+
+            if response.status_code == 401 and not reauthenticated:
+                self.metrics.record_retry(endpoint)
+                await self.authenticate(force_full=True, rejected=tokens)
+                reauthenticated = True
+                continue
+
+            delay = self._retry_delay(endpoint, attempt, response)
+            if delay is None:
+                return self._api_result(endpoint, response)
+            self.metrics.record_retry(endpoint)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get_locations(self) -> dict[str, Any]:
+        return await self.post("getLocationDimensions", self._location_payload())
+
+    async def get_employees(self, loc_ref: str) -> dict[str, Any]:
+        return await self.post("getEmployeeDimensions", self._location_payload(loc_ref))
+
+    async def get_job_codes(self, loc_ref: str) -> dict[str, Any]:
+        return await self.post("getJobCodeDimensions", self._location_payload(loc_ref))
+
+    async def get_latest_business_date(self, loc_ref: str) -> dict[str, Any]:
+        return await self.post("getLatestBusDt", self._location_payload(loc_ref))
+
+    async def get_timecards(
+        self,
+        loc_ref: str,
+        business_date: date,
+        *,
+        include_adjustments: bool = True,
+        changed_since_utc: str | None = None,
+        emp_num: int | None = None,
+        ext_payroll_id: str | None = None,
+    ) -> dict[str, Any]:
+        payload = self._timecard_payload(
+            loc_ref,
+            business_date,
+            include_adjustments=include_adjustments,
+            changed_since_utc=changed_since_utc,
+            emp_num=emp_num,
+            ext_payroll_id=ext_payroll_id,
+        )
+        data = await self.post("getTimeCardDetails", payload)
+        return self._annotate_timecards(data, loc_ref, business_date, include_adjustments)
+
+    async def get_timecards_many(
+        self,
+        units: Iterable[tuple[str, date]],
+        *,
+        include_adjustments: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Fetch many (locRef, busDt) units concurrently, preserving unit order."""
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get_timecards(loc_ref, business_date, include_adjustments=include_adjustments)
+                    for loc_ref, business_date in units
+                )
+            )
+        )
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable
+
+
+class TimecardCache:
+    """Size-bounded on-disk cache of ``getTimeCardDetails`` payloads.
+
+    Entries are keyed by (org identifier, locRef, busDt, includeAdjustments) and
+    stored as one JSON file each. The least recently used files are evicted once
+    the directory exceeds ``max_bytes``; entries older than ``max_age_seconds``
+    are treated as stale and refetched. Only payloads are stored — never tokens.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_age_seconds: float = 7 * 24 * 3600,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self.max_age_seconds = float(max_age_seconds)
+        self._lock = threading.Lock()
+        self._index: dict[Path, tuple[int, float]] | None = None
+
+    @staticmethod
+    def key(org_identifier: str, loc_ref: str, business_date: date, include_adjustments: bool) -> str:
+        return "|".join(
+            [str(org_identifier), str(loc_ref), business_date.isoformat(), "1" if include_adjustments else "0"]
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (hashlib.sha256(key.encode("utf-8")).hexdigest()[:40] + ".json")
+
+    def _load_index(self) -> dict[Path, tuple[int, float]]:
+        if self._index is None:
+            self._index = {}
+            if self.directory.exists():
+                for path in self.directory.glob("*.json"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    self._index[path] = (stat.st_size, stat.st_mtime)
+        return self._index
+
+    def get(
+        self, org_identifier: str, loc_ref: str, business_date: date, *, include_adjustments: bool
+    ) -> dict[str, Any] | None:
+        key = self.key(org_identifier, loc_ref, business_date, include_adjustments)
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key or not isinstance(entry.get("payload"), dict):
+            return None
+        if time.time() - float(entry.get("stored_at") or 0) > self.max_age_seconds:
+            self.discard(org_identifier, loc_ref, business_date, include_adjustments=include_adjustments)
+            return None
+        with self._lock:
+            index = self._load_index()
+            if path in index:
+                # Reads refresh recency so eviction stays least-recently-used.
+                now = time.time()
+                os.utime(path, (now, now))
+                index[path] = (index[path][0], now)
+        return entry["payload"]
+
+    def put(
+        self,
+        org_identifier: str,
+        loc_ref: str,
+        business_date: date,
+        payload: dict[str, Any],
+        *,
+        include_adjustments: bool,
+    ) -> None:
+        key = self.key(org_identifier, loc_ref, business_date, include_adjustments)
+        path = self._path(key)
+        body = json.dumps({"key": key, "stored_at": time.time(), "payload": payload}, separators=(",", ":"))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        handle, temp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as fh:
+            fh.write(body)
+        os.replace(temp_name, path)
+        with self._lock:
+            index = self._load_index()
+            index[path] = (len(body.encode("utf-8")), time.time())
+            self._evict(index)
+
+    def discard(
+        self, org_identifier: str, loc_ref: str, business_date: date, *, include_adjustments: bool
+    ) -> None:
+        path = self._path(self.key(org_identifier, loc_ref, business_date, include_adjustments))
+        with self._lock:
+            self._load_index().pop(path, None)
+            path.unlink(missing_ok=True)
+
+    def _evict(self, index: dict[Path, tuple[int, float]]) -> None:
+        total = sum(size for size, _ in index.values())
+        if total <= self.max_bytes:
+            return
+        for path, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            index.pop(path, None)
+            total -= size
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return sum(size for size, _ in self._load_index().values())
+
+
+class DimensionCache:
+    """Process-wide, thread-safe TTL cache for BI dimension responses.
+
+    Dimension payloads (locations, employees, job codes) change rarely, so one
+    answer serves every Streamlit session in the process until it expires or is
+    invalidated. Callers receive deep copies, so mutating a result never
+    affects the shared entry.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600.0, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl_seconds = float(ttl_seconds)
+        self._clock = clock
+        self._entries: dict[tuple[str, ...], tuple[float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(
+        self,
+        key: tuple[str, ...],
+        fetch: Callable[[], dict[str, Any]],
+        *,
+        ttl_seconds: float | None = None,
+    ) -> dict[str, Any]:
+        ttl = self.ttl_seconds if ttl_seconds is None else float(ttl_seconds)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry[0] < ttl:
+            return copy.deepcopy(entry[1])
+        payload = fetch()
+        with self._lock:
+            self._entries[key] = (self._clock(), copy.deepcopy(payload))
+        return payload
+
+    def invalidate(self, *prefix: str) -> int:
+        """Drop entries whose key starts with ``prefix``; no prefix clears all."""
+        with self._lock:
+            doomed = [key for key in self._entries if key[: len(prefix)] == tuple(prefix)]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared by every OracleBIClient in the process, and therefore by every
+# Streamlit session served by it.
+DIMENSION_CACHE = DimensionCache()
+
+
+class EmptyDayCache:
+    """Process-wide memory of location-days that returned no timecards.
+
+    Closed or seasonal stores answer many days with empty ``businessDates``.
+    Those answers are kept for ``ttl_seconds`` chosen by the caller per
+    lookup — short for recent dates that may still receive punches, long for
+    old ones — so known-empty days are not requested again on every run.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._entries: dict[tuple[str, ...], tuple[float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, ...], *, ttl_seconds: float) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._clock() - entry[0] >= ttl_seconds:
+                del self._entries[key]
+                return None
+            return copy.deepcopy(entry[1])
+
+    def put(self, key: tuple[str, ...], payload: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), copy.deepcopy(payload))
+
+    def discard(self, key: tuple[str, ...]) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, *prefix: str) -> int:
+        """Drop entries whose key starts with ``prefix``; no prefix clears all."""
+        with self._lock:
+            doomed = [key for key in self._entries if key[: len(prefix)] == tuple(prefix)]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+EMPTY_DAY_CACHE = EmptyDayCache()
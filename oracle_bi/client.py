@@ -1,21 +1,40 @@
 from __future__ import annotations
 
 import base64
+import copy
 import hashlib
+import json
+import logging
 import secrets
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator, Mapping
 from urllib.parse import parse_qs, urlparse
 
 import requests
+import requests.adapters
+
+from oracle_bi.cache import DIMENSION_CACHE, EMPTY_DAY_CACHE, DimensionCache, EmptyDayCache, TimecardCache
+from oracle_bi.metrics import ClientMetrics, LatencyHistory
+from oracle_bi.recording import ResponseRecorder
+from oracle_bi.streaming import TimecardStream
+from oracle_bi.throttle import CircuitBreaker, EndpointRateLimiter, RetryPolicy, parse_retry_after
+
+
+logger = logging.getLogger(__name__)
 
 
 class OracleBIError(RuntimeError):
     """Raised when Oracle BI authentication or an API request fails."""
 
 
+class CircuitOpenError(OracleBIError):
+    """Raised instead of calling a location whose circuit breaker is open."""
+
+
 @dataclass(frozen=True)
 class OracleBIConfig:
     auth_server: str
@@ -27,6 +46,30 @@ class OracleBIConfig:
     application_name: str = "Meal Compliance Dashboard"
     timeout_seconds: int = 45
     verify_ssl: bool = True
+    max_workers: int = 4
+    requests_per_second: float = 10.0
+    endpoint_rate_limits: Mapping[str, float] = field(default_factory=dict)
+    max_retries: int = 4
+    backoff_seconds: float = 0.5
+    backoff_max_seconds: float = 30.0
+    cache_directory: str = ""
+    cache_max_megabytes: int = 512
+    cache_max_age_hours: float = 168.0
+    incremental_sync: bool = False
+    dimension_ttl_seconds: float = 3600.0
+    empty_day_recent_ttl_seconds: float = 3600.0
+    empty_day_ttl_seconds: float = 604800.0
+    empty_day_recent_days: int = 7
+    circuit_breaker_failures: int = 3
+    circuit_breaker_reset_seconds: float = 300.0
+    latency_history_path: str = ""
+    journal_directory: str = ""
+    max_planned_range_days: int = 366
+    record_directory: str = ""
+    record_salt: str = ""
+    warm_cache: bool = False
+    warm_interval_minutes: float = 15.0
+    warm_lookback_days: int = 1
 
     def __post_init__(self) -> None:
         required = {
@@ -40,6 +83,15 @@ class OracleBIConfig:
         missing = [name for name, value in required.items() if not str(value).strip()]
         if missing:
             raise ValueError("Missing Oracle BI configuration: " + ", ".join(missing))
+        if int(self.max_workers) < 1:
+            raise ValueError("Oracle BI max_workers must be at least 1.")
+        rates = [self.requests_per_second, *self.endpoint_rate_limits.values()]
+        if any(float(rate) <= 0 for rate in rates):
+            raise ValueError("Oracle BI request rate limits must be positive.")
+        if int(self.max_retries) < 0:
+            raise ValueError("Oracle BI max_retries cannot be negative.")
+        if int(self.circuit_breaker_failures) < 0:
+            raise ValueError("Oracle BI circuit_breaker_failures cannot be negative.")
 
 
 @dataclass
@@ -52,23 +104,251 @@ class TokenBundle:
         return bool(self.id_token) and time.monotonic() + safety_seconds < self.expires_at_monotonic
 
 
-class OracleBIClient:
-    """Oracle MICROS Business Intelligence API client.
+@dataclass(frozen=True)
+class UnitFailure:
+    """A (locRef, busDt) unit that a partial run could not fetch."""
 
-    Authentication follows Oracle's OIDC Authorization Code Flow with PKCE. Tokens
-    are held in process memory only; this client never writes them to disk.
+    loc_ref: str
+    business_date: date
+    error: str
+    skipped: bool = False
+
+    @property
+    def source_label(self) -> str:
+        return "Skipped — circuit open" if self.skipped else "Request failed"
+
+
+def config_fingerprint(config: OracleBIConfig) -> str:
+    """Stable identity of a BI tenant and account, without the password."""
+    material = "|".join(
+        [config.auth_server, config.application_server, config.org_identifier, config.client_id, config.username]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+_SESSION_REGISTRY: dict[tuple[str, int], requests.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+
+def shared_session(config: OracleBIConfig) -> requests.Session:
+    """Return the process-wide keep-alive session for this tenant and pool size.
+
+    Clients rebuilt on Streamlit reruns, and clients in other sessions, reuse
+    the same connection pool instead of paying new TLS handshakes. The pool is
+    sized so ``max_workers`` concurrent fetches never queue for a connection.
+    """
+    pool_size = max(10, int(config.max_workers))
+    key = (config_fingerprint(config), pool_size)
+    with _SESSION_LOCK:
+        session = _SESSION_REGISTRY.get(key)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip, deflate",
+                    "User-Agent": "MealComplianceDashboard/3.3",
+                }
+            )
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION_REGISTRY[key] = session
+        return session
+
+
+_LATENCY_REGISTRY: dict[tuple[str, str], LatencyHistory] = {}
+
+
+def shared_latency_history(config: OracleBIConfig) -> LatencyHistory:
+    """Return the process-wide per-location latency history for this tenant.
+
+    Every client of a tenant feeds and reads the same history, loaded from
+    ``config.latency_history_path`` when one is set, so a new session already
+    knows which stores answer slowly.
+    """
+    key = (config_fingerprint(config), str(config.latency_history_path).strip())
+    with _SESSION_LOCK:
+        history = _LATENCY_REGISTRY.get(key)
+        if history is None:
+            history = LatencyHistory(key[1] or None)
+            _LATENCY_REGISTRY[key] = history
+        return history
+
+
+_LIMITER_REGISTRY: dict[tuple[str, float, tuple[tuple[str, float], ...]], EndpointRateLimiter] = {}
+
+
+def shared_rate_limiter(config: OracleBIConfig) -> EndpointRateLimiter:
+    """Return the process-wide per-endpoint rate limiter for this tenant.
+
+    Every client of a tenant — other Streamlit sessions and the cache warmer
+    included — draws from the same token buckets, so together they stay within
+    the configured rates and a 429 seen by one slows all of them.
+    """
+    endpoint_rates = tuple(sorted((str(key), float(value)) for key, value in config.endpoint_rate_limits.items()))
+    key = (config_fingerprint(config), float(config.requests_per_second), endpoint_rates)
+    with _SESSION_LOCK:
+        limiter = _LIMITER_REGISTRY.get(key)
+        if limiter is None:
+            limiter = EndpointRateLimiter(config.requests_per_second, config.endpoint_rate_limits)
+            _LIMITER_REGISTRY[key] = limiter
+        return limiter
+
+
+class TokenSlot:
+    """Tokens for one tenant plus the lock that serializes their renewal."""
+
+    def __init__(self) -> None:
+        self.tokens: TokenBundle | None = None
+        self.lock = threading.Lock()
+
+
+class TokenBroker:
+    """Process-wide, in-memory token store keyed by config fingerprint.
+
+    Every client for the same tenant and account, across worker threads and
+    Streamlit sessions, shares one slot, so a single authentication or refresh
+    serves them all. Tokens are never written to disk.
+    """
+
+    def __init__(self) -> None:
+        self._slots: dict[str, TokenSlot] = {}
+        self._lock = threading.Lock()
+
+    def slot(self, fingerprint: str) -> TokenSlot:
+        with self._lock:
+            slot = self._slots.get(fingerprint)
+            if slot is None:
+                slot = TokenSlot()
+                self._slots[fingerprint] = slot
+            return slot
+
+    def discard(self, fingerprint: str) -> None:
+        with self._lock:
+            self._slots.pop(fingerprint, None)
+
+
+TOKEN_BROKER = TokenBroker()
+
+
+class RequestCoalescer:
+    """Process-wide single-flight registry for identical BI requests.
+
+    While a request for a key is in flight, further callers with the same key
+    wait for it instead of sending their own. When anyone waited, every caller
+    (the sender included) receives its own deep copy of the result, so no
+    caller can mutate another's payload; an exception is raised to all of them.
+    """
+
+    def __init__(self) -> None:
+        # key -> (shared future, number of callers waiting on it)
+        self._in_flight: dict[tuple[str, str, str], list[Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(fingerprint: str, endpoint: str, payload: dict[str, Any]) -> tuple[str, str, str]:
+        return fingerprint, endpoint, json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+    def run(
+        self, key: tuple[str, str, str], call: Callable[[], dict[str, Any]]
+    ) -> tuple[dict[str, Any], bool]:
+        """Return ``(result, shared)``; ``shared`` is True for callers that waited."""
+        with self._lock:
+            entry = self._in_flight.get(key)
+            leader = entry is None
+            if entry is None:
+                entry = [Future(), 0]
+                self._in_flight[key] = entry
+            else:
+                entry[1] += 1
+        future: Future[dict[str, Any]] = entry[0]
+        if not leader:
+            return copy.deepcopy(future.result()), True
+        try:
+            result = call()
+        except BaseException as error:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(error)
+            raise
+        with self._lock:
+            self._in_flight.pop(key, None)
+            waiters = entry[1]
+        future.set_result(result)
+        return (copy.deepcopy(result) if waiters else result), False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+
+REQUEST_COALESCER = RequestCoalescer()
+
+
+class TransferStats:
+    """Thread-safe counters of response bytes on the wire versus decoded."""
+
+    def __init__(self) -> None:
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.compressed_responses = 0
+        self._lock = threading.Lock()
+
+    def record(self, response: Any) -> None:
+        decoded = len(getattr(response, "content", b"") or b"")
+        wire = decoded
+        raw = getattr(response, "raw", None)
+        try:
+            wire = int(raw.tell()) if raw is not None else int(response.headers.get("Content-Length", decoded))
+        except (AttributeError, TypeError, ValueError):
+            pass
+        encoding = str(response.headers.get("Content-Encoding", "") or "").strip().lower()
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire
+            self.decoded_bytes += decoded
+            if encoding and encoding != "identity":
+                self.compressed_responses += 1
+
+    def snapshot(self) -> dict[str, int | float]:
+        with self._lock:
+            ratio = (self.wire_bytes / self.decoded_bytes) if self.decoded_bytes else 1.0
+            return {
+                "responses": self.responses,
+                "wire_bytes": self.wire_bytes,
+                "decoded_bytes": self.decoded_bytes,
+                "compressed_responses": self.compressed_responses,
+                "compression_ratio": round(ratio, 4),
+            }
+
+
+class _OracleBIClientBase:
+    """Transport-independent Oracle BI request building and response parsing.
+
+    The synchronous and asyncio clients share the PKCE request parameters,
+    token parsing and error handling here so both follow the same contract.
     """
 
     def __init__(self, config: OracleBIConfig) -> None:
         self.config = config
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Accept": "application/json",
-                "User-Agent": "MealComplianceDashboard/3.3",
-            }
+        self._token_slot = TokenSlot()
+        self.metrics = ClientMetrics()
+        self.rate_limiter = shared_rate_limiter(config)
+        self.retry_policy = RetryPolicy(
+            max_retries=int(config.max_retries),
+            backoff_seconds=float(config.backoff_seconds),
+            backoff_max_seconds=float(config.backoff_max_seconds),
         )
-        self.tokens: TokenBundle | None = None
+
+    @property
+    def tokens(self) -> TokenBundle | None:
+        return self._token_slot.tokens
+
+    @tokens.setter
+    def tokens(self, value: TokenBundle | None) -> None:
+        self._token_slot.tokens = value
 
     @property
     def authorize_url(self) -> str:
@@ -101,7 +381,11 @@ class OracleBIClient:
         return verifier, challenge
 
     @staticmethod
-    def _safe_error_message(response: requests.Response) -> str:
+    def _response_ok(response: Any) -> bool:
+        return int(response.status_code) < 400
+
+    @staticmethod
+    def _safe_error_message(response: Any) -> str:
         try:
             payload = response.json()
             if isinstance(payload, dict):
@@ -115,22 +399,8 @@ class OracleBIClient:
         text = (response.text or "").strip().replace("\n", " ")
         return text[:500] or "No response details"
 
-    def authenticate(self, *, force_full: bool = False) -> TokenBundle:
-        if not force_full and self.tokens and self.tokens.is_valid():
-            return self.tokens
-
-        if not force_full and self.tokens and self.tokens.refresh_token:
-            try:
-                return self._refresh_tokens(self.tokens.refresh_token)
-            except OracleBIError:
-                # A missed refresh window or post-upgrade invalidation requires PKCE again.
-                self.tokens = None
-
-        return self._full_pkce_authentication()
-
-    def _full_pkce_authentication(self) -> TokenBundle:
-        verifier, challenge = self._new_pkce_pair()
-        params = {
+    def _authorize_params(self, challenge: str) -> dict[str, str]:
+        return {
             "response_type": "code",
             "client_id": self.config.client_id,
             "scope": "openid",
@@ -139,30 +409,22 @@ class OracleBIClient:
             "code_challenge_method": "S256",
         }
 
-        response = self.session.get(
-            self.authorize_url,
-            params=params,
-            timeout=self.config.timeout_seconds,
-            verify=self.config.verify_ssl,
-        )
-        if not response.ok:
+    def _check_authorize_response(self, response: Any) -> None:
+        if not self._response_ok(response):
             raise OracleBIError(
                 f"Oracle authorization failed (HTTP {response.status_code}): "
                 f"{self._safe_error_message(response)}"
             )
 
-        response = self.session.post(
-            self.signin_url,
-            data={
-                "username": self.config.username,
-                "password": self.config.password,
-                "orgname": self.config.org_identifier,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=self.config.timeout_seconds,
-            verify=self.config.verify_ssl,
-        )
-        if not response.ok:
+    def _signin_data(self) -> dict[str, str]:
+        return {
+            "username": self.config.username,
+            "password": self.config.password,
+            "orgname": self.config.org_identifier,
+        }
+
+    def _authorization_code(self, response: Any) -> str:
+        if not self._response_ok(response):
             raise OracleBIError(
                 f"Oracle API account sign-in failed (HTTP {response.status_code}): "
                 f"{self._safe_error_message(response)}"
@@ -181,41 +443,29 @@ class OracleBIClient:
         auth_code = parse_qs(urlparse(redirect_url).query).get("code", [""])[0]
         if not auth_code:
             raise OracleBIError("Oracle sign-in did not return an authorization code.")
+        return auth_code
 
-        response = self.session.post(
-            self.token_url,
-            data={
-                "scope": "openid",
-                "grant_type": "authorization_code",
-                "client_id": self.config.client_id,
-                "code_verifier": verifier,
-                "code": auth_code,
-                "redirect_uri": "apiaccount://callback",
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=self.config.timeout_seconds,
-            verify=self.config.verify_ssl,
-        )
-        return self._consume_token_response(response)
+    def _authorization_code_grant(self, verifier: str, auth_code: str) -> dict[str, str]:
+        return {
+            "scope": "openid",
+            "grant_type": "authorization_code",
+            "client_id": self.config.client_id,
+            "code_verifier": verifier,
+            "code": auth_code,
+            "redirect_uri": "apiaccount://callback",
+        }
 
-    def _refresh_tokens(self, refresh_token: str) -> TokenBundle:
-        response = self.session.post(
-            self.token_url,
-            data={
-                "scope": "openid",
-                "grant_type": "refresh_token",
-                "client_id": self.config.client_id,
-                "refresh_token": refresh_token,
-                "redirect_uri": "apiaccount://callback",
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=self.config.timeout_seconds,
-            verify=self.config.verify_ssl,
-        )
-        return self._consume_token_response(response)
+    def _refresh_token_grant(self, refresh_token: str) -> dict[str, str]:
+        return {
+            "scope": "openid",
+            "grant_type": "refresh_token",
+            "client_id": self.config.client_id,
+            "refresh_token": refresh_token,
+            "redirect_uri": "apiaccount://callback",
+        }
 
-    def _consume_token_response(self, response: requests.Response) -> TokenBundle:
-        if not response.ok:
+    def _consume_token_response(self, response: Any) -> TokenBundle:
+        if not self._response_ok(response):
             raise OracleBIError(
                 f"Oracle token request failed (HTTP {response.status_code}): "
                 f"{self._safe_error_message(response)}"
@@ -242,33 +492,53 @@ class OracleBIClient:
         )
         return self.tokens
 
-    def post(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
-        tokens = self.authenticate()
-        response = self.session.post(
-            self._api_url(endpoint),
-            json=payload,
-            headers={
-                "Authorization": f"Bearer {tokens.id_token}",
-                "Content-Type": "application/json",
-            },
-            timeout=self.config.timeout_seconds,
-            verify=self.config.verify_ssl,
+    @staticmethod
+    def _bearer_headers(tokens: TokenBundle) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {tokens.id_token}",
+            "Content-Type": "application/json",
+        }
+
+    def _retry_delay(self, endpoint: str, attempt: int, response: Any) -> float | None:
+        """Return the wait before retrying ``response``, or None when it is final."""
+        bucket = self.rate_limiter.bucket(endpoint)
+        if response.status_code not in self.retry_policy.retry_statuses:
+            if self._response_ok(response):
+                bucket.recover()
+            return None
+        if attempt >= self.retry_policy.max_retries:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429:
+            bucket.throttle(retry_after or 0.0)
+        return self.retry_policy.delay(attempt, retry_after)
+
+    def _record_response(self, endpoint: str, started: float, response: Any, *, streamed: bool = False) -> None:
+        if streamed:
+            try:
+                size = int(response.headers.get("Content-Length", 0))
+            except (TypeError, ValueError):
+                size = 0
+        else:
+            size = len(getattr(response, "content", b"") or b"")
+        self.metrics.record_attempt(
+            endpoint,
+            latency_seconds=time.perf_counter() - started,
+            status=response.status_code,
+            response_bytes=size,
+            error=not self._response_ok(response),
         )
 
-        if response.status_code == 401:
-            tokens = self.authenticate(force_full=True)
-            response = self.session.post(
-                self._api_url(endpoint),
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {tokens.id_token}",
-                    "Content-Type": "application/json",
-                },
-                timeout=self.config.timeout_seconds,
-                verify=self.config.verify_ssl,
-            )
+    def _transport_retry_delay(self, endpoint: str, attempt: int, error: Exception) -> float:
+        if attempt >= self.retry_policy.max_retries:
+            raise OracleBIError(
+                f"Oracle {endpoint} did not respond after {attempt + 1} attempt(s): "
+                f"{type(error).__name__}"
+            ) from error
+        return self.retry_policy.delay(attempt)
 
-        if not response.ok:
+    def _api_result(self, endpoint: str, response: Any) -> dict[str, Any]:
+        if not self._response_ok(response):
             raise OracleBIError(
                 f"Oracle {endpoint} failed (HTTP {response.status_code}): "
                 f"{self._safe_error_message(response)}"
@@ -282,39 +552,20 @@ class OracleBIClient:
             raise OracleBIError(f"Oracle {endpoint} returned an unexpected response type.")
         return data
 
-    def get_locations(self) -> dict[str, Any]:
-        return self.post(
-            "getLocationDimensions",
-            {"applicationName": self.config.application_name},
-        )
-
-    def get_employees(self, loc_ref: str) -> dict[str, Any]:
-        return self.post(
-            "getEmployeeDimensions",
-            {"locRef": str(loc_ref), "applicationName": self.config.application_name},
-        )
-
-    def get_job_codes(self, loc_ref: str) -> dict[str, Any]:
-        return self.post(
-            "getJobCodeDimensions",
-            {"locRef": str(loc_ref), "applicationName": self.config.application_name},
-        )
+    def _location_payload(self, loc_ref: str | None = None) -> dict[str, Any]:
+        if loc_ref is None:
+            return {"applicationName": self.config.application_name}
+        return {"locRef": str(loc_ref), "applicationName": self.config.application_name}
 
-    def get_latest_business_date(self, loc_ref: str) -> dict[str, Any]:
-        return self.post(
-            "getLatestBusDt",
-            {"locRef": str(loc_ref), "applicationName": self.config.application_name},
-        )
-
-    def get_timecards(
+    def _timecard_payload(
         self,
         loc_ref: str,
         business_date: date,
         *,
-        include_adjustments: bool = True,
-        changed_since_utc: str | None = None,
-        emp_num: int | None = None,
-        ext_payroll_id: str | None = None,
+        include_adjustments: bool,
+        changed_since_utc: str | None,
+        emp_num: int | None,
+        ext_payroll_id: str | None,
     ) -> dict[str, Any]:
         if emp_num is not None and ext_payroll_id:
             raise ValueError("Use either emp_num or ext_payroll_id, not both.")
@@ -331,7 +582,12 @@ class OracleBIClient:
             payload["empNum"] = int(emp_num)
         if ext_payroll_id:
             payload["extPayrollID"] = str(ext_payroll_id)
-        data = self.post("getTimeCardDetails", payload)
+        return payload
+
+    @staticmethod
+    def _annotate_timecards(
+        data: dict[str, Any], loc_ref: str, business_date: date, include_adjustments: bool
+    ) -> dict[str, Any]:
         # Oracle normally echoes locRef and businessDates. Preserve request metadata
         # as a defensive control so coverage and adjustment-inclusion checks remain
         # reproducible even when a gateway omits an echoed request field.
@@ -340,6 +596,628 @@ class OracleBIClient:
         data["_includeAdjustmentsRequested"] = bool(include_adjustments)
         return data
 
+
+class OracleBIClient(_OracleBIClientBase):
+    """Oracle MICROS Business Intelligence API client.
+
+    Authentication follows Oracle's OIDC Authorization Code Flow with PKCE. Tokens
+    are held in process memory only; this client never writes them to disk.
+    Clients with the same config fingerprint share tokens through
+    ``TOKEN_BROKER``.
+    """
+
+    # getLatestBusDt answers are reused for this long when deciding whether a
+    # business date is closed and therefore cacheable.
+    LATEST_BUSINESS_DATE_TTL_SECONDS = 900
+
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.session = shared_session(config)
+        self._fingerprint = config_fingerprint(config)
+        self._token_slot = TOKEN_BROKER.slot(self._fingerprint)
+        self.coalescer: RequestCoalescer = REQUEST_COALESCER
+        self.transfer = TransferStats()
+        self.cache: TimecardCache | None = (
+            TimecardCache(
+                config.cache_directory,
+                max_bytes=int(config.cache_max_megabytes) * 1024 * 1024,
+                max_age_seconds=float(config.cache_max_age_hours) * 3600,
+            )
+            if str(config.cache_directory).strip()
+            else None
+        )
+        self.dimension_cache: DimensionCache = DIMENSION_CACHE
+        self.empty_days: EmptyDayCache = EMPTY_DAY_CACHE
+        self._latest_business_dates: dict[str, tuple[float, date | None]] = {}
+        self._latest_lock = threading.Lock()
+        self.recorder: ResponseRecorder | None = (
+            ResponseRecorder(config.record_directory, salt=config.record_salt or None)
+            if str(config.record_directory).strip()
+            else None
+        )
+        self.circuit_breaker = CircuitBreaker(
+            int(config.circuit_breaker_failures),
+            float(config.circuit_breaker_reset_seconds),
+        )
+        self.latency_history = shared_latency_history(config)
+
+    def authenticate(
+        self, *, force_full: bool = False, rejected: TokenBundle | None = None
+    ) -> TokenBundle:
+        """Return valid tokens, authenticating at most once per tenant at a time.
+
+        Concurrent callers wait on the tenant's slot lock; whoever gets it first
+        refreshes or runs PKCE and the rest reuse that result. ``rejected`` is the
+        bundle the API just refused, so a forced renewal is skipped when another
+        caller has already replaced it.
+        """
+        current = self.tokens
+        if not force_full and current and current.is_valid():
+            return current
+
+        with self._token_slot.lock:
+            current = self.tokens
+            if current is not None and current.is_valid():
+                if not force_full:
+                    return current
+                if rejected is not None and current is not rejected:
+                    return current
+
+            if not force_full and current and current.refresh_token:
+                try:
+                    return self._refresh_tokens(current.refresh_token)
+                except OracleBIError:
+                    # A missed refresh window or post-upgrade invalidation requires PKCE again.
+                    self.tokens = None
+
+            return self._full_pkce_authentication()
+
+    def _full_pkce_authentication(self) -> TokenBundle:
+        verifier, challenge = self._new_pkce_pair()
+        response = self.session.get(
+            self.authorize_url,
+            params=self._authorize_params(challenge),
+            timeout=self.config.timeout_seconds,
+            verify=self.config.verify_ssl,
+        )
+        self._check_authorize_response(response)
+
+        response = self.session.post(
+            self.signin_url,
+            data=self._signin_data(),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=self.config.timeout_seconds,
+            verify=self.config.verify_ssl,
+        )
+        auth_code = self._authorization_code(response)
+
+        response = self.session.post(
+            self.token_url,
+            data=self._authorization_code_grant(verifier, auth_code),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=self.config.timeout_seconds,
+            verify=self.config.verify_ssl,
+        )
+        return self._consume_token_response(response)
+
+    def _refresh_tokens(self, refresh_token: str) -> TokenBundle:
+        response = self.session.post(
+            self.token_url,
+            data=self._refresh_token_grant(refresh_token),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=self.config.timeout_seconds,
+            verify=self.config.verify_ssl,
+        )
+        return self._consume_token_response(response)
+
+    def post(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """POST to a BI endpoint with rate limiting, retries and one re-authentication.
+
+        Each attempt first takes a token from the endpoint's bucket. HTTP 429 and
+        5xx responses, timeouts and connection errors are retried with jittered
+        exponential backoff that honours ``Retry-After``; a 429 also halves the
+        endpoint rate until successful responses restore it. With
+        ``config.record_directory`` set, each result is also written there in
+        sanitized form for offline replay.
+
+        Identical concurrent calls for the same tenant — from other threads or
+        other sessions' clients — are coalesced into one HTTP request whose
+        parsed result every caller receives a private copy of.
+        """
+        data, shared = self.coalescer.run(
+            self.coalescer.key(self._fingerprint, endpoint, payload),
+            lambda: self._post_once(endpoint, payload),
+        )
+        if shared:
+            self.metrics.record_coalesced(endpoint)
+        return data
+
+    def _post_once(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
+        if endpoint == "getTimeCardDetails" and payload.get("locRef"):
+            attempt_seconds: list[float] = []
+            try:
+                data = self._api_result(endpoint, self._send(endpoint, payload, attempt_seconds=attempt_seconds))
+            finally:
+                # Only the HTTP attempts are the store's time; waits on the local
+                # rate limiter, authentication and backoff sleeps are not. Failed
+                # attempts count too: a store that times out is a slow store.
+                if attempt_seconds:
+                    self.latency_history.record(str(payload["locRef"]), sum(attempt_seconds))
+        else:
+            data = self._api_result(endpoint, self._send(endpoint, payload))
+        if self.recorder is not None:
+            self.recorder.record(endpoint, payload, data)
+        return data
+
+    def _send(
+        self,
+        endpoint: str,
+        payload: dict[str, Any],
+        *,
+        stream: bool = False,
+        attempt_seconds: list[float] | None = None,
+    ) -> requests.Response:
+        """Send one BI request, retrying as ``post`` describes.
+
+        When ``attempt_seconds`` is given, the duration of every HTTP attempt is
+        appended to it, excluding rate-limit waits, authentication and backoff.
+        """
+        attempt = 0
+        reauthenticated = False
+        while True:
+            tokens = self.authenticate()
+            self.rate_limiter.bucket(endpoint).acquire()
+            started = time.perf_counter()
+            try:
+                response = self.session.post(
+                    self._api_url(endpoint),
+                    json=payload,
+                    headers=self._bearer_headers(tokens),
+                    timeout=self.config.timeout_seconds,
+                    verify=self.config.verify_ssl,
+                    stream=stream,
+                )
+            except (requests.Timeout, requests.ConnectionError) as error:
+                elapsed = time.perf_counter() - started
+                if attempt_seconds is not None:
+                    attempt_seconds.append(elapsed)
+                self.metrics.record_attempt(
+                    endpoint,
+                    latency_seconds=elapsed,
+                    status=type(error).__name__,
+                    error=True,
+                )
+                delay = self._transport_retry_delay(endpoint, attempt, error)
+                self.metrics.record_retry(endpoint)
+                time.sleep(delay)
+                attempt += 1
+                continue
+            if attempt_seconds is not None:
+                attempt_seconds.append(time.perf_counter() - started)
+            self._record_response(endpoint, started, response, streamed=stream)
+
+            if response.status_code == 401 and not reauthenticated:
+                response.close()
+                self.metrics.record_retry(endpoint)
+                self.authenticate(force_full=True, rejected=tokens)
+                reauthenticated = True
+                continue
+
+            delay = self._retry_delay(endpoint, attempt, response)
+            if delay is None:
+                if not stream:
+                    self.transfer.record(response)
+                return response
+            response.close()
+            self.metrics.record_retry(endpoint)
+            time.sleep(delay)
+            attempt += 1
+
+    def _dimension(self, endpoint: str, loc_ref: str | None = None) -> dict[str, Any]:
+        payload = self._location_payload(loc_ref)
+        if float(self.config.dimension_ttl_seconds) <= 0:
+            return self.post(endpoint, payload)
+        return self.dimension_cache.get_or_fetch(
+            self.dimension_cache_key(endpoint, loc_ref),
+            lambda: self.post(endpoint, payload),
+            ttl_seconds=float(self.config.dimension_ttl_seconds),
+        )
+
+    def dimension_cache_key(self, endpoint: str | None = None, loc_ref: str | None = None) -> tuple[str, ...]:
+        key = (self.config.application_server.rstrip("/"), self.config.org_identifier)
+        if endpoint is None:
+            return key
+        return (*key, endpoint, "" if loc_ref is None else str(loc_ref))
+
+    def invalidate_dimensions(self) -> int:
+        """Forget cached dimensions for this tenant in every session."""
+        return self.dimension_cache.invalidate(*self.dimension_cache_key())
+
+    def get_locations(self) -> dict[str, Any]:
+        return self._dimension("getLocationDimensions")
+
+    def get_employees(self, loc_ref: str) -> dict[str, Any]:
+        return self._dimension("getEmployeeDimensions", loc_ref)
+
+    def get_job_codes(self, loc_ref: str) -> dict[str, Any]:
+        return self._dimension("getJobCodeDimensions", loc_ref)
+
+    def prefetch_dimensions(
+        self, loc_refs: Iterable[str], executor: ThreadPoolExecutor
+    ) -> list[tuple[str, Future[dict[str, Any]], Future[dict[str, Any]]]]:
+        """Queue employee and job code requests for every location on ``executor``.
+
+        Returns (locRef, employees future, job codes future) per location, so
+        timecard units submitted to the same pool afterwards run alongside the
+        dimension requests instead of after them.
+        """
+        refs = [str(loc_ref) for loc_ref in loc_refs]
+        if refs:
+            self.authenticate()
+        return [
+            (loc_ref, executor.submit(self.get_employees, loc_ref), executor.submit(self.get_job_codes, loc_ref))
+            for loc_ref in refs
+        ]
+
+    def worker_pool(self) -> ThreadPoolExecutor:
+        """A pool of ``config.max_workers`` threads for one pipelined fetch."""
+        return ThreadPoolExecutor(max_workers=int(self.config.max_workers), thread_name_prefix="oracle-bi")
+
+    def get_latest_business_date(self, loc_ref: str) -> dict[str, Any]:
+        return self.post("getLatestBusDt", self._location_payload(loc_ref))
+
+    def get_timecards(
+        self,
+        loc_ref: str,
+        business_date: date,
+        *,
+        include_adjustments: bool = True,
+        changed_since_utc: str | None = None,
+        emp_num: int | None = None,
+        ext_payroll_id: str | None = None,
+    ) -> dict[str, Any]:
+        payload = self._timecard_payload(
+            loc_ref,
+            business_date,
+            include_adjustments=include_adjustments,
+            changed_since_utc=changed_since_utc,
+            emp_num=emp_num,
+            ext_payroll_id=ext_payroll_id,
+        )
+        full_day = not changed_since_utc and emp_num is None and not ext_payroll_id
+        # Days known to have no timecards are answered from memory, whether or
+        # not the day is closed, until their age-dependent TTL runs out.
+        empty_key = self.empty_day_key(loc_ref, business_date, include_adjustments)
+        if full_day:
+            empty = self.empty_days.get(empty_key, ttl_seconds=self._empty_day_ttl(business_date))
+            if empty is not None:
+                return empty
+        # Only full-day requests for closed business dates are served from or
+        # written to the disk cache; filtered and incremental requests always
+        # go to Oracle. If getLatestBusDt fails the day is treated as open, so
+        # the cache never makes a fetch fail that would otherwise succeed.
+        cacheable = False
+        if self.cache is not None and full_day:
+            try:
+                cacheable = self.is_closed_business_date(loc_ref, business_date)
+            except OracleBIError:
+                cacheable = False
+        if cacheable:
+            cached = self.cache.get(
+                self.config.org_identifier, str(loc_ref), business_date, include_adjustments=include_adjustments
+            )
+            if cached is not None:
+                return cached
+        data = self.post("getTimeCardDetails", payload)
+        data = self._annotate_timecards(data, loc_ref, business_date, include_adjustments)
+        if full_day:
+            if payload_timecard_count(data) == 0:
+                self.empty_days.put(empty_key, data)
+            else:
+                self.empty_days.discard(empty_key)
+        if cacheable:
+            self.cache.put(
+                self.config.org_identifier,
+                str(loc_ref),
+                business_date,
+                data,
+                include_adjustments=include_adjustments,
+            )
+        return data
+
+    def empty_day_key(self, loc_ref: str, business_date: date, include_adjustments: bool) -> tuple[str, ...]:
+        return (
+            self.config.application_server.rstrip("/"),
+            self.config.org_identifier,
+            str(loc_ref),
+            business_date.isoformat(),
+            "1" if include_adjustments else "0",
+        )
+
+    def _empty_day_ttl(self, business_date: date) -> float:
+        age_days = (date.today() - business_date).days
+        if age_days <= int(self.config.empty_day_recent_days):
+            return float(self.config.empty_day_recent_ttl_seconds)
+        return float(self.config.empty_day_ttl_seconds)
+
+    def stream_timecards(
+        self,
+        loc_ref: str,
+        business_date: date,
+        *,
+        include_adjustments: bool = True,
+        emp_num: int | None = None,
+        ext_payroll_id: str | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> TimecardStream:
+        """Request one day of timecards and decode the body incrementally.
+
+        The returned stream can be passed to ``iter_timecards`` or
+        ``normalize_timecards`` in place of a payload dict; cards are decoded
+        from the socket as they are consumed instead of after the whole body
+        has been loaded.
+
+        This is a standalone API that the dashboard does not use: coverage, the
+        Excel fallback and ``RawCardStore`` need whole payloads. The request is
+        rate limited and retried like ``post``, but it is not coalesced, is not
+        read from or written to the disk or empty-day caches, is not guarded by
+        the circuit breaker and does not feed the latency history. Use
+        ``get_timecards`` or ``get_timecards_partial`` where those matter.
+        """
+        payload = self._timecard_payload(
+            loc_ref,
+            business_date,
+            include_adjustments=include_adjustments,
+            changed_since_utc=None,
+            emp_num=emp_num,
+            ext_payroll_id=ext_payroll_id,
+        )
+        response = self._send("getTimeCardDetails", payload, stream=True)
+        if not self._response_ok(response):
+            try:
+                self._api_result("getTimeCardDetails", response)
+            finally:
+                response.close()
+        return TimecardStream(
+            _closing_chunks(response, chunk_size),
+            loc_ref=str(loc_ref),
+            requested_bus_dt=business_date.isoformat(),
+            adjustments_requested=include_adjustments,
+        )
+
+    def sync_timecards(
+        self,
+        loc_ref: str,
+        business_date: date,
+        *,
+        include_adjustments: bool = True,
+    ) -> dict[str, Any]:
+        """Refresh one cached day using Oracle's ``changedSinceUTC`` watermark.
+
+        The first sync downloads the full day. Later syncs request only cards
+        changed since the stored ``curUTC`` and merge them into the cached day by
+        ``tcId``. Without a cache this is a plain ``get_timecards`` call.
+        """
+        if self.cache is None:
+            return self.get_timecards(loc_ref, business_date, include_adjustments=include_adjustments)
+        cached = self.cache.get(
+            self.config.org_identifier, str(loc_ref), business_date, include_adjustments=include_adjustments
+        )
+        watermark = str((cached or {}).get("curUTC") or "")
+        if cached is None or not watermark:
+            data = self.get_timecards(loc_ref, business_date, include_adjustments=include_adjustments)
+        else:
+            delta = self.get_timecards(
+                loc_ref,
+                business_date,
+                include_adjustments=include_adjustments,
+                changed_since_utc=watermark,
+            )
+            data = merge_timecard_delta(cached, delta)
+        self.cache.put(
+            self.config.org_identifier,
+            str(loc_ref),
+            business_date,
+            data,
+            include_adjustments=include_adjustments,
+        )
+        return data
+
+    def latest_business_date(self, loc_ref: str) -> date | None:
+        """Return the location's latest business date, memoized for a short TTL."""
+        key = str(loc_ref)
+        now = time.monotonic()
+        with self._latest_lock:
+            memo = self._latest_business_dates.get(key)
+        if memo is not None and now - memo[0] < self.LATEST_BUSINESS_DATE_TTL_SECONDS:
+            return memo[1]
+        latest = parse_latest_business_date(self.get_latest_business_date(key))
+        with self._latest_lock:
+            self._latest_business_dates[key] = (now, latest)
+        return latest
+
+    def remember_latest_business_date(self, loc_ref: str, latest: date | None) -> None:
+        """Seed the memo with a getLatestBusDt answer obtained elsewhere."""
+        with self._latest_lock:
+            self._latest_business_dates[str(loc_ref)] = (time.monotonic(), latest)
+
+    def is_closed_business_date(self, loc_ref: str, business_date: date) -> bool:
+        latest = self.latest_business_date(loc_ref)
+        return latest is not None and business_date < latest
+
+    def get_timecards_many(
+        self,
+        units: Iterable[tuple[str, date]],
+        *,
+        include_adjustments: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Fetch timecards for many (locRef, busDt) units.
+
+        Up to ``config.max_workers`` requests run concurrently. Payloads are
+        returned in the order of ``units`` regardless of completion order, so
+        downstream coverage and normalization stay reproducible. The first
+        failure aborts the run; see ``get_timecards_partial`` for a run that
+        keeps what it could fetch.
+        """
+        unit_list = [(str(loc_ref), business_date) for loc_ref, business_date in units]
+        fetch = self.sync_timecards if self.config.incremental_sync else self.get_timecards
+        return self._map_units(
+            unit_list,
+            lambda loc_ref, business_date: fetch(
+                loc_ref, business_date, include_adjustments=include_adjustments
+            ),
+        )
+
+    def get_timecards_partial(
+        self,
+        units: Iterable[tuple[str, date]],
+        *,
+        include_adjustments: bool = True,
+        on_unit: Callable[[str, date, dict[str, Any]], None] | None = None,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> tuple[list[dict[str, Any]], list[UnitFailure]]:
+        """Fetch many units, returning the payloads that succeeded and the failures.
+
+        Each location has a circuit breaker: after
+        ``config.circuit_breaker_failures`` consecutive failed days its
+        remaining days are skipped without a request, so one unresponsive store
+        costs a few timeouts instead of one per day. Failed and skipped units
+        are simply absent from the payloads, which ``build_source_coverage``
+        reports as missing coverage. ``on_unit`` is called from the worker
+        thread with each successful payload as soon as it arrives. Pass
+        ``executor`` to share a pool that already holds other requests.
+        """
+        unit_list = [(str(loc_ref), business_date) for loc_ref, business_date in units]
+        fetch = self.sync_timecards if self.config.incremental_sync else self.get_timecards
+        breaker = self.circuit_breaker
+        if unit_list:
+            # Authentication failures are not a location's fault; let them abort.
+            self.authenticate()
+
+        def guarded(loc_ref: str, business_date: date) -> dict[str, Any]:
+            if not breaker.allow(loc_ref):
+                raise CircuitOpenError(
+                    f"Skipped {loc_ref} {business_date.isoformat()}: too many consecutive Oracle BI failures."
+                )
+            try:
+                payload = fetch(loc_ref, business_date, include_adjustments=include_adjustments)
+            except OracleBIError:
+                breaker.record_failure(loc_ref)
+                raise
+            breaker.record_success(loc_ref)
+            if on_unit is not None:
+                on_unit(loc_ref, business_date, payload)
+            return payload
+
+        payloads: list[dict[str, Any]] = []
+        failures: list[UnitFailure] = []
+        results = self._map_units(unit_list, guarded, capture=(OracleBIError,), executor=executor)
+        for (loc_ref, business_date), result in zip(unit_list, results):
+            if isinstance(result, OracleBIError):
+                failures.append(
+                    UnitFailure(
+                        loc_ref,
+                        business_date,
+                        str(result),
+                        skipped=isinstance(result, CircuitOpenError),
+                    )
+                )
+            else:
+                payloads.append(result)
+        return payloads, failures
+
+    def _map_units(
+        self,
+        unit_list: list[tuple[str, date]],
+        call: Callable[[str, date], dict[str, Any]],
+        *,
+        capture: tuple[type[BaseException], ...] = (),
+        executor: ThreadPoolExecutor | None = None,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Run ``call`` for every unit over the worker pool, in unit order.
+
+        Exceptions of a ``capture`` type are returned in place of the unit's
+        payload; any other exception cancels pending units and propagates.
+        A caller-owned ``executor`` is used as is and left running.
+        """
+
+        def run(loc_ref: str, business_date: date) -> dict[str, Any] | BaseException:
+            try:
+                return call(loc_ref, business_date)
+            except capture as error:
+                return error
+
+        def collect(pool: ThreadPoolExecutor) -> list[dict[str, Any] | BaseException]:
+            # Longest-first dispatch: units of historically slow locations are
+            # submitted before fast ones, so stragglers start early and the run
+            # ends close to the slowest location's own chain of requests.
+            order = self.latency_history.dispatch_order([loc_ref for loc_ref, _ in unit_list])
+            futures: dict[int, Future[dict[str, Any] | BaseException]] = {
+                index: pool.submit(run, *unit_list[index]) for index in order
+            }
+            try:
+                return [futures[index].result() for index in range(len(unit_list))]
+            except BaseException:
+                for future in futures.values():
+                    future.cancel()
+                raise
+
+        workers = min(int(self.config.max_workers), len(unit_list))
+        if executor is None and workers <= 1:
+            results = [run(loc_ref, business_date) for loc_ref, business_date in unit_list]
+        else:
+            # Authenticate once before fanning out so workers share one token
+            # instead of racing through the PKCE flow.
+            self.authenticate()
+            if executor is not None:
+                results = collect(executor)
+            else:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="oracle-bi") as pool:
+                    results = collect(pool)
+        self._save_latency_history()
+        return results
+
+    def _save_latency_history(self) -> None:
+        # The history only orders future runs; failing to persist it must not
+        # fail the fetch that has already succeeded.
+        try:
+            self.latency_history.save()
+        except OSError as error:
+            logger.warning("Could not save Oracle BI latency history: %s", error)
+
+    def get_employee_timecards(
+        self,
+        ext_payroll_id: str,
+        loc_refs: Iterable[str],
+        start_date: date,
+        end_date: date,
+        *,
+        include_adjustments: bool = True,
+        maximum_days: int = 31,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch one employee's timecards for every location and date, concurrently.
+
+        Each request filters on ``extPayrollID`` server-side, so responses hold
+        only that employee's cards. Filtered requests bypass the disk cache.
+        Payloads are returned in unit order; pass ``executor`` to share a pool
+        that already holds the dimension requests.
+        """
+        if not str(ext_payroll_id or "").strip():
+            raise ValueError("An external payroll ID is required for an employee re-check.")
+        payroll_id = str(ext_payroll_id).strip()
+        units = timecard_units(loc_refs, start_date, end_date, maximum_days=maximum_days)
+        return self._map_units(
+            units,
+            lambda loc_ref, business_date: self.get_timecards(
+                loc_ref,
+                business_date,
+                include_adjustments=include_adjustments,
+                ext_payroll_id=payroll_id,
+            ),
+            executor=executor,
+        )
+
     def get_timecards_range(
         self,
         loc_ref: str,
@@ -349,29 +1227,168 @@ class OracleBIClient:
         include_adjustments: bool = True,
         maximum_days: int = 31,
     ) -> list[dict[str, Any]]:
-        if end_date < start_date:
-            raise ValueError("End date cannot be earlier than start date.")
-        day_count = (end_date - start_date).days + 1
-        if day_count > maximum_days:
-            raise ValueError(f"Date range cannot exceed {maximum_days} days per run.")
-
-        results: list[dict[str, Any]] = []
-        current = start_date
-        while current <= end_date:
-            results.append(
-                self.get_timecards(
-                    loc_ref,
-                    current,
-                    include_adjustments=include_adjustments,
-                )
-            )
-            current += timedelta(days=1)
-        return results
+        return self.get_timecards_many(
+            timecard_units([loc_ref], start_date, end_date, maximum_days=maximum_days),
+            include_adjustments=include_adjustments,
+        )
+
+
+def _closing_chunks(response: requests.Response, chunk_size: int) -> Iterable[bytes]:
+    try:
+        yield from response.iter_content(chunk_size=chunk_size)
+    finally:
+        response.close()
+
+
+def merge_timecard_delta(base: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Merge a ``changedSinceUTC`` response into a full cached day payload.
+
+    Changed cards replace the cached card with the same ``tcId`` in place; new
+    cards are appended. The delta's ``curUTC`` becomes the next watermark.
+    """
+    merged = dict(base)
+    days: list[dict[str, Any]] = [
+        {**day, "timeCardDetails": list(day.get("timeCardDetails", []) or [])}
+        for day in base.get("businessDates", []) or []
+        if isinstance(day, dict)
+    ]
+    by_date = {str(day.get("busDt") or ""): day for day in days}
+    for delta_day in delta.get("businessDates", []) or []:
+        if not isinstance(delta_day, dict):
+            continue
+        bus_dt = str(delta_day.get("busDt") or delta.get("_requestedBusDt") or "")
+        target = by_date.get(bus_dt)
+        if target is None:
+            target = {**delta_day, "timeCardDetails": []}
+            days.append(target)
+            by_date[bus_dt] = target
+        cards = target["timeCardDetails"]
+        positions = {
+            str(card.get("tcId")): index
+            for index, card in enumerate(cards)
+            if isinstance(card, dict) and card.get("tcId") is not None
+        }
+        for card in delta_day.get("timeCardDetails", []) or []:
+            if not isinstance(card, dict):
+                continue
+            tc_id = str(card.get("tcId")) if card.get("tcId") is not None else None
+            if tc_id is not None and tc_id in positions:
+                cards[positions[tc_id]] = card
+            else:
+                if tc_id is not None:
+                    positions[tc_id] = len(cards)
+                cards.append(card)
+    merged["businessDates"] = days
+    if delta.get("curUTC"):
+        merged["curUTC"] = delta["curUTC"]
+    return merged
+
+
+def parse_latest_business_date(payload: dict[str, Any]) -> date | None:
+    """Read the business date from a ``getLatestBusDt`` response."""
+    for field_name in ("latestBusDt", "busDt", "latestBusinessDate"):
+        value = str(payload.get(field_name) or "").strip()
+        if value:
+            try:
+                return date.fromisoformat(value[:10])
+            except ValueError:
+                continue
+    return None
 
 
-def iter_timecards(payloads: Iterable[dict[str, Any]]) -> Iterable[tuple[str, str, dict[str, Any]]]:
-    """Yield (loc_ref, business_date, timecard) from Oracle response payloads."""
+def business_dates(start_date: date, end_date: date) -> list[date]:
+    """Return every business date from start to end, inclusive."""
+    return [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+
+
+def timecard_units(
+    loc_refs: Iterable[str],
+    start_date: date,
+    end_date: date,
+    *,
+    maximum_days: int = 31,
+) -> list[tuple[str, date]]:
+    """Expand locations and a date range into ordered (locRef, busDt) units."""
+    if end_date < start_date:
+        raise ValueError("End date cannot be earlier than start date.")
+    day_count = (end_date - start_date).days + 1
+    if day_count > maximum_days:
+        raise ValueError(f"Date range cannot exceed {maximum_days} days per run.")
+    days = business_dates(start_date, end_date)
+    return [(str(loc_ref), business_date) for loc_ref in loc_refs for business_date in days]
+
+
+def payload_timecard_count(payload: dict[str, Any]) -> int:
+    """Count the timecards in one ``getTimeCardDetails`` payload."""
+    total = 0
+    for business_day in payload.get("businessDates", []) or []:
+        if isinstance(business_day, dict):
+            cards = business_day.get("timeCardDetails", []) or []
+            if isinstance(cards, list):
+                total += len(cards)
+    if not payload.get("businessDates") and isinstance(payload.get("timeCardDetails"), list):
+        total += len(payload.get("timeCardDetails") or [])
+    return total
+
+
+class TimecardView(Mapping[str, Any]):
+    """Read-only view of an Oracle timecard with request metadata layered on top.
+
+    ``iter_timecards`` yields these instead of copying every card to attach
+    ``_adjustmentsRequested``: the card dict is referenced, and one metadata
+    dict is shared by every card of the same payload. Metadata keys take
+    precedence over card keys, as the copy-and-assign approach did.
+    """
+
+    __slots__ = ("_card", "_extra")
+
+    def __init__(self, card: dict[str, Any], extra: Mapping[str, Any]) -> None:
+        self._card = card
+        self._extra = extra
+
+    @property
+    def card(self) -> dict[str, Any]:
+        return self._card
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._extra:
+            return self._extra[key]
+        return self._card[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._extra:
+            return self._extra[key]
+        return self._card.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._extra or key in self._card
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._card
+        for key in self._extra:
+            if key not in self._card:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._card) + sum(1 for key in self._extra if key not in self._card)
+
+    def __repr__(self) -> str:
+        return f"TimecardView({dict(self)!r})"
+
+
+def iter_timecards(
+    payloads: Iterable[dict[str, Any] | TimecardStream],
+) -> Iterable[tuple[str, str, Mapping[str, Any]]]:
+    """Yield (loc_ref, business_date, timecard) from Oracle response payloads.
+
+    ``TimecardStream`` items are decoded lazily as they are iterated. When the
+    payload records whether adjustments were requested, cards are yielded as
+    ``TimecardView`` objects carrying ``_adjustmentsRequested`` without a copy.
+    """
     for payload in payloads:
+        if isinstance(payload, TimecardStream):
+            yield from payload
+            continue
         loc_ref = str(payload.get("locRef") or "")
         business_days = payload.get("businessDates", []) or []
         if not business_days and isinstance(payload.get("timeCardDetails"), list):
@@ -380,15 +1397,14 @@ def iter_timecards(payloads: Iterable[dict[str, Any]]) -> Iterable[tuple[str, st
                 "timeCardDetails": payload.get("timeCardDetails", []),
             }]
         adjustments_requested = payload.get("_includeAdjustmentsRequested")
+        metadata = None if adjustments_requested is None else {"_adjustmentsRequested": adjustments_requested}
         for business_day in business_days:
             if not isinstance(business_day, dict):
                 continue
             bus_dt = str(business_day.get("busDt") or payload.get("_requestedBusDt") or "")
             for timecard in business_day.get("timeCardDetails", []) or []:
                 if isinstance(timecard, dict):
-                    if adjustments_requested is None:
+                    if metadata is None:
                         yield loc_ref, bus_dt, timecard
                     else:
-                        enriched = dict(timecard)
-                        enriched["_adjustmentsRequested"] = adjustments_requested
-                        yield loc_ref, bus_dt, enriched
+                        yield loc_ref, bus_dt, TimecardView(timecard, metadata)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import bisect
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Sequence
+
+
+# Upper bounds (milliseconds) of the latency histogram buckets; the last bucket
+# collects everything slower.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+@dataclass
+class EndpointMetrics:
+    attempts: int = 0
+    retries: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    response_bytes: int = 0
+    latency_ms_total: float = 0.0
+    latency_ms_max: float = 0.0
+    latency_buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    status_codes: Counter[str] = field(default_factory=Counter)
+
+    def percentile_ms(self, fraction: float) -> float:
+        """Approximate a latency percentile from the histogram bucket bounds."""
+        if not self.attempts:
+            return 0.0
+        target = fraction * self.attempts
+        running = 0
+        for index, count in enumerate(self.latency_buckets):
+            running += count
+            if running >= target:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(min(LATENCY_BUCKETS_MS[index], self.latency_ms_max))
+                return self.latency_ms_max
+        return self.latency_ms_max
+
+
+class ClientMetrics:
+    """Thread-safe per-endpoint latency, size, retry and status metrics.
+
+    Every HTTP attempt is recorded, including attempts that are retried, so the
+    summary separates time spent waiting on Oracle from local processing.
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record_attempt(
+        self,
+        endpoint: str,
+        *,
+        latency_seconds: float,
+        status: int | str,
+        response_bytes: int = 0,
+        error: bool = False,
+    ) -> None:
+        latency_ms = max(0.0, latency_seconds * 1000.0)
+        with self._lock:
+            metrics = self._endpoints.setdefault(endpoint, EndpointMetrics())
+            metrics.attempts += 1
+            metrics.errors += int(bool(error))
+            metrics.response_bytes += max(0, int(response_bytes))
+            metrics.latency_ms_total += latency_ms
+            metrics.latency_ms_max = max(metrics.latency_ms_max, latency_ms)
+            metrics.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+            metrics.status_codes[str(status)] += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self._endpoints.setdefault(endpoint, EndpointMetrics()).retries += 1
+
+    def record_coalesced(self, endpoint: str) -> None:
+        """Count a call answered by another caller's in-flight request."""
+        with self._lock:
+            self._endpoints.setdefault(endpoint, EndpointMetrics()).coalesced += 1
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        with self._lock:
+            return self._endpoints.get(endpoint, EndpointMetrics())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def summary(self) -> list[dict[str, Any]]:
+        """One row per endpoint, suitable for a DataFrame."""
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            rows: list[dict[str, Any]] = []
+            for endpoint, metrics in items:
+                attempts = metrics.attempts
+                rows.append(
+                    {
+                        "Endpoint": endpoint,
+                        "Attempts": attempts,
+                        "Retries": metrics.retries,
+                        "Coalesced": metrics.coalesced,
+                        "Errors": metrics.errors,
+                        "Mean Latency ms": round(metrics.latency_ms_total / attempts, 1) if attempts else 0.0,
+                        "p50 Latency ms": round(metrics.percentile_ms(0.50), 1),
+                        "p95 Latency ms": round(metrics.percentile_ms(0.95), 1),
+                        "Max Latency ms": round(metrics.latency_ms_max, 1),
+                        "Total Latency s": round(metrics.latency_ms_total / 1000.0, 2),
+                        "Response MB": round(metrics.response_bytes / (1024 * 1024), 3),
+                        "Status Codes": ", ".join(
+                            f"{code}×{count}" for code, count in sorted(metrics.status_codes.items())
+                        ),
+                    }
+                )
+            return rows
+
+
+class LatencyHistory:
+    """Per-location ``getTimeCardDetails`` latency, remembered across runs.
+
+    Each location keeps an exponentially weighted mean of its time on the wire
+    (every HTTP attempt, without local throttling or backoff), so one unusual
+    answer does not reorder the schedule.
+    With a ``path`` the means are loaded on creation and written back by
+    ``save``; like the timecard cache, the file holds no payloads or tokens.
+    """
+
+    def __init__(self, path: str | Path | None = None, *, smoothing: float = 0.3) -> None:
+        self.path = Path(path) if path else None
+        self.smoothing = min(1.0, max(0.0, float(smoothing)))
+        self._seconds: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if self.path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            for loc_ref, seconds in (data.get("locations") or {}).items():
+                try:
+                    self._seconds[str(loc_ref)] = max(0.0, float(seconds))
+                except (TypeError, ValueError):
+                    continue
+
+    def record(self, loc_ref: str, seconds: float) -> None:
+        seconds = max(0.0, float(seconds))
+        with self._lock:
+            previous = self._seconds.get(str(loc_ref))
+            self._seconds[str(loc_ref)] = (
+                seconds if previous is None else previous + self.smoothing * (seconds - previous)
+            )
+            self._dirty = True
+
+    def estimate(self, loc_ref: str) -> float | None:
+        with self._lock:
+            return self._seconds.get(str(loc_ref))
+
+    def dispatch_order(self, loc_refs: Sequence[str]) -> list[int]:
+        """Indices of ``loc_refs`` ordered slowest location first.
+
+        Locations without history are estimated at the mean of the known ones.
+        The sort is stable, so units of one location keep their relative order
+        and, with no history at all, the original order is returned.
+        """
+        with self._lock:
+            known = dict(self._seconds)
+        if not known:
+            return list(range(len(loc_refs)))
+        default = sum(known.values()) / len(known)
+        return sorted(
+            range(len(loc_refs)),
+            key=lambda index: -known.get(str(loc_refs[index]), default),
+        )
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            body = json.dumps({"locations": self._seconds}, sort_keys=True, separators=(",", ":"))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as fh:
+                    fh.write(body)
+                os.replace(temp_name, self.path)
+            except OSError:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_name)
+                raise
+            self._dirty = False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._seconds)
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from oracle_bi.client import OracleBIClient, UnitFailure, timecard_units
+
+
+def plan_chunks(start_date: date, end_date: date, *, chunk_days: int = 31) -> list[tuple[date, date]]:
+    """Split an inclusive date range into consecutive chunks of ``chunk_days``."""
+    if end_date < start_date:
+        raise ValueError("End date cannot be earlier than start date.")
+    if chunk_days < 1:
+        raise ValueError("Chunk size must be at least one day.")
+    chunks: list[tuple[date, date]] = []
+    current = start_date
+    while current <= end_date:
+        chunk_end = min(end_date, current + timedelta(days=chunk_days - 1))
+        chunks.append((current, chunk_end))
+        current = chunk_end + timedelta(days=1)
+    return chunks
+
+
+class RunJournal:
+    """Append-only JSON-lines checkpoint of completed (locRef, busDt) units.
+
+    Each line holds one unit and its payload and is flushed to disk before the
+    next unit is written, so a crash loses at most the unit being written. A
+    torn final line is ignored on load. Like ``TimecardCache`` the journal
+    stores payloads only — never tokens.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_run(
+        cls,
+        directory: str | Path,
+        *,
+        org_identifier: str,
+        loc_refs: Iterable[str],
+        start_date: date,
+        end_date: date,
+        include_adjustments: bool,
+    ) -> "RunJournal":
+        key = "|".join(
+            [
+                str(org_identifier),
+                ",".join(sorted(str(ref) for ref in loc_refs)),
+                start_date.isoformat(),
+                end_date.isoformat(),
+                "1" if include_adjustments else "0",
+            ]
+        )
+        return cls(Path(directory) / (hashlib.sha256(key.encode("utf-8")).hexdigest()[:40] + ".jsonl"))
+
+    def load(self) -> dict[tuple[str, str], dict[str, Any]]:
+        completed: dict[tuple[str, str], dict[str, Any]] = {}
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except OSError:
+            return completed
+        for line in text.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and isinstance(entry.get("payload"), dict):
+                completed[(str(entry.get("locRef") or ""), str(entry.get("busDt") or ""))] = entry["payload"]
+        return completed
+
+    def record(self, loc_ref: str, business_date: date, payload: dict[str, Any]) -> None:
+        line = json.dumps(
+            {"locRef": str(loc_ref), "busDt": business_date.isoformat(), "payload": payload},
+            separators=(",", ":"),
+        )
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab+") as fh:
+                # Terminate a line torn by an earlier crash so it cannot
+                # swallow this entry.
+                end = fh.seek(0, os.SEEK_END)
+                if end > 0:
+                    fh.seek(end - 1)
+                    if fh.read(1) != b"\n":
+                        fh.write(b"\n")
+                fh.write(line.encode("utf-8") + b"\n")
+                fh.flush()
+                os.fsync(fh.fileno())
+
+    def age_seconds(self) -> float | None:
+        try:
+            return max(0.0, time.time() - self.path.stat().st_mtime)
+        except OSError:
+            return None
+
+    def discard(self) -> None:
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+
+class RangePlanner:
+    """Fetch arbitrary date ranges in chunks, resuming from a run journal.
+
+    The range is split into ``chunk_days`` windows that are fetched one after
+    another through ``OracleBIClient.get_timecards_partial``. Every unit is
+    checkpointed as soon as it arrives, so re-running the same range after a
+    crash, timeout or tripped circuit breaker only requests the units that are
+    still missing. The journal is removed once a run completes without
+    failures; journals older than ``max_age_hours`` are ignored and replaced.
+    """
+
+    def __init__(
+        self,
+        client: OracleBIClient,
+        journal_directory: str | Path,
+        *,
+        chunk_days: int = 31,
+        max_age_hours: float = 24.0,
+    ) -> None:
+        self.client = client
+        self.journal_directory = Path(journal_directory)
+        self.chunk_days = int(chunk_days)
+        self.max_age_seconds = float(max_age_hours) * 3600
+
+    def run(
+        self,
+        loc_refs: Iterable[str],
+        start_date: date,
+        end_date: date,
+        *,
+        include_adjustments: bool = True,
+        progress: Callable[[int, int], None] | None = None,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> tuple[list[dict[str, Any]], list[UnitFailure]]:
+        """Return payloads in (locRef, busDt) order plus the units that failed.
+
+        ``progress`` receives (completed chunks, total chunks) after each chunk.
+        ``executor`` is handed to ``get_timecards_partial`` for every chunk.
+        """
+        refs = [str(ref) for ref in loc_refs]
+        chunks = plan_chunks(start_date, end_date, chunk_days=self.chunk_days)
+        journal = RunJournal.for_run(
+            self.journal_directory,
+            org_identifier=self.client.config.org_identifier,
+            loc_refs=refs,
+            start_date=start_date,
+            end_date=end_date,
+            include_adjustments=include_adjustments,
+        )
+        age = journal.age_seconds()
+        if age is not None and age > self.max_age_seconds:
+            journal.discard()
+        completed = journal.load()
+
+        def checkpoint(loc_ref: str, business_date: date, payload: dict[str, Any]) -> None:
+            journal.record(loc_ref, business_date, payload)
+            completed[(loc_ref, business_date.isoformat())] = payload
+
+        failures: list[UnitFailure] = []
+        for index, (chunk_start, chunk_end) in enumerate(chunks, start=1):
+            pending = [
+                (loc_ref, business_date)
+                for loc_ref, business_date in timecard_units(
+                    refs, chunk_start, chunk_end, maximum_days=self.chunk_days
+                )
+                if (loc_ref, business_date.isoformat()) not in completed
+            ]
+            if pending:
+                _, chunk_failures = self.client.get_timecards_partial(
+                    pending,
+                    include_adjustments=include_adjustments,
+                    on_unit=checkpoint,
+                    executor=executor,
+                )
+                failures.extend(chunk_failures)
+            if progress is not None:
+                progress(index, len(chunks))
+
+        total_days = (end_date - start_date).days + 1
+        payloads = [
+            completed[(loc_ref, business_date.isoformat())]
+            for loc_ref, business_date in timecard_units(refs, start_date, end_date, maximum_days=total_days)
+            if (loc_ref, business_date.isoformat()) in completed
+        ]
+        if not failures:
+            journal.discard()
+        return payloads, failures
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import secrets
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+
+# Personal fields replaced before a response is written to disk. Identifier
+# fields are pseudonymised consistently so timecards still join to employees.
+NAME_FIELDS = frozenset(
+    {"fName", "lName", "firstName", "lastName", "employeeName", "displayName", "email", "mgrName"}
+)
+IDENTIFIER_FIELDS = frozenset(
+    {"payrollId", "payrollID", "extPayrollID", "externalPayrollID", "extPayrollId", "employeeId", "uuid", "uuId"}
+)
+FREE_TEXT_FIELDS = frozenset({"notes", "note", "comment", "comments", "reason", "rsn"})
+
+
+def request_key(endpoint: str, payload: dict[str, Any]) -> str:
+    """Stable identifier for an (endpoint, request body) pair.
+
+    ``applicationName`` is ignored so recordings replay for any client name.
+    """
+    body = json.dumps(
+        {key: value for key, value in payload.items() if key != "applicationName"},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(f"{endpoint}|{body}".encode("utf-8")).hexdigest()[:40]
+
+
+class ResponseSanitizer:
+    """Pseudonymise personal data in BI payloads.
+
+    Names become ``Employee <num>``, identifiers become salted hashes and free
+    text is blanked. The same salt always maps the same identifier to the same
+    pseudonym; pass one explicitly to keep recordings from several sessions
+    joinable, otherwise a random per-process salt is used.
+    """
+
+    def __init__(self, salt: str | None = None) -> None:
+        self.salt = salt if salt is not None else secrets.token_hex(16)
+
+    def pseudonym(self, value: Any) -> str:
+        digest = hashlib.sha256(f"{self.salt}|{value}".encode("utf-8")).hexdigest()[:10].upper()
+        return f"P{digest}"
+
+    def sanitize(self, value: Any, *, employee: bool = False) -> Any:
+        if isinstance(value, list):
+            return [self.sanitize(item, employee=employee) for item in value]
+        if not isinstance(value, dict):
+            return value
+        result: dict[str, Any] = {}
+        for key, item in value.items():
+            if key in ("fName", "firstName") or (employee and key == "name"):
+                result[key] = f"Employee {value.get('num', '')}".strip()
+            elif key in NAME_FIELDS:
+                result[key] = ""
+            elif key in IDENTIFIER_FIELDS and item not in (None, ""):
+                result[key] = self.pseudonym(item)
+            elif key in FREE_TEXT_FIELDS and isinstance(item, str):
+                result[key] = ""
+            else:
+                result[key] = self.sanitize(item, employee=employee or key == "employees")
+        return result
+
+
+class ResponseRecorder:
+    """Write sanitized BI request/response pairs for offline replay.
+
+    One JSON file per (endpoint, sanitized request) under ``directory``; the
+    stand-in server in ``oracle_bi.standin`` serves them back. Tokens and
+    credentials never pass through here.
+    """
+
+    def __init__(self, directory: str | Path, *, salt: str | None = None) -> None:
+        self.directory = Path(directory)
+        self.sanitizer = ResponseSanitizer(salt)
+        self._lock = threading.Lock()
+
+    def path_for(self, endpoint: str, payload: dict[str, Any]) -> Path:
+        return self.directory / endpoint / f"{request_key(endpoint, payload)}.json"
+
+    def record(self, endpoint: str, payload: dict[str, Any], response: dict[str, Any]) -> Path:
+        request = self.sanitizer.sanitize(payload)
+        path = self.path_for(endpoint, request)
+        body = json.dumps(
+            {"endpoint": endpoint, "request": request, "response": self.sanitizer.sanitize(response)},
+            separators=(",", ":"),
+        )
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(handle, "w", encoding="utf-8") as fh:
+                fh.write(body)
+            os.replace(temp_name, path)
+        return path
+
+
+def load_recordings(directory: str | Path) -> dict[tuple[str, str], dict[str, Any]]:
+    """Index recorded responses by (endpoint, request key)."""
+    recordings: dict[tuple[str, str], dict[str, Any]] = {}
+    root = Path(directory)
+    if not root.exists():
+        return recordings
+    for path in root.glob("*/*.json"):
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(entry, dict) or not isinstance(entry.get("response"), dict):
+            continue
+        endpoint = str(entry.get("endpoint") or path.parent.name)
+        recordings[(endpoint, request_key(endpoint, entry.get("request") or {}))] = entry["response"]
+    return recordings
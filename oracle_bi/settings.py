@@ -62,6 +62,33 @@ def config_from_secret_mapping(secrets: Mapping[str, Any]) -> OracleBIConfig:
         or "Meal Compliance Dashboard",
         timeout_seconds=int(section.get("timeout_seconds", 45)),
         verify_ssl=bool(section.get("verify_ssl", True)),
+        max_workers=int(section.get("max_workers", 4)),
+        requests_per_second=float(section.get("requests_per_second", 10.0)),
+        endpoint_rate_limits={
+            str(endpoint): float(rate)
+            for endpoint, rate in (section.get("endpoint_rate_limits") or {}).items()
+        },
+        max_retries=int(section.get("max_retries", 4)),
+        backoff_seconds=float(section.get("backoff_seconds", 0.5)),
+        backoff_max_seconds=float(section.get("backoff_max_seconds", 30.0)),
+        cache_directory=str(section.get("cache_directory", "") or "").strip(),
+        cache_max_megabytes=int(section.get("cache_max_megabytes", 512)),
+        cache_max_age_hours=float(section.get("cache_max_age_hours", 168.0)),
+        incremental_sync=bool(section.get("incremental_sync", False)),
+        dimension_ttl_seconds=float(section.get("dimension_ttl_seconds", 3600)),
+        empty_day_recent_ttl_seconds=float(section.get("empty_day_recent_ttl_seconds", 3600)),
+        empty_day_ttl_seconds=float(section.get("empty_day_ttl_seconds", 604800)),
+        empty_day_recent_days=int(section.get("empty_day_recent_days", 7)),
+        circuit_breaker_failures=int(section.get("circuit_breaker_failures", 3)),
+        circuit_breaker_reset_seconds=float(section.get("circuit_breaker_reset_seconds", 300)),
+        latency_history_path=str(section.get("latency_history_path", "") or "").strip(),
+        journal_directory=str(section.get("journal_directory", "") or "").strip(),
+        max_planned_range_days=int(section.get("max_planned_range_days", 366)),
+        record_directory=str(section.get("record_directory", "") or "").strip(),
+        record_salt=str(section.get("record_salt", "") or ""),
+        warm_cache=bool(section.get("warm_cache", False)),
+        warm_interval_minutes=float(section.get("warm_interval_minutes", 15)),
+        warm_lookback_days=int(section.get("warm_lookback_days", 1)),
     )
 
 
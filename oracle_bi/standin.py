@@ -0,0 +1,431 @@
+"""Local stand-in for the Oracle MICROS BI API.
+
+Serves the OIDC authorize/signin/token endpoints and the BI endpoints this
+dashboard calls, with synthetic data of configurable volume, injected latency,
+errors and hangs, or responses captured by record mode. Used to exercise
+``OracleBIClient`` concurrency and retry behaviour without the real tenant::
+
+    python -m oracle_bi.standin --port 8765 --locations 20 --latency-ms 150 --error-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import secrets
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+from zoneinfo import ZoneInfo
+
+from oracle_bi.client import OracleBIConfig
+from oracle_bi.recording import ResponseSanitizer, load_recordings, request_key
+
+
+JOB_CODES = (
+    {"num": 10, "name": "Server"},
+    {"num": 20, "name": "Line Cook"},
+    {"num": 30, "name": "Host"},
+    {"num": 40, "name": "Dishwasher"},
+)
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    org_identifier: str = "STANDIN"
+    locations: int = 3
+    employees_per_location: int = 25
+    # Chance that an employee works on a given day, and that a shift long
+    # enough for a meal period is recorded without one.
+    shift_probability: float = 0.7
+    skipped_meal_rate: float = 0.1
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (500, 503, 429)
+    retry_after_seconds: int = 1
+    hang_rate: float = 0.0
+    hang_seconds: float = 60.0
+    token_ttl_seconds: int = 3600
+    timezone: str = "America/Los_Angeles"
+    seed: int = 7
+    replay_directory: str = ""
+    # Salt the recordings were made with. Requests are sanitized with it before
+    # lookup, so filters on payroll IDs match the pseudonymised recording.
+    replay_salt: str = ""
+
+
+class SyntheticTenant:
+    """Deterministic synthetic locations, employees, job codes and timecards."""
+
+    def __init__(self, config: StandInConfig) -> None:
+        self.config = config
+        self.zone = ZoneInfo(config.timezone)
+        self.location_refs = [str(101 + index) for index in range(max(0, int(config.locations)))]
+
+    def locations(self) -> dict[str, Any]:
+        return {
+            "locations": [
+                {
+                    "locRef": ref,
+                    "name": f"Stand-in Store {ref}",
+                    "active": True,
+                    "openDt": "2020-01-01",
+                    "srcName": "Simphony",
+                    "tz": self.config.timezone,
+                    "curr": "USD",
+                }
+                for ref in self.location_refs
+            ]
+        }
+
+    def _employee_numbers(self, loc_ref: str) -> list[int]:
+        base = int(loc_ref) * 10000
+        return [base + offset for offset in range(1, int(self.config.employees_per_location) + 1)]
+
+    def employees(self, loc_ref: str) -> dict[str, Any]:
+        return {
+            "locRef": loc_ref,
+            "employees": [
+                {
+                    "num": num,
+                    "employeeId": num,
+                    "payrollId": f"E{num}",
+                    "externalPayrollID": f"X{num}",
+                    "fName": "Employee",
+                    "lName": str(num),
+                    "homeLocRef": loc_ref,
+                }
+                for num in self._employee_numbers(loc_ref)
+            ],
+        }
+
+    def job_codes(self, loc_ref: str) -> dict[str, Any]:
+        return {"locRef": loc_ref, "jobCodes": [dict(job) for job in JOB_CODES]}
+
+    def latest_business_date(self, loc_ref: str) -> dict[str, Any]:
+        return {"locRef": loc_ref, "latestBusDt": date.today().isoformat()}
+
+    def _stamp(self, moment: datetime) -> tuple[str, str]:
+        local = moment.replace(tzinfo=self.zone)
+        utc = local.astimezone(timezone.utc)
+        return local.strftime("%Y-%m-%dT%H:%M:%S"), utc.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def timecards(self, payload: dict[str, Any]) -> dict[str, Any]:
+        loc_ref = str(payload.get("locRef") or "")
+        bus_dt = date.fromisoformat(str(payload.get("busDt")))
+        emp_filter = payload.get("empNum")
+        ext_filter = str(payload.get("extPayrollID") or "")
+        rng = random.Random(f"{self.config.seed}|{loc_ref}|{bus_dt.isoformat()}")
+        cards: list[dict[str, Any]] = []
+        serial = 0
+        for num in self._employee_numbers(loc_ref) if loc_ref in self.location_refs else []:
+            if rng.random() >= self.config.shift_probability:
+                continue
+            start = datetime.combine(bus_dt, datetime.min.time()) + timedelta(
+                hours=rng.randint(6, 15), minutes=rng.choice((0, 15, 30, 45))
+            )
+            length = rng.randint(240, 600)
+            job = rng.choice(JOB_CODES)["num"]
+            if length > 300 and rng.random() >= self.config.skipped_meal_rate:
+                first = rng.randint(180, 290)
+                segments = [(start, first, 66), (start + timedelta(minutes=first + 30), length - first, 84)]
+            else:
+                segments = [(start, length, 84)]
+            for clock_in, minutes, out_status in segments:
+                if emp_filter not in (None, "") and int(emp_filter) != num:
+                    continue
+                if ext_filter and ext_filter != f"X{num}":
+                    continue
+                serial += 1
+                clock_out = clock_in + timedelta(minutes=minutes)
+                in_local, in_utc = self._stamp(clock_in)
+                out_local, out_utc = self._stamp(clock_out)
+                cards.append(
+                    {
+                        "tcId": int(f"{bus_dt:%Y%m%d}{loc_ref}{serial:05d}"),
+                        "lastUpdatedUTC": out_utc,
+                        "addedUTC": in_utc,
+                        "empNum": num,
+                        "payrollID": f"E{num}",
+                        "extPayrollID": f"X{num}",
+                        "jcNum": job,
+                        "rvcNum": 1,
+                        "shftNum": serial,
+                        "clkInLcl": in_local,
+                        "clkOutLcl": out_local,
+                        "clkInUTC": in_utc,
+                        "clkOutUTC": out_utc,
+                        "clkInStatus": 84,
+                        "clkOutStatus": out_status,
+                        "payRt": 20.0,
+                        "regHrs": round(minutes / 60.0, 2),
+                        "shftType": 0,
+                        "adjustments": [],
+                    }
+                )
+        return {
+            "curUTC": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "locRef": loc_ref,
+            "businessDates": [{"busDt": bus_dt.isoformat(), "timeCardDetails": cards}] if cards else [],
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_HTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return None
+
+    def _send_json(self, status: int, body: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_GET(self) -> None:
+        standin = self.server.standin
+        path = urlparse(self.path).path
+        standin.count(path)
+        if path.endswith("/oidc-provider/v1/oauth2/authorize"):
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"detail": f"Unknown path {path}"})
+
+    def do_POST(self) -> None:
+        standin = self.server.standin
+        path = urlparse(self.path).path
+        body = self._body()
+        standin.count(path)
+        if path.endswith("/oidc-provider/v1/oauth2/signin"):
+            status, response = standin.signin(parse_qs(body.decode("utf-8")))
+            self._send_json(status, response)
+        elif path.endswith("/oidc-provider/v1/oauth2/token"):
+            status, response = standin.token(parse_qs(body.decode("utf-8")))
+            self._send_json(status, response)
+        elif "/bi/v1/" in path:
+            org, _, endpoint = path.split("/bi/v1/", 1)[1].partition("/")
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                self._send_json(400, {"detail": "Request body is not JSON."})
+                return
+            status, response, headers = standin.api(
+                org, endpoint, payload, self.headers.get("Authorization") or ""
+            )
+            self._send_json(status, response, headers)
+        else:
+            self._send_json(404, {"detail": f"Unknown path {path}"})
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    standin: "StandInBIServer"
+
+
+class StandInBIServer:
+    """Threaded HTTP stand-in for one Oracle BI tenant.
+
+    ``request_counts`` tallies requests by final path segment, so benchmarks
+    can compare client-side attempts with what the server actually received.
+    """
+
+    def __init__(self, config: StandInConfig | None = None, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or StandInConfig()
+        self.tenant = SyntheticTenant(self.config)
+        self.recordings = load_recordings(self.config.replay_directory) if self.config.replay_directory else {}
+        self.replay_sanitizer = ResponseSanitizer(self.config.replay_salt or None)
+        self.request_counts: Counter[str] = Counter()
+        self._codes: set[str] = set()
+        self._refresh_tokens: set[str] = set()
+        self._access_tokens: dict[str, float] = {}
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.standin = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def client_config(self, **overrides: Any) -> OracleBIConfig:
+        values: dict[str, Any] = {
+            "auth_server": self.url,
+            "application_server": self.url,
+            "org_identifier": self.config.org_identifier,
+            "client_id": "standin-client",
+            "username": "standin-user",
+            "password": "standin-password",
+        }
+        values.update(overrides)
+        return OracleBIConfig(**values)
+
+    def start(self) -> "StandInBIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="bi-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandInBIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def count(self, path: str) -> None:
+        with self._lock:
+            self.request_counts[path.rstrip("/").rsplit("/", 1)[-1]] += 1
+
+    def signin(self, form: dict[str, list[str]]) -> tuple[int, dict[str, Any]]:
+        if not form.get("username") or not form.get("password"):
+            return 200, {"success": False, "error": "Invalid credentials"}
+        if form.get("orgname", [""])[0] != self.config.org_identifier:
+            return 200, {"success": False, "error": "Unknown organization"}
+        code = secrets.token_urlsafe(16)
+        with self._lock:
+            self._codes.add(code)
+        return 200, {"success": True, "redirectUrl": f"apiaccount://callback?code={code}"}
+
+    def token(self, form: dict[str, list[str]]) -> tuple[int, dict[str, Any]]:
+        grant = form.get("grant_type", [""])[0]
+        with self._lock:
+            if grant == "authorization_code":
+                code = form.get("code", [""])[0]
+                if code not in self._codes or not form.get("code_verifier"):
+                    return 400, {"detail": "Invalid authorization code", "code": "invalid_grant"}
+                self._codes.discard(code)
+            elif grant == "refresh_token":
+                if form.get("refresh_token", [""])[0] not in self._refresh_tokens:
+                    return 400, {"detail": "Invalid refresh token", "code": "invalid_grant"}
+            else:
+                return 400, {"detail": f"Unsupported grant {grant}", "code": "unsupported_grant_type"}
+            id_token = secrets.token_urlsafe(24)
+            refresh_token = secrets.token_urlsafe(24)
+            self._access_tokens[id_token] = time.monotonic() + self.config.token_ttl_seconds
+            self._refresh_tokens.add(refresh_token)
+        return 200, {
+            "id_token": id_token,
+            "refresh_token": refresh_token,
+            "expires_in": self.config.token_ttl_seconds,
+            "token_type": "Bearer",
+        }
+
+    def _authorized(self, authorization: str) -> bool:
+        token = authorization[len("Bearer "):] if authorization.startswith("Bearer ") else ""
+        with self._lock:
+            expires = self._access_tokens.get(token)
+        return expires is not None and time.monotonic() < expires
+
+    def _fault(self) -> tuple[float, int | None, bool]:
+        """Draw this request's latency, injected error status and hang flag."""
+        config = self.config
+        with self._lock:
+            jitter = self._rng.uniform(0, config.latency_jitter_ms) if config.latency_jitter_ms > 0 else 0.0
+            hang = self._rng.random() < config.hang_rate
+            error = self._rng.choice(config.error_statuses) if self._rng.random() < config.error_rate else None
+        return (config.latency_ms + jitter) / 1000.0, error, hang
+
+    def api(
+        self, org: str, endpoint: str, payload: dict[str, Any], authorization: str
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        if org != self.config.org_identifier:
+            return 404, {"detail": f"Unknown organization {org}"}, {}
+        if not self._authorized(authorization):
+            return 401, {"detail": "Token expired or invalid", "code": "401"}, {}
+        latency, error, hang = self._fault()
+        if hang:
+            time.sleep(self.config.hang_seconds)
+        if latency > 0:
+            time.sleep(latency)
+        if error is not None:
+            headers = {"Retry-After": str(self.config.retry_after_seconds)} if error == 429 else {}
+            return error, {"detail": "Injected stand-in failure", "code": str(error)}, headers
+
+        recorded = self.recordings.get((endpoint, request_key(endpoint, self.replay_sanitizer.sanitize(payload))))
+        if recorded is not None:
+            return 200, recorded, {}
+        loc_ref = str(payload.get("locRef") or "")
+        if endpoint == "getLocationDimensions":
+            return 200, self.tenant.locations(), {}
+        if endpoint == "getEmployeeDimensions":
+            return 200, self.tenant.employees(loc_ref), {}
+        if endpoint == "getJobCodeDimensions":
+            return 200, self.tenant.job_codes(loc_ref), {}
+        if endpoint == "getLatestBusDt":
+            return 200, self.tenant.latest_business_date(loc_ref), {}
+        if endpoint == "getTimeCardDetails":
+            try:
+                return 200, self.tenant.timecards(payload), {}
+            except (TypeError, ValueError):
+                return 400, {"detail": "busDt must be an ISO date"}, {}
+        return 404, {"detail": f"Unknown endpoint {endpoint}"}, {}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a local stand-in Oracle MICROS BI API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--org", default=StandInConfig.org_identifier)
+    parser.add_argument("--locations", type=int, default=StandInConfig.locations)
+    parser.add_argument("--employees", type=int, default=StandInConfig.employees_per_location)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--hang-seconds", type=float, default=StandInConfig.hang_seconds)
+    parser.add_argument("--seed", type=int, default=StandInConfig.seed)
+    parser.add_argument("--replay", default="", help="Serve responses captured with record_directory.")
+    parser.add_argument("--replay-salt", default="", help="The record_salt the recordings were made with.")
+    args = parser.parse_args(argv)
+
+    config = StandInConfig(
+        org_identifier=args.org,
+        locations=args.locations,
+        employees_per_location=args.employees,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        seed=args.seed,
+        replay_directory=args.replay,
+        replay_salt=args.replay_salt,
+    )
+    server = StandInBIServer(config, host=args.host, port=args.port)
+    print(f"Stand-in Oracle BI API at {server.url} (org {config.org_identifier}); Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
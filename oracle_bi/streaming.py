@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+
+_SCALAR_DELIMITERS = frozenset(",}] \t\r\n")
+
+
+class _ChunkReader:
+    """Incremental JSON reader over an iterable of byte or text chunks.
+
+    Only structural characters are scanned by hand; each scalar value and each
+    timecard object is decoded with ``json.JSONDecoder.raw_decode`` once its
+    text is fully buffered, so at most one card is held in the buffer at a time.
+    """
+
+    _COMPACT_AFTER = 1 << 16
+
+    def __init__(self, chunks: Iterable[bytes | str]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        while not self._eof:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._eof = True
+                tail = self._text_decoder.decode(b"", final=True)
+                if tail:
+                    self._buffer += tail
+                    return True
+                return False
+            text = chunk if isinstance(chunk, str) else self._text_decoder.decode(chunk)
+            if text:
+                if self._pos > self._COMPACT_AFTER:
+                    self._buffer = self._buffer[self._pos:]
+                    self._pos = 0
+                self._buffer += text
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in Oracle response stream, found '{found or 'EOF'}'.")
+        self._pos += 1
+
+    def skip_comma(self) -> None:
+        if self.peek() == ",":
+            self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                result, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number or literal may continue in the next chunk ("1." then "5"),
+            # so it is only accepted once a delimiter follows it or at EOF.
+            if (
+                self._buffer[end - 1] not in '}]"'
+                and (end == len(self._buffer) or self._buffer[end] not in _SCALAR_DELIMITERS)
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return result
+
+
+class TimecardStream:
+    """Lazily decoded ``getTimeCardDetails`` response.
+
+    Iterating yields ``(locRef, busDt, timecard)`` exactly like ``iter_timecards``
+    while the body is still being read, so ``normalize_timecards`` can consume
+    a response without first parsing all of it into nested dicts; see
+    ``OracleBIClient.stream_timecards`` for what the streaming request skips.
+    Top-level fields such as ``locRef`` and ``curUTC`` are collected into
+    ``header``; per-day card counts are available in ``card_counts`` once
+    iteration finishes. Cards that arrive before their object's ``busDt`` are
+    held until the object closes, so they get the real date. A stream can be
+    iterated only once.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes | str],
+        *,
+        loc_ref: str = "",
+        requested_bus_dt: str = "",
+        adjustments_requested: bool | None = None,
+    ) -> None:
+        self._reader = _ChunkReader(chunks)
+        self._consumed = False
+        self.header: dict[str, Any] = {}
+        if loc_ref:
+            self.header["locRef"] = str(loc_ref)
+        if requested_bus_dt:
+            self.header["_requestedBusDt"] = requested_bus_dt
+        if adjustments_requested is not None:
+            self.header["_includeAdjustmentsRequested"] = bool(adjustments_requested)
+        self.card_counts: dict[str, int] = {}
+
+    @property
+    def loc_ref(self) -> str:
+        return str(self.header.get("locRef") or "")
+
+    def __iter__(self) -> Iterator[tuple[str, str, dict[str, Any]]]:
+        if self._consumed:
+            raise RuntimeError("A TimecardStream can only be iterated once.")
+        self._consumed = True
+        reader = self._reader
+        reader.expect("{")
+        pending: list[dict[str, Any]] = []
+        while reader.peek() not in ("}", ""):
+            key = reader.value()
+            reader.expect(":")
+            if key == "businessDates" and reader.peek() == "[":
+                yield from self._business_dates()
+            elif key == "timeCardDetails" and reader.peek() == "[":
+                if "busDt" in self.header:
+                    yield from self._labelled(self.header["busDt"], self._cards())
+                else:
+                    pending.extend(self._cards())
+            else:
+                self.header[key] = reader.value()
+            reader.skip_comma()
+        reader.expect("}")
+        yield from self._labelled(self.header.get("busDt"), pending)
+
+    def _business_dates(self) -> Iterator[tuple[str, str, dict[str, Any]]]:
+        reader = self._reader
+        reader.expect("[")
+        while reader.peek() not in ("]", ""):
+            if reader.peek() != "{":
+                reader.value()
+                reader.skip_comma()
+                continue
+            reader.expect("{")
+            fields: dict[str, Any] = {}
+            pending: list[dict[str, Any]] = []
+            while reader.peek() not in ("}", ""):
+                key = reader.value()
+                reader.expect(":")
+                if key == "timeCardDetails" and reader.peek() == "[":
+                    if "busDt" in fields:
+                        yield from self._labelled(fields["busDt"], self._cards())
+                    else:
+                        pending.extend(self._cards())
+                else:
+                    value = reader.value()
+                    if key == "busDt":
+                        fields["busDt"] = value
+                reader.skip_comma()
+            reader.expect("}")
+            yield from self._labelled(fields.get("busDt"), pending)
+            reader.skip_comma()
+        reader.expect("]")
+
+    def _labelled(
+        self, bus_dt: Any, cards: Iterable[dict[str, Any]]
+    ) -> Iterator[tuple[str, str, dict[str, Any]]]:
+        label = str(bus_dt or self.header.get("_requestedBusDt") or "")
+        for card in cards:
+            self.card_counts[label] = self.card_counts.get(label, 0) + 1
+            yield self.loc_ref, label, card
+
+    def _cards(self) -> Iterator[dict[str, Any]]:
+        reader = self._reader
+        adjustments_requested = self.header.get("_includeAdjustmentsRequested")
+        reader.expect("[")
+        while reader.peek() not in ("]", ""):
+            card = reader.value()
+            reader.skip_comma()
+            if not isinstance(card, dict):
+                continue
+            if adjustments_requested is not None:
+                # The card was just decoded and is owned by this stream, so the
+                # request metadata is attached in place without a copy.
+                card["_adjustmentsRequested"] = adjustments_requested
+            yield card
+        reader.expect("]")
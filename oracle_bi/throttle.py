@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping
+
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """Thread-safe token bucket with adaptive (AIMD) rate control.
+
+    ``reserve`` claims the next token and returns how long the caller must wait
+    before sending, so the same bucket serves blocking threads and coroutines.
+    A throttling response halves the rate; each success recovers it gradually
+    toward the configured ceiling.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        capacity: float | None = None,
+        minimum_rate: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive.")
+        self.maximum_rate = float(rate)
+        self.rate = float(rate)
+        self.minimum_rate = min(float(minimum_rate), self.maximum_rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def throttle(self, pause_seconds: float = 0.0) -> None:
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.rate = max(self.minimum_rate, self.rate / 2.0)
+            if pause_seconds > 0:
+                self._blocked_until = max(self._blocked_until, now + pause_seconds)
+
+    def recover(self) -> None:
+        with self._lock:
+            if self.rate < self.maximum_rate:
+                self.rate = min(self.maximum_rate, self.rate + self.maximum_rate * 0.05)
+
+
+class EndpointRateLimiter:
+    """One token bucket per BI endpoint, with optional endpoint-specific rates."""
+
+    def __init__(self, default_rate: float, endpoint_rates: Mapping[str, float] | None = None) -> None:
+        self.default_rate = float(default_rate)
+        self.endpoint_rates = {str(key): float(value) for key, value in (endpoint_rates or {}).items()}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                bucket = TokenBucket(self.endpoint_rates.get(endpoint, self.default_rate))
+                self._buckets[endpoint] = bucket
+            return bucket
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 4
+    backoff_seconds: float = 0.5
+    backoff_max_seconds: float = 30.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUS_CODES
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Full-jitter exponential backoff, never shorter than ``Retry-After``."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_seconds * (2 ** max(0, attempt)))
+        jittered = random.uniform(0.0, ceiling) if ceiling > 0 else 0.0
+        if retry_after is not None:
+            return max(jittered, min(retry_after, self.backoff_max_seconds))
+        return jittered
+
+
+def parse_retry_after(value: Any) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if value in (None, ""):
+        return None
+    text = str(value).strip()
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """Thread-safe per-key circuit breaker.
+
+    A key (a locRef) opens after ``failure_threshold`` consecutive failures and
+    then rejects work immediately. After ``reset_seconds`` one trial request is
+    let through and concurrent callers keep being rejected until it reports;
+    a success closes the circuit, another failure reopens it. A trial that never
+    reports is replaced after another ``reset_seconds``. A threshold of zero
+    disables the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_seconds: float = 300.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(0, int(failure_threshold))
+        self.reset_seconds = float(reset_seconds)
+        self._clock = clock
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._trial_started: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        with self._lock:
+            now = self._clock()
+            trial_started = self._trial_started.get(key)
+            if trial_started is not None and now - trial_started < self.reset_seconds:
+                return False
+            opened_at = self._opened_at.get(key)
+            if opened_at is None and trial_started is None:
+                return True
+            if opened_at is not None and now - opened_at < self.reset_seconds:
+                return False
+            # Half-open: admit one trial; the next failure reopens immediately.
+            self._opened_at.pop(key, None)
+            self._trial_started[key] = now
+            self._failures[key] = max(0, self.failure_threshold - 1)
+            return True
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            self._failures.pop(key, None)
+            self._opened_at.pop(key, None)
+            self._trial_started.pop(key, None)
+
+    def record_failure(self, key: str) -> bool:
+        """Count a failure for ``key``; return True when the circuit is open."""
+        with self._lock:
+            self._trial_started.pop(key, None)
+            if not self.failure_threshold:
+                return False
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if failures >= self.failure_threshold:
+                self._opened_at.setdefault(key, self._clock())
+            return key in self._opened_at
+
+    def is_open(self, key: str) -> bool:
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            return opened_at is not None and self._clock() - opened_at < self.reset_seconds
+
+    def reset(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._failures.clear()
+                self._opened_at.clear()
+                self._trial_started.clear()
+            else:
+                self._failures.pop(key, None)
+                self._opened_at.pop(key, None)
+                self._trial_started.pop(key, None)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Iterable
+
+from oracle_bi.client import (
+    OracleBIClient,
+    OracleBIConfig,
+    OracleBIError,
+    config_fingerprint,
+    parse_latest_business_date,
+)
+
+
+@dataclass
+class WarmReport:
+    """Outcome of one warming pass."""
+
+    latest_business_dates: dict[str, date | None] = field(default_factory=dict)
+    warmed_units: list[tuple[str, date]] = field(default_factory=list)
+    already_warm: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
+    finished_monotonic: float = 0.0
+
+
+class CacheWarmer:
+    """Pre-fetch newly closed business days into the client's disk cache.
+
+    Each pass asks ``getLatestBusDt`` for every active location. When a
+    location has closed days that are not cached yet, its dimensions are
+    refreshed in the shared dimension cache and the closed days' timecards
+    (with adjustments) are fetched through ``OracleBIClient.get_timecards``,
+    which stores them in ``TimecardCache``. Interactive runs read that cache
+    before calling Oracle, so the first run of the day is served warm.
+    """
+
+    def __init__(
+        self,
+        client: OracleBIClient,
+        *,
+        lookback_days: int = 1,
+        interval_seconds: float = 900.0,
+    ) -> None:
+        if client.cache is None:
+            raise ValueError("The Oracle BI cache warmer requires cache_directory to be configured.")
+        self.client = client
+        self.lookback_days = max(1, int(lookback_days))
+        self.interval_seconds = max(1.0, float(interval_seconds))
+        self.last_report: WarmReport | None = None
+        self.last_error: str | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _location_refs(self) -> list[str]:
+        payload = self.client.get_locations()
+        return [
+            str(item.get("locRef"))
+            for item in payload.get("locations", []) or []
+            if isinstance(item, dict) and item.get("locRef") and item.get("active", True)
+        ]
+
+    def warm_once(self, loc_refs: Iterable[str] | None = None) -> WarmReport:
+        client = self.client
+        cache = client.cache
+        if cache is None:
+            raise ValueError("The Oracle BI cache warmer requires cache_directory to be configured.")
+        report = WarmReport()
+        refs = [str(ref) for ref in loc_refs] if loc_refs is not None else self._location_refs()
+        for loc_ref in refs:
+            try:
+                latest = parse_latest_business_date(client.get_latest_business_date(loc_ref))
+                client.remember_latest_business_date(loc_ref, latest)
+                report.latest_business_dates[loc_ref] = latest
+                if latest is None:
+                    continue
+                closed_days = [latest - timedelta(days=offset) for offset in range(self.lookback_days, 0, -1)]
+                cold = [
+                    day
+                    for day in closed_days
+                    if cache.get(client.config.org_identifier, loc_ref, day, include_adjustments=True) is None
+                ]
+                report.already_warm += len(closed_days) - len(cold)
+                if not cold:
+                    continue
+                # A new business day may carry new hires or job codes.
+                client.dimension_cache.invalidate(*client.dimension_cache_key("getEmployeeDimensions", loc_ref))
+                client.dimension_cache.invalidate(*client.dimension_cache_key("getJobCodeDimensions", loc_ref))
+                client.get_employees(loc_ref)
+                client.get_job_codes(loc_ref)
+                for day in cold:
+                    client.get_timecards(loc_ref, day, include_adjustments=True)
+                    report.warmed_units.append((loc_ref, day))
+            except OracleBIError as error:
+                report.errors[loc_ref] = str(error)
+        report.finished_monotonic = time.monotonic()
+        self.last_report = report
+        return report
+
+    def seed(self, client: OracleBIClient) -> int:
+        """Share the last pass's latest business dates with an interactive client.
+
+        Saves each location's ``getLatestBusDt`` round trip before the cache is
+        consulted. Dates older than the client's memo TTL are not shared.
+        """
+        report = self.last_report
+        if report is None or time.monotonic() - report.finished_monotonic > client.LATEST_BUSINESS_DATE_TTL_SECONDS:
+            return 0
+        for loc_ref, latest in report.latest_business_dates.items():
+            client.remember_latest_business_date(loc_ref, latest)
+        return len(report.latest_business_dates)
+
+    def start(self) -> "CacheWarmer":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="oracle-bi-warmer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.warm_once()
+                self.last_error = None
+            except Exception as error:
+                # Location lookup, disk writes or a malformed payload failed; the
+                # thread must survive it and retry at the next interval.
+                message = str(error) if isinstance(error, OracleBIError) else f"{type(error).__name__}: {error}"
+                self.last_error = message
+                self.last_report = WarmReport(errors={"": message}, finished_monotonic=time.monotonic())
+            self._stop.wait(self.interval_seconds)
+
+
+_WARMERS: dict[str, CacheWarmer] = {}
+_WARMERS_LOCK = threading.Lock()
+
+
+def ensure_cache_warmer(config: OracleBIConfig) -> CacheWarmer:
+    """Start (once per process and tenant) a background warmer for ``config``.
+
+    A registered warmer whose thread is no longer alive is started again.
+    """
+    fingerprint = config_fingerprint(config)
+    with _WARMERS_LOCK:
+        warmer = _WARMERS.get(fingerprint)
+        if warmer is None:
+            warmer = CacheWarmer(
+                OracleBIClient(config),
+                lookback_days=int(config.warm_lookback_days),
+                interval_seconds=float(config.warm_interval_minutes) * 60,
+            )
+            _WARMERS[fingerprint] = warmer
+        return warmer.start()
+
+
+def cache_warmer_for(config: OracleBIConfig) -> CacheWarmer | None:
+    with _WARMERS_LOCK:
+        return _WARMERS.get(config_fingerprint(config))
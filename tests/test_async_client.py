@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import replace
+from datetime import date
+
+import httpx
+
+from oracle_bi.async_client import AsyncOracleBIClient
+from oracle_bi.client import OracleBIClient, OracleBIConfig, TokenBundle
+
+
+CONFIG = OracleBIConfig(
+    auth_server="https://auth.example",
+    application_server="https://app.example",
+    org_identifier="BYC",
+    client_id="client",
+    username="async-user",
+    password="secret",
+    max_workers=8,
+)
+
+
+def _oracle_stub(calls: list[str]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        calls.append(path)
+        if path.endswith("/authorize"):
+            return httpx.Response(200, text="ok")
+        if path.endswith("/signin"):
+            return httpx.Response(
+                200, json={"success": True, "redirectUrl": "apiaccount://callback?code=abc"}
+            )
+        if path.endswith("/token"):
+            return httpx.Response(200, json={"id_token": "token-1", "refresh_token": "r", "expires_in": 3600})
+        assert request.headers["Authorization"] == "Bearer token-1"
+        body = json.loads(request.content)
+        if path.endswith("/getTimeCardDetails"):
+            return httpx.Response(
+                200,
+                json={
+                    "locRef": body["locRef"],
+                    "businessDates": [{"busDt": body["busDt"], "timeCardDetails": [{"tcId": 1}]}],
+                },
+            )
+        return httpx.Response(200, json={"locRef": body.get("locRef"), "employees": []})
+
+    return httpx.MockTransport(handler)
+
+
+def test_async_client_authenticates_once_for_concurrent_requests() -> None:
+    calls: list[str] = []
+
+    async def run() -> list[dict]:
+        async with AsyncOracleBIClient(CONFIG, transport=_oracle_stub(calls)) as client:
+            units = [("8", date(2026, 7, day)) for day in range(1, 11)]
+            payloads = await client.get_timecards_many(units)
+            await client.get_employees("8")
+            return payloads
+
+    payloads = asyncio.run(run())
+
+    assert [p["_requestedBusDt"] for p in payloads] == [f"2026-07-{day:02d}" for day in range(1, 11)]
+    assert all(p["_includeAdjustmentsRequested"] is True for p in payloads)
+    assert sum(path.endswith("/token") for path in calls) == 1
+    assert sum(path.endswith("/getTimeCardDetails") for path in calls) == 10
+
+
+def test_async_and_sync_clients_share_tokens_and_rate_limits() -> None:
+    config = replace(CONFIG, username="async-shared-user")
+    sync_client = OracleBIClient(config)
+    sync_client.tokens = TokenBundle("token-1", "r", time.monotonic() + 3600)
+    calls: list[str] = []
+
+    async def run() -> AsyncOracleBIClient:
+        async with AsyncOracleBIClient(config, transport=_oracle_stub(calls)) as client:
+            await client.get_employees("8")
+            return client
+
+    client = asyncio.run(run())
+
+    assert not any(path.endswith(("/authorize", "/token")) for path in calls)
+    assert client.rate_limiter is sync_client.rate_limiter
+
+    fresh = replace(CONFIG, username="async-first-user")
+
+    async def authenticate() -> None:
+        async with AsyncOracleBIClient(fresh, transport=_oracle_stub(calls)) as client:
+            await client.authenticate()
+
+    asyncio.run(authenticate())
+    assert OracleBIClient(fresh).tokens.id_token == "token-1"
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+from oracle_bi.cache import DimensionCache, EmptyDayCache, TimecardCache
+from compliance.validation import build_source_coverage
+from oracle_bi.client import OracleBIClient, OracleBIConfig, OracleBIError
+
+
+class _CountingClient(OracleBIClient):
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.calls: list[tuple[str, str]] = []
+
+    def post(self, endpoint, payload):
+        self.calls.append((endpoint, payload.get("busDt", "")))
+        if endpoint == "getLatestBusDt":
+            return {"locRef": payload["locRef"], "latestBusDt": "2026-07-10"}
+        if endpoint == "getEmployeeDimensions":
+            return {"locRef": payload["locRef"], "employees": [{"num": 1}]}
+        return {
+            "locRef": payload["locRef"],
+            "curUTC": "2026-07-11T08:00:00",
+            "businessDates": [{"busDt": payload["busDt"], "timeCardDetails": [{"tcId": 1}]}],
+        }
+
+
+def _client(tmp_path) -> _CountingClient:
+    return _CountingClient(
+        OracleBIConfig(
+            auth_server="https://auth.example",
+            application_server="https://app.example",
+            org_identifier="BYC",
+            client_id="client",
+            username="bi-user",
+            password="secret",
+            cache_directory=str(tmp_path / "cache"),
+        )
+    )
+
+
+def test_closed_business_days_are_served_from_disk(tmp_path) -> None:
+    first = _client(tmp_path)
+    payload = first.get_timecards("8", date(2026, 7, 1))
+    assert ("getTimeCardDetails", "2026-07-01") in first.calls
+
+    second = _client(tmp_path)
+    cached = second.get_timecards("8", date(2026, 7, 1))
+    assert cached == payload
+    assert [endpoint for endpoint, _ in second.calls] == ["getLatestBusDt"]
+
+
+def test_open_business_days_and_filtered_requests_bypass_cache(tmp_path) -> None:
+    client = _client(tmp_path)
+    client.get_timecards("8", date(2026, 7, 10))
+    client.get_timecards("8", date(2026, 7, 10))
+    client.get_timecards("8", date(2026, 7, 1), emp_num=5)
+    client.get_timecards("8", date(2026, 7, 1), emp_num=5)
+    assert sum(endpoint == "getTimeCardDetails" for endpoint, _ in client.calls) == 4
+    assert client.cache.size_bytes == 0
+
+
+class _NoLatestBusDtClient(_CountingClient):
+    def post(self, endpoint, payload):
+        if endpoint == "getLatestBusDt":
+            self.calls.append((endpoint, ""))
+            raise OracleBIError("Oracle getLatestBusDt failed (HTTP 503): unavailable")
+        return super().post(endpoint, payload)
+
+
+def test_latest_business_date_failure_falls_back_to_the_network(tmp_path) -> None:
+    client = _NoLatestBusDtClient(_client(tmp_path).config)
+
+    payload = client.get_timecards("8", date(2026, 7, 1))
+
+    assert payload["businessDates"][0]["timeCardDetails"] == [{"tcId": 1}]
+    assert [endpoint for endpoint, _ in client.calls] == ["getLatestBusDt", "getTimeCardDetails"]
+    assert client.cache.size_bytes == 0
+
+
+def test_cache_evicts_least_recently_used_and_expires_stale_entries(tmp_path) -> None:
+    cache = TimecardCache(tmp_path, max_bytes=500)
+    body = {"businessDates": [{"busDt": "x", "timeCardDetails": [{"note": "y" * 100}]}]}
+    cache.put("BYC", "8", date(2026, 7, 1), body, include_adjustments=True)
+    time.sleep(0.01)
+    cache.put("BYC", "8", date(2026, 7, 2), body, include_adjustments=True)
+    time.sleep(0.01)
+    assert cache.get("BYC", "8", date(2026, 7, 1), include_adjustments=True) == body
+    time.sleep(0.01)
+    cache.put("BYC", "8", date(2026, 7, 3), body, include_adjustments=True)
+
+    assert cache.get("BYC", "8", date(2026, 7, 2), include_adjustments=True) is None
+    assert cache.get("BYC", "8", date(2026, 7, 1), include_adjustments=True) == body
+    assert cache.get("BYC", "8", date(2026, 7, 1), include_adjustments=False) is None
+
+    stale = TimecardCache(tmp_path, max_age_seconds=0)
+    assert stale.get("BYC", "8", date(2026, 7, 3), include_adjustments=True) is None
+
+
+class _DeltaClient(OracleBIClient):
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.requests: list[dict] = []
+
+    def post(self, endpoint, payload):
+        self.requests.append(dict(payload))
+        if "changedSinceUTC" not in payload:
+            cards = [{"tcId": 1, "regHrs": 4}, {"tcId": 2, "regHrs": 6}]
+            cur_utc = "2026-07-11T08:00:00"
+        else:
+            cards = [{"tcId": 2, "regHrs": 7}, {"tcId": 3, "regHrs": 1}]
+            cur_utc = "2026-07-11T09:00:00"
+        return {
+            "locRef": payload["locRef"],
+            "curUTC": cur_utc,
+            "businessDates": [{"busDt": payload["busDt"], "timeCardDetails": cards}],
+        }
+
+
+def test_incremental_sync_merges_changed_cards_by_tcid(tmp_path) -> None:
+    config = OracleBIConfig(
+        auth_server="https://auth.example",
+        application_server="https://app.example",
+        org_identifier="BYC",
+        client_id="client",
+        username="bi-user",
+        password="secret",
+        max_workers=1,
+        cache_directory=str(tmp_path),
+        incremental_sync=True,
+    )
+    client = _DeltaClient(config)
+    business_date = date(2026, 7, 10)
+    client.is_closed_business_date = lambda loc_ref, day: False
+
+    client.get_timecards_many([("8", business_date)])
+    merged = client.get_timecards_many([("8", business_date)])[0]
+
+    assert "changedSinceUTC" not in client.requests[0]
+    assert client.requests[1]["changedSinceUTC"] == "2026-07-11T08:00:00"
+    cards = merged["businessDates"][0]["timeCardDetails"]
+    assert [(card["tcId"], card["regHrs"]) for card in cards] == [(1, 4), (2, 7), (3, 1)]
+    assert merged["curUTC"] == "2026-07-11T09:00:00"
+    assert merged["_requestedBusDt"] == "2026-07-10"
+
+
+def test_dimension_cache_is_shared_between_clients_until_invalidated(tmp_path) -> None:
+    shared = DimensionCache()
+    first = _client(tmp_path)
+    second = _client(tmp_path)
+    first.dimension_cache = second.dimension_cache = shared
+
+    employees = first.get_employees("8")
+    employees["mutated"] = True
+    assert "mutated" not in second.get_employees("8")
+    assert first.calls == [("getEmployeeDimensions", "")]
+    assert second.calls == []
+
+    assert second.invalidate_dimensions() == 1
+    second.get_employees("8")
+    assert second.calls == [("getEmployeeDimensions", "")]
+
+
+def test_dimension_cache_entries_expire() -> None:
+    now = [0.0]
+    cache = DimensionCache(ttl_seconds=60, clock=lambda: now[0])
+    fetches: list[int] = []
+    fetch = lambda: fetches.append(1) or {"jobCodes": []}  # noqa: E731
+    cache.get_or_fetch(("a",), fetch)
+    now[0] = 59
+    cache.get_or_fetch(("a",), fetch)
+    now[0] = 61
+    cache.get_or_fetch(("a",), fetch)
+    assert len(fetches) == 2
+
+
+class _ClosedStoreClient(OracleBIClient):
+    def __init__(self, config: OracleBIConfig, clock) -> None:
+        super().__init__(config)
+        self.empty_days = EmptyDayCache(clock=clock)
+        self.calls: list[str] = []
+
+    def post(self, endpoint, payload):
+        self.calls.append(payload["busDt"])
+        return {"locRef": payload["locRef"], "curUTC": "2026-07-11T08:00:00", "businessDates": []}
+
+
+def test_empty_location_days_are_not_refetched_until_their_ttl(tmp_path) -> None:
+    now = [0.0]
+    client = _ClosedStoreClient(
+        OracleBIConfig(
+            auth_server="https://auth.example",
+            application_server="https://app.example",
+            org_identifier="BYC",
+            client_id="client",
+            username="bi-user",
+            password="secret",
+            empty_day_recent_ttl_seconds=60,
+            empty_day_ttl_seconds=3600,
+        ),
+        clock=lambda: now[0],
+    )
+    recent = date.today() - timedelta(days=1)
+    old = date.today() - timedelta(days=90)
+
+    payloads = [client.get_timecards("8", day) for day in (recent, old, recent, old)]
+    assert client.calls == [recent.isoformat(), old.isoformat()]
+
+    coverage = build_source_coverage(payloads, expected_locations=["8"], start_date=recent, end_date=recent)
+    assert coverage["Response Present"].all()
+    assert coverage["Timecards Returned"].sum() == 0
+
+    now[0] = 120
+    client.get_timecards("8", recent)
+    client.get_timecards("8", old)
+    assert client.calls == [recent.isoformat(), old.isoformat(), recent.isoformat()]
@@ -1,6 +1,25 @@
 from __future__ import annotations
 
-from oracle_bi.client import OracleBIClient, iter_timecards
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from compliance.models import CaliforniaMealRules
+from compliance.validation import build_source_coverage
+from oracle_bi.cache import EmptyDayCache
+from oracle_bi.client import (
+    OracleBIClient,
+    OracleBIConfig,
+    OracleBIError,
+    TokenBundle,
+    TransferStats,
+    iter_timecards,
+    timecard_units,
+)
+from oracle_bi.metrics import LatencyHistory
 
 
 def test_pkce_pair_has_valid_shape() -> None:
@@ -33,4 +52,377 @@ def test_iter_timecards_preserves_adjustment_request_metadata() -> None:
         ],
     }
     rows = list(iter_timecards([payload]))
-    assert rows[0][2]["_adjustmentsRequested"] is True
+    card = rows[0][2]
+    assert card["_adjustmentsRequested"] is True
+    assert card.get("tcId") == 1
+    assert dict(card) == {"tcId": 1, "_adjustmentsRequested": True}
+    # The metadata rides on a view; the Oracle card itself is neither copied nor mutated.
+    assert card.card is payload["businessDates"][0]["timeCardDetails"][0]
+    assert "_adjustmentsRequested" not in payload["businessDates"][0]["timeCardDetails"][0]
+
+
+def _config(**overrides) -> OracleBIConfig:
+    values = {
+        "auth_server": "https://auth.example",
+        "application_server": "https://app.example",
+        "org_identifier": "BYC",
+        "client_id": "client",
+        "username": "bi-user",
+        "password": "secret",
+    }
+    values.update(overrides)
+    return OracleBIConfig(**values)
+
+
+class _FakeTimecardClient(OracleBIClient):
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.empty_days = EmptyDayCache()
+        self.threads: set[str] = set()
+        self.lock = threading.Lock()
+
+    def authenticate(self, *, force_full: bool = False):
+        return None
+
+    def post(self, endpoint, payload):
+        # Later dates answer first so completion order differs from unit order.
+        time.sleep(0.02 if payload["busDt"].endswith("01") else 0.0)
+        with self.lock:
+            self.threads.add(threading.current_thread().name)
+        return {
+            "locRef": payload["locRef"],
+            "businessDates": [{"busDt": payload["busDt"], "timeCardDetails": []}],
+        }
+
+
+def test_get_timecards_many_returns_payloads_in_unit_order() -> None:
+    client = _FakeTimecardClient(_config(max_workers=4))
+    units = timecard_units(["8", "9"], date(2026, 7, 1), date(2026, 7, 3))
+
+    payloads = client.get_timecards_many(units)
+
+    assert [(p["locRef"], p["_requestedBusDt"]) for p in payloads] == [
+        (loc_ref, business_date.isoformat()) for loc_ref, business_date in units
+    ]
+    assert len(client.threads) > 1
+
+
+def test_single_worker_fetches_serially_on_calling_thread() -> None:
+    client = _FakeTimecardClient(_config(max_workers=1))
+    payloads = client.get_timecards_range("8", date(2026, 7, 1), date(2026, 7, 2))
+    assert [p["_requestedBusDt"] for p in payloads] == ["2026-07-01", "2026-07-02"]
+    assert client.threads == {threading.current_thread().name}
+
+
+class _UnresponsiveStoreClient(_FakeTimecardClient):
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.calls: list[tuple[str, str]] = []
+
+    def post(self, endpoint, payload):
+        self.calls.append((payload["locRef"], payload["busDt"]))
+        if payload["locRef"] == "9":
+            raise OracleBIError("Oracle BI request timed out for getTimeCardDetails after 1 attempt(s).")
+        return super().post(endpoint, payload)
+
+
+def test_partial_run_trips_circuit_and_keeps_fetched_days() -> None:
+    client = _UnresponsiveStoreClient(_config(max_workers=1, circuit_breaker_failures=2))
+    start, end = date(2026, 7, 1), date(2026, 7, 5)
+
+    payloads, failures = client.get_timecards_partial(timecard_units(["8", "9"], start, end))
+
+    assert [p["locRef"] for p in payloads] == ["8"] * 5
+    assert sum(1 for loc_ref, _ in client.calls if loc_ref == "9") == 2
+    assert [(f.loc_ref, f.skipped) for f in failures] == [("9", False)] * 2 + [("9", True)] * 3
+
+    coverage = build_source_coverage(
+        payloads,
+        expected_locations=["8", "9"],
+        start_date=start,
+        end_date=end,
+        failed_units={(f.loc_ref, f.business_date): f.source_label for f in failures},
+    )
+    store_9 = coverage[coverage["Location Ref"] == "9"]
+    assert not store_9["Response Present"].any()
+    assert list(store_9["Source"]) == ["Request failed"] * 2 + ["Skipped — circuit open"] * 3
+    assert coverage[coverage["Location Ref"] == "8"]["Response Present"].all()
+
+
+class _DimensionWaitsForTimecardsClient(_FakeTimecardClient):
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.timecard_started = threading.Event()
+        self.overlapped = False
+
+    def post(self, endpoint, payload):
+        if endpoint == "getEmployeeDimensions":
+            # Only returns promptly if a timecard request runs at the same time.
+            self.overlapped = self.timecard_started.wait(timeout=2)
+            return {"employees": []}
+        if endpoint == "getJobCodeDimensions":
+            return {"jobCodes": []}
+        self.timecard_started.set()
+        return super().post(endpoint, payload)
+
+
+def test_dimension_and_timecard_requests_share_one_pool() -> None:
+    client = _DimensionWaitsForTimecardsClient(_config(max_workers=2, dimension_ttl_seconds=0))
+    units = timecard_units(["8"], date(2026, 7, 1), date(2026, 7, 2))
+
+    with client.worker_pool() as pool:
+        dimensions = client.prefetch_dimensions(["8"], pool)
+        payloads, failures = client.get_timecards_partial(units, executor=pool)
+        employees, jobs = dimensions[0][1].result(), dimensions[0][2].result()
+
+    assert client.overlapped
+    assert failures == []
+    assert [p["_requestedBusDt"] for p in payloads] == ["2026-07-01", "2026-07-02"]
+    assert (dimensions[0][0], employees, jobs) == ("8", {"employees": []}, {"jobCodes": []})
+    assert threading.current_thread().name not in client.threads
+
+
+class _OrderRecordingClient(_FakeTimecardClient):
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.calls: list[tuple[str, str]] = []
+
+    def post(self, endpoint, payload):
+        self.calls.append((payload["locRef"], payload["busDt"]))
+        return super().post(endpoint, payload)
+
+
+def test_historically_slow_locations_are_dispatched_first() -> None:
+    client = _OrderRecordingClient(_config(max_workers=2))
+    client.latency_history = LatencyHistory()
+    client.latency_history.record("8", 0.1)
+    client.latency_history.record("9", 3.0)
+    units = timecard_units(["8", "9"], date(2026, 7, 1), date(2026, 7, 2))
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        payloads, _ = client.get_timecards_partial(units, executor=pool)
+
+    assert client.calls == [("9", "2026-07-01"), ("9", "2026-07-02"), ("8", "2026-07-01"), ("8", "2026-07-02")]
+    assert [(p["locRef"], p["_requestedBusDt"]) for p in payloads] == [
+        (loc_ref, business_date.isoformat()) for loc_ref, business_date in units
+    ]
+
+
+class _UnwritableHistory(LatencyHistory):
+    def save(self) -> None:
+        raise OSError("read-only file system")
+
+
+def test_single_worker_runs_save_latency_history(tmp_path) -> None:
+    client = _FakeTimecardClient(_config(max_workers=1))
+    client.latency_history = LatencyHistory(tmp_path / "latency.json")
+    client.latency_history.record("8", 0.5)
+
+    client.get_timecards_range("8", date(2026, 7, 1), date(2026, 7, 2))
+
+    assert LatencyHistory(tmp_path / "latency.json").estimate("8") == 0.5
+
+
+def test_latency_history_save_errors_do_not_replace_fetch_results_or_errors() -> None:
+    client = _FakeTimecardClient(_config(max_workers=2))
+    client.latency_history = _UnwritableHistory()
+    units = timecard_units(["8"], date(2026, 7, 1), date(2026, 7, 2))
+    assert len(client.get_timecards_many(units)) == 2
+
+    failing = _UnresponsiveStoreClient(_config(max_workers=2))
+    failing.latency_history = _UnwritableHistory()
+    with pytest.raises(OracleBIError, match="timed out"):
+        failing.get_timecards_many(timecard_units(["9"], date(2026, 7, 1), date(2026, 7, 2)))
+
+
+def test_timecard_units_enforce_range_limit() -> None:
+    with pytest.raises(ValueError, match="31 days"):
+        timecard_units(["8"], date(2026, 7, 1), date(2026, 8, 5))
+    with pytest.raises(ValueError, match="max_workers"):
+        _config(max_workers=0)
+
+
+def test_clients_share_a_pooled_keep_alive_session_per_tenant() -> None:
+    first = OracleBIClient(_config(max_workers=24))
+    second = OracleBIClient(_config(max_workers=24))
+    other_tenant = OracleBIClient(_config(max_workers=24, org_identifier="OTHER"))
+
+    assert first.session is second.session
+    assert first.session is not other_tenant.session
+    adapter = first.session.get_adapter("https://app.example")
+    assert adapter._pool_maxsize == 24
+    assert "gzip" in first.session.headers["Accept-Encoding"]
+
+
+def test_transfer_stats_compare_wire_and_decoded_bytes() -> None:
+    class _Raw:
+        def tell(self) -> int:
+            return 250
+
+    class _Response:
+        content = b"x" * 1000
+        raw = _Raw()
+        headers = {"Content-Encoding": "gzip"}
+
+    stats = TransferStats()
+    stats.record(_Response())
+    assert stats.snapshot() == {
+        "responses": 1,
+        "wire_bytes": 250,
+        "decoded_bytes": 1000,
+        "compressed_responses": 1,
+        "compression_ratio": 0.25,
+    }
+
+
+class _CountingAuthClient(OracleBIClient):
+    pkce_runs = 0
+    refreshes = 0
+
+    def _full_pkce_authentication(self) -> TokenBundle:
+        type(self).pkce_runs += 1
+        time.sleep(0.05)
+        self.tokens = TokenBundle(f"id-{type(self).pkce_runs}", "refresh", time.monotonic() + 3600)
+        return self.tokens
+
+    def _refresh_tokens(self, refresh_token: str) -> TokenBundle:
+        type(self).refreshes += 1
+        self.tokens = TokenBundle("refreshed", refresh_token, time.monotonic() + 3600)
+        return self.tokens
+
+
+def test_token_broker_runs_one_authentication_for_all_threads_and_sessions() -> None:
+    config = _config(username="broker-user")
+    clients = [_CountingAuthClient(config) for _ in range(3)]
+    barrier = threading.Barrier(9)
+    results: list[str] = []
+
+    def worker(client: OracleBIClient) -> None:
+        barrier.wait()
+        results.append(client.authenticate().id_token)
+
+    threads = [threading.Thread(target=worker, args=(clients[i % 3],)) for i in range(9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _CountingAuthClient.pkce_runs == 1
+    assert set(results) == {"id-1"}
+
+    # A 401 with an already-replaced token does not trigger another PKCE run.
+    rejected = TokenBundle("stale", "refresh", time.monotonic() + 3600)
+    assert clients[1].authenticate(force_full=True, rejected=rejected).id_token == "id-1"
+    assert clients[2].authenticate(force_full=True).id_token == "id-2"
+    assert clients[0].tokens.id_token == "id-2"
+
+
+class _SlowEchoClient(OracleBIClient):
+    sent: list[dict] = []
+
+    def _post_once(self, endpoint, payload):
+        self.sent.append(payload)
+        time.sleep(0.2)
+        return {"locRef": payload["locRef"], "employees": [{"num": 1}]}
+
+
+def test_identical_concurrent_posts_share_one_request_across_clients() -> None:
+    _SlowEchoClient.sent = []
+    clients = [_SlowEchoClient(_config(username="coalesce-user")) for _ in range(4)]
+    results: list[dict] = []
+
+    def call(client: OracleBIClient, loc_ref: str) -> None:
+        results.append(client.post("getEmployeeDimensions", {"locRef": loc_ref}))
+
+    threads = [threading.Thread(target=call, args=(client, "8")) for client in clients]
+    threads.append(threading.Thread(target=call, args=(clients[0], "9")))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(payload["locRef"] for payload in _SlowEchoClient.sent) == ["8", "9"]
+    assert len(results) == 5
+    shared = [result for result in results if result["locRef"] == "8"]
+    shared[0]["employees"].append({"num": 2})
+    assert all(len(result["employees"]) == 1 for result in shared[1:])
+    assert sum(client.metrics.endpoint("getEmployeeDimensions").coalesced for client in clients) == 3
+
+
+class _EmployeeFilterClient(_FakeTimecardClient):
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.requests: list[tuple[str, dict, str]] = []
+
+    def post(self, endpoint, payload):
+        with self.lock:
+            self.requests.append((endpoint, dict(payload), threading.current_thread().name))
+        if endpoint == "getLocationDimensions":
+            return {"locations": [{"locRef": "8", "name": "Black 8", "tz": "America/Los_Angeles"}]}
+        if endpoint == "getEmployeeDimensions":
+            return {"employees": [{"num": 100, "fName": "Jane", "lName": "Doe", "extPayrollId": "P1"}]}
+        if endpoint == "getJobCodeDimensions":
+            return {"jobCodes": [{"num": 10, "name": "Server"}]}
+        cards = []
+        if payload.get("extPayrollID") == "P1" and (payload["locRef"], payload["busDt"]) == ("8", "2026-07-01"):
+            cards = [
+                {
+                    "tcId": 1,
+                    "empNum": 100,
+                    "extPayrollID": "P1",
+                    "jcNum": 10,
+                    "shftType": 0,
+                    "clkInLcl": "2026-07-01T08:00:00",
+                    "clkOutLcl": "2026-07-01T14:30:00",
+                    "clkInStatus": 84,
+                    "clkOutStatus": 84,
+                }
+            ]
+        return {"locRef": payload["locRef"], "businessDates": [{"busDt": payload["busDt"], "timeCardDetails": cards}]}
+
+
+def test_employee_timecards_filter_every_unit_by_payroll_id_in_unit_order() -> None:
+    client = _EmployeeFilterClient(_config(max_workers=4))
+
+    payloads = client.get_employee_timecards(" P1 ", ["8", "9"], date(2026, 7, 1), date(2026, 7, 2))
+
+    assert [(p["locRef"], p["_requestedBusDt"]) for p in payloads] == [
+        ("8", "2026-07-01"), ("8", "2026-07-02"), ("9", "2026-07-01"), ("9", "2026-07-02")
+    ]
+    assert {payload.get("extPayrollID") for _, payload, _ in client.requests} == {"P1"}
+    assert [len(list(iter_timecards([payload]))) for payload in payloads] == [1, 0, 0, 0]
+
+    client.requests.clear()
+    assert client.get_employee_timecards("X9", ["8"], date(2026, 7, 1), date(2026, 7, 1))[0]["businessDates"] == [
+        {"busDt": "2026-07-01", "timeCardDetails": []}
+    ]
+    with pytest.raises(ValueError, match="payroll ID"):
+        client.get_employee_timecards("  ", ["8"], date(2026, 7, 1), date(2026, 7, 1))
+
+
+def test_employee_recheck_skips_scope_checks_and_shares_the_worker_pool() -> None:
+    import app
+
+    client = _EmployeeFilterClient(_config(max_workers=2, dimension_ttl_seconds=0))
+
+    bundle = app.recheck_employee_source(
+        client,
+        "P1",
+        ["8", "9"],
+        date(2026, 7, 1),
+        date(2026, 7, 2),
+        rules=CaliforniaMealRules(),
+        policy_records={},
+        workday_records={},
+        rate_records={},
+        default_workday_start="00:00",
+        default_classification="NON_EXEMPT",
+    )
+
+    assert len(bundle.workdays) == 1
+    codes = set(bundle.data_quality["Issue Code"])
+    assert not codes & {"SOURCE_COVERAGE_INCOMPLETE", "LOCATION_SCOPE_UNVERIFIED", "NO_TIMECARDS"}
+    dimension_threads = {
+        thread for endpoint, _, thread in client.requests if endpoint in ("getEmployeeDimensions", "getJobCodeDimensions")
+    }
+    assert dimension_threads and threading.current_thread().name not in dimension_threads
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import requests
+
+from oracle_bi.client import OracleBIClient, OracleBIConfig, TokenBundle
+from oracle_bi.metrics import ClientMetrics, LatencyHistory
+
+
+def test_metrics_summarize_latency_sizes_and_status_codes() -> None:
+    metrics = ClientMetrics()
+    for latency in (0.02, 0.04, 0.3, 1.2):
+        metrics.record_attempt("getTimeCardDetails", latency_seconds=latency, status=200, response_bytes=1024)
+    metrics.record_attempt("getTimeCardDetails", latency_seconds=5.0, status=503, error=True)
+    metrics.record_retry("getTimeCardDetails")
+
+    (row,) = metrics.summary()
+    assert row["Attempts"] == 5
+    assert row["Retries"] == 1
+    assert row["Errors"] == 1
+    assert row["p50 Latency ms"] == 500.0
+    assert row["Max Latency ms"] == 5000.0
+    assert row["Status Codes"] == "200×4, 503×1"
+    assert metrics.endpoint("getTimeCardDetails").response_bytes == 4096
+
+
+def test_client_records_every_attempt_including_retries() -> None:
+    class _Response:
+        headers: dict = {}
+        text = ""
+
+        def __init__(self, status_code: int) -> None:
+            self.status_code = status_code
+            self.content = b"{}"
+
+        def json(self):
+            return {}
+
+        def close(self) -> None:
+            pass
+
+    outcomes = [requests.ConnectionError("reset"), _Response(502), _Response(200)]
+
+    class _Session:
+        def post(self, *args, **kwargs):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    client = OracleBIClient(
+        OracleBIConfig(
+            auth_server="https://auth.example",
+            application_server="https://app.example",
+            org_identifier="BYC",
+            client_id="client",
+            username="metrics-user",
+            password="secret",
+            backoff_seconds=0.0,
+        )
+    )
+    client.tokens = TokenBundle("token", "refresh", float("inf"))
+    client.session = _Session()
+
+    assert client.get_latest_business_date("8") == {}
+    endpoint = client.metrics.endpoint("getLatestBusDt")
+    assert endpoint.attempts == 3
+    assert endpoint.retries == 2
+    assert endpoint.status_codes == {"ConnectionError": 1, "502": 1, "200": 1}
+
+
+def test_latency_history_orders_slow_locations_first_and_persists(tmp_path) -> None:
+    path = tmp_path / "latency.json"
+    history = LatencyHistory(path, smoothing=0.5)
+    history.record("8", 0.2)
+    history.record("9", 4.0)
+    history.record("9", 2.0)
+
+    assert history.estimate("9") == 3.0
+    # Unknown locations sit at the mean of the known ones (1.6 s).
+    assert history.dispatch_order(["8", "8", "7", "9"]) == [3, 2, 0, 1]
+
+    history.save()
+    reloaded = LatencyHistory(path)
+    assert reloaded.estimate("8") == 0.2
+    assert reloaded.estimate("9") == 3.0
+    assert LatencyHistory().dispatch_order(["8", "9"]) == [0, 1]
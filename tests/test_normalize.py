@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pandas as pd
+
 from compliance.normalize import normalize_timecards
 
 
@@ -173,3 +175,183 @@ def test_completed_clock_out_without_status_is_not_labeled_still_clocked_in() ->
     }
     df = normalize_timecards([payload])
     assert df.iloc[0]["clock_out_status_label"] == "Clock Out Status Missing"
+
+
+def test_bad_punches_are_reparsed_without_dropping_the_iso_values() -> None:
+    from compliance.normalize import _parse_timestamp_column
+
+    values = [f"2026-07-01T{hour:02d}:30:00" for hour in range(20)] + ["07/01/2026 9:15 PM", "not a time", None, ""]
+    parsed = _parse_timestamp_column(values, utc=False)
+
+    assert str(parsed.dtype) == "datetime64[ns]"
+    assert list(parsed[:20]) == [pd.Timestamp(f"2026-07-01 {hour:02d}:30") for hour in range(20)]
+    assert parsed[20] == pd.Timestamp("2026-07-01 21:15")
+    assert parsed[21:].isna().all()
+
+
+def test_out_of_range_and_non_numeric_emp_nums_fall_back_to_payroll_ids() -> None:
+    from compliance.normalize import EmployeeIndex
+
+    index = EmployeeIndex.from_payloads({"locRef": "8", "employees": [{"num": 100, "payrollId": "007"}]})
+    card_fields = {"empNum": [2**70, "abc", 100], "payrollID": ["007", None, None], "extPayrollID": [None] * 3}
+    employees, methods = index.resolve([2**70, "abc", 100], card_fields)
+
+    assert [employee.get("num") for employee in employees] == [100, None, 100]
+    assert methods[1:] == ["unresolved", "employee.num"]
+    assert methods[0] != "employee.num"
+
+    payload = {
+        "locRef": "8",
+        "businessDates": [{"busDt": "2026-07-01", "timeCardDetails": [{"tcId": 1, "empNum": 2**70, "payrollID": "007"}]}],
+    }
+    df = normalize_timecards([payload], employees=index)
+    assert list(df["employee_key"]) == ["007"]
+
+
+def test_timestamp_columns_parse_iso_and_fall_back_for_other_formats() -> None:
+    payload = {
+        "locRef": "8",
+        "businessDates": [
+            {
+                "busDt": "2026-07-01",
+                "timeCardDetails": [
+                    {
+                        "tcId": 1,
+                        "empNum": 100,
+                        "clkInLcl": "2026-07-01T08:00:00",
+                        "clkInUTC": "2026-07-01T15:00:00Z",
+                    },
+                    {
+                        "tcId": 2,
+                        "empNum": 101,
+                        "clkInLcl": "07/01/2026 9:15 AM",
+                        "clkOutLcl": "not a time",
+                        "clkInUTC": "2026-07-01T09:15:00-07:00",
+                    },
+                ],
+            }
+        ],
+    }
+    df = normalize_timecards([payload])
+    assert str(df["clock_in_local"].dtype) == "datetime64[ns]"
+    assert str(df["clock_in_utc"].dtype) == "datetime64[ns, UTC]"
+    assert list(df["clock_in_local"]) == [pd.Timestamp("2026-07-01 08:00"), pd.Timestamp("2026-07-01 09:15")]
+    assert list(df["clock_in_utc"]) == [
+        pd.Timestamp("2026-07-01 15:00", tz="UTC"),
+        pd.Timestamp("2026-07-01 16:15", tz="UTC"),
+    ]
+    assert df["clock_out_local"].isna().all()
+    assert list(df["clock_out_status_label"]) == ["Still Clocked In", "Still Clocked In"]
+
+
+def test_employee_index_resolves_columns_with_per_row_match_method() -> None:
+    from compliance.normalize import EmployeeIndex
+
+    index = EmployeeIndex.from_payloads(
+        {
+            "locRef": "8",
+            "employees": [
+                {"num": 100, "fName": "Ana", "payrollId": "007"},
+                {"num": 200, "employeeId": 555, "externalPayrollID": "EXT-9"},
+            ],
+        }
+    )
+    employees, methods = index.resolve(
+        [100, 555, -1, -1, 42],
+        {
+            "empNum": [100, 555, None, "x", 42],
+            "payrollID": [None, None, "7", None, None],
+            "extPayrollID": [None, None, None, "ext-9", None],
+        },
+    )
+    assert [employee.get("num") for employee in employees] == [100, 200, 100, 200, None]
+    assert methods == [
+        "employee.num",
+        "empNum matched employee.employeeId",
+        "employee.payrollId",
+        "employee.externalPayrollID",
+        "unresolved",
+    ]
+
+
+def test_repeated_text_columns_are_categorical_and_survive_filtering() -> None:
+    from compliance.engine import analyze_timecards
+    from compliance.normalize import assign_legal_workdays
+
+    payloads = [
+        {
+            "locRef": loc_ref,
+            "businessDates": [
+                {
+                    "busDt": "2026-07-01",
+                    "timeCardDetails": [
+                        {
+                            "tcId": f"{loc_ref}{emp_num}",
+                            "empNum": emp_num,
+                            "payrollID": f"P{emp_num}",
+                            "clkInLcl": "2026-07-01T08:00:00",
+                            "clkOutLcl": "2026-07-01T12:00:00",
+                            "clkOutStatus": 84,
+                        }
+                        for emp_num in (1, 2)
+                    ],
+                }
+            ],
+        }
+        for loc_ref in ("9", "10")
+    ]
+    legal = assign_legal_workdays(normalize_timecards(payloads))
+
+    assert isinstance(legal["employee_key"].dtype, pd.CategoricalDtype)
+    assert list(legal["location_ref"].cat.categories) == ["10", "9"]
+    assert list(legal["location_ref"]) == ["10", "9", "10", "9"]
+
+    # A one-employee slice keeps every category; groupings must skip the unobserved ones.
+    bundle = analyze_timecards(legal[legal["employee_key"] == "P1"], default_classification="NON_EXEMPT")
+    assert len(bundle.workdays) == 1
+    assert bundle.workdays.iloc[0]["Employee Key"] == "P1"
+
+
+def test_raw_cards_live_in_a_side_store_keyed_by_location_and_timecard() -> None:
+    from compliance.normalize import RawCardStore, assign_legal_workdays
+
+    payload = {
+        "locRef": "8",
+        "_includeAdjustmentsRequested": True,
+        "businessDates": [
+            {
+                "busDt": "2026-07-01",
+                "timeCardDetails": [
+                    {
+                        "tcId": 77,
+                        "empNum": 100,
+                        "clkInLcl": "2026-07-01T20:00:00",
+                        "clkOutLcl": "2026-07-02T02:00:00",
+                        "rsn": "original",
+                    }
+                ],
+            }
+        ],
+    }
+    legal = assign_legal_workdays(normalize_timecards([payload]))
+    store = RawCardStore([payload])
+
+    assert "raw" not in legal.columns
+    assert len(legal) == 2 and list(legal["timecard_id"]) == ["77::SEG1", "77::SEG2"]
+    for _, row in legal.iterrows():
+        card = store.for_row(row.to_dict())
+        assert card["rsn"] == "original"
+        assert card["_adjustmentsRequested"] is True
+    assert store[("8", "77")] is store.for_row({"location_ref": "8", "timecard_id": 77})
+    assert store.get(("9", "77")) is None
+    assert not hasattr(store[("8", "77")], "__setitem__")
+
+
+def test_raw_card_store_wraps_cards_without_request_metadata() -> None:
+    from compliance.normalize import RawCardStore
+
+    excel_payload = {"locRef": "8", "businessDates": [{"busDt": "2026-07-01", "timeCardDetails": [{"tcId": 5}]}]}
+    card = RawCardStore([excel_payload])[("8", "5")]
+
+    assert dict(card) == {"tcId": 5}
+    assert not hasattr(card, "__setitem__")
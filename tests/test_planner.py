@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import date
+
+from oracle_bi.client import OracleBIClient, OracleBIConfig, OracleBIError
+from oracle_bi.planner import RangePlanner, RunJournal, plan_chunks
+
+
+def _config(**overrides) -> OracleBIConfig:
+    values = {
+        "auth_server": "https://auth.example",
+        "application_server": "https://app.example",
+        "org_identifier": "BYC",
+        "client_id": "client",
+        "username": "planner-user",
+        "password": "secret",
+        "max_workers": 1,
+        "circuit_breaker_failures": 0,
+    }
+    values.update(overrides)
+    return OracleBIConfig(**values)
+
+
+class _FlakyClient(OracleBIClient):
+    def __init__(self, config: OracleBIConfig, failing_days: set[str]) -> None:
+        super().__init__(config)
+        self.failing_days = failing_days
+        self.calls: list[tuple[str, str]] = []
+
+    def authenticate(self, *, force_full: bool = False):
+        return None
+
+    def post(self, endpoint, payload):
+        self.calls.append((payload["locRef"], payload["busDt"]))
+        if payload["busDt"] in self.failing_days:
+            raise OracleBIError("Oracle BI request timed out.")
+        return {
+            "locRef": payload["locRef"],
+            "businessDates": [{"busDt": payload["busDt"], "timeCardDetails": [{"tcId": 1}]}],
+        }
+
+
+def test_plan_chunks_covers_range_without_overlap() -> None:
+    chunks = plan_chunks(date(2026, 1, 1), date(2026, 3, 31), chunk_days=31)
+    assert chunks == [
+        (date(2026, 1, 1), date(2026, 1, 31)),
+        (date(2026, 2, 1), date(2026, 3, 3)),
+        (date(2026, 3, 4), date(2026, 3, 31)),
+    ]
+
+
+def test_planner_resumes_without_refetching_finished_units(tmp_path) -> None:
+    start, end = date(2026, 1, 1), date(2026, 2, 15)
+    client = _FlakyClient(_config(), failing_days={"2026-02-10"})
+    planner = RangePlanner(client, tmp_path, chunk_days=31)
+    progress: list[tuple[int, int]] = []
+
+    payloads, failures = planner.run(["8", "9"], start, end, progress=lambda done, total: progress.append((done, total)))
+
+    assert len(payloads) == 2 * 46 - 2
+    assert [(f.loc_ref, f.business_date) for f in failures] == [("8", date(2026, 2, 10)), ("9", date(2026, 2, 10))]
+    assert progress == [(1, 2), (2, 2)]
+    assert len(list(tmp_path.glob("*.jsonl"))) == 1
+
+    client.failing_days.clear()
+    client.calls.clear()
+    payloads, failures = planner.run(["8", "9"], start, end)
+
+    assert client.calls == [("8", "2026-02-10"), ("9", "2026-02-10")]
+    assert failures == []
+    assert [(p["locRef"], p["_requestedBusDt"]) for p in payloads[:2]] == [("8", "2026-01-01"), ("8", "2026-01-02")]
+    assert payloads[45]["_requestedBusDt"] == "2026-02-15"
+    assert list(tmp_path.glob("*.jsonl")) == []
+
+
+def test_journal_ignores_a_torn_final_line(tmp_path) -> None:
+    journal = RunJournal(tmp_path / "run.jsonl")
+    journal.record("8", date(2026, 1, 1), {"locRef": "8"})
+    with journal.path.open("a", encoding="utf-8") as fh:
+        fh.write('{"locRef": "8", "busDt": "2026-01-0')
+    journal.record("8", date(2026, 1, 3), {"locRef": "8"})
+
+    assert sorted(journal.load()) == [("8", "2026-01-01"), ("8", "2026-01-03")]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+from compliance.normalize import employee_dimension_map, normalize_timecards
+from oracle_bi.cache import DimensionCache
+from oracle_bi.client import OracleBIClient, timecard_units
+from oracle_bi.recording import ResponseSanitizer
+from oracle_bi.standin import StandInBIServer, StandInConfig
+
+
+def test_client_runs_end_to_end_against_stand_in_server() -> None:
+    with StandInBIServer(StandInConfig(locations=2, employees_per_location=10)) as server:
+        client = OracleBIClient(server.client_config(username="standin-e2e", max_workers=4))
+        client.dimension_cache = DimensionCache()
+        locations = client.get_locations()
+        refs = [item["locRef"] for item in locations["locations"]]
+        employees = [client.get_employees(ref) for ref in refs]
+        payloads = client.get_timecards_many(timecard_units(refs, date(2026, 7, 1), date(2026, 7, 3)))
+
+    frame = normalize_timecards(payloads, employees=employee_dimension_map(employees))
+    assert refs == ["101", "102"]
+    assert len(payloads) == 6
+    assert not frame.empty
+    assert frame["employee_name"].str.startswith("Employee ").all()
+    assert server.request_counts["getTimeCardDetails"] == 6
+    assert server.request_counts["token"] == 1
+
+
+def test_injected_errors_are_retried_by_the_client() -> None:
+    config = StandInConfig(locations=1, employees_per_location=3, error_rate=0.4, error_statuses=(503,))
+    with StandInBIServer(config) as server:
+        client = OracleBIClient(
+            server.client_config(username="standin-retry", max_workers=2, backoff_seconds=0, max_retries=10)
+        )
+        payloads = client.get_timecards_many(timecard_units(["101"], date(2026, 7, 1), date(2026, 7, 10)))
+
+    assert len(payloads) == 10
+    assert server.request_counts["getTimeCardDetails"] > 10
+    assert client.metrics.endpoint("getTimeCardDetails").retries == server.request_counts["getTimeCardDetails"] - 10
+
+
+def test_record_mode_writes_sanitized_responses_that_replay(tmp_path) -> None:
+    with StandInBIServer(StandInConfig(locations=1, employees_per_location=2)) as server:
+        client = OracleBIClient(
+            server.client_config(username="standin-record", record_directory=str(tmp_path), record_salt="s")
+        )
+        client.dimension_cache = DimensionCache()
+        client.get_employees("101")
+
+    [path] = list((tmp_path / "getEmployeeDimensions").glob("*.json"))
+    recorded = json.loads(path.read_text(encoding="utf-8"))
+    employee = recorded["response"]["employees"][0]
+    assert employee["fName"] == "Employee 1010001"
+    assert employee["lName"] == ""
+    assert employee["payrollId"] == ResponseSanitizer("s").pseudonym("E1010001")
+
+    with StandInBIServer(StandInConfig(locations=0, replay_directory=str(tmp_path))) as replay:
+        client = OracleBIClient(replay.client_config(username="standin-replay"))
+        client.dimension_cache = DimensionCache()
+        assert client.get_employees("101") == recorded["response"]
+
+
+def test_recorded_payroll_filtered_request_replays(tmp_path) -> None:
+    refs, start = ["101"], date(2026, 7, 1)
+    config = StandInConfig(locations=1, employees_per_location=5, shift_probability=1.0)
+    with StandInBIServer(config) as server:
+        client = OracleBIClient(
+            server.client_config(username="standin-record-filter", record_directory=str(tmp_path), record_salt="s")
+        )
+        recorded = client.get_employee_timecards("X1010003", refs, start, start)
+
+    replay_config = StandInConfig(locations=0, replay_directory=str(tmp_path), replay_salt="s")
+    with StandInBIServer(replay_config) as replay:
+        client = OracleBIClient(replay.client_config(username="standin-replay-filter"))
+        replayed = client.get_employee_timecards("X1010003", refs, start, start)
+
+    def cards(payloads):
+        days = [day for payload in payloads for day in payload["businessDates"]]
+        return [card["tcId"] for day in days for card in day["timeCardDetails"]]
+
+    assert cards(recorded)
+    assert cards(replayed) == cards(recorded)
+
+
+def test_sanitizer_blanks_adjustment_manager_and_reason() -> None:
+    payload = {
+        "timeCardDetails": [
+            {"tcId": 1, "adjustments": [{"adjNum": 3, "mgrName": "Jane Manager", "rsn": "fired for X"}]}
+        ]
+    }
+
+    adjustment = ResponseSanitizer("s").sanitize(payload)["timeCardDetails"][0]["adjustments"][0]
+
+    assert adjustment == {"adjNum": 3, "mgrName": "", "rsn": ""}
+
+
+def test_employee_recheck_fetches_only_that_employees_cards() -> None:
+    with StandInBIServer(StandInConfig(locations=2, employees_per_location=10, shift_probability=1.0)) as server:
+        client = OracleBIClient(server.client_config(username="standin-employee", max_workers=4))
+        payloads = client.get_employee_timecards("X1010003", ["101", "102"], date(2026, 7, 1), date(2026, 7, 3))
+
+    frame = normalize_timecards(payloads)
+    assert [p["locRef"] for p in payloads] == ["101"] * 3 + ["102"] * 3
+    assert set(frame["payroll_id"]) == {"E1010003"}
+    assert frame["business_date"].nunique() == 3
+    assert server.request_counts["getTimeCardDetails"] == 6
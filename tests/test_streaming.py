@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from compliance.normalize import normalize_timecards
+from oracle_bi.client import iter_timecards
+from oracle_bi.streaming import TimecardStream
+
+
+PAYLOAD = {
+    "curUTC": "2026-07-02T08:00:00",
+    "locRef": "8",
+    "businessDates": [
+        {
+            "busDt": "2026-07-01",
+            "timeCardDetails": [
+                {
+                    "tcId": 10,
+                    "empNum": 7,
+                    "shftType": 0,
+                    "clkInLcl": "2026-07-01T08:00:00",
+                    "clkOutLcl": "2026-07-01T12:00:00",
+                    "regHrs": 4.0,
+                    "note": "café ñ [brackets] {braces} \"quotes\"",
+                },
+                {"tcId": 11, "empNum": 8, "adjustments": [{"adjUTC": "2026-07-01T20:00:00"}], "regHrs": 12345},
+            ],
+        },
+        {"busDt": "2026-07-02", "timeCardDetails": []},
+    ],
+    "extra": {"nested": [1, 2, 3]},
+}
+
+
+# busDt after the cards, and a float that a chunk boundary can split as "1." + "5".
+LATE_DATE_PAYLOAD = {
+    "locRef": "8",
+    "businessDates": [
+        {"timeCardDetails": [{"tcId": 1, "regHrs": 1.5}, {"tcId": 2}], "busDt": "2026-07-01"},
+        {"busDt": "2026-07-02", "timeCardDetails": [{"tcId": 3, "regHrs": -0.25e1}]},
+    ],
+    "f": 1.5,
+}
+FLAT_PAYLOAD = {"timeCardDetails": [{"tcId": 4, "ok": True, "none": None}], "busDt": "2026-07-04", "locRef": "9"}
+
+
+def _chunks(payload: dict, size: int) -> list[bytes]:
+    body = json.dumps(payload, indent=1).encode("utf-8")
+    return [body[index:index + size] for index in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+def test_stream_yields_the_same_cards_as_the_buffered_decoder(chunk_size: int) -> None:
+    stream = TimecardStream(_chunks(PAYLOAD, chunk_size), adjustments_requested=True)
+    buffered = {**PAYLOAD, "_includeAdjustmentsRequested": True}
+
+    assert list(iter_timecards([stream])) == list(iter_timecards([buffered]))
+    assert stream.header["curUTC"] == "2026-07-02T08:00:00"
+    assert stream.header["extra"] == {"nested": [1, 2, 3]}
+    assert stream.card_counts == {"2026-07-01": 2}
+
+
+@pytest.mark.parametrize("payload", [PAYLOAD, LATE_DATE_PAYLOAD, FLAT_PAYLOAD])
+@pytest.mark.parametrize("separators", [(", ", ": "), (",", ":")])
+def test_stream_matches_buffered_decoder_at_every_chunk_size(payload: dict, separators: tuple[str, str]) -> None:
+    body = json.dumps(payload, separators=separators).encode("utf-8")
+    expected = list(iter_timecards([payload]))
+    for size in range(1, len(body) + 1):
+        stream = TimecardStream([body[index:index + size] for index in range(0, len(body), size)])
+        assert list(stream) == expected, size
+        assert stream.header.get("f") == payload.get("f"), size
+
+
+def test_cards_before_their_business_date_get_the_real_date() -> None:
+    stream = TimecardStream(_chunks(LATE_DATE_PAYLOAD, 2), requested_bus_dt="2026-06-30")
+    assert [(bus_dt, card["tcId"]) for _, bus_dt, card in stream] == [
+        ("2026-07-01", 1),
+        ("2026-07-01", 2),
+        ("2026-07-02", 3),
+    ]
+    assert stream.card_counts == {"2026-07-01": 2, "2026-07-02": 1}
+
+
+def test_normalize_timecards_accepts_streams() -> None:
+    streamed = normalize_timecards([TimecardStream(_chunks(PAYLOAD, 5), adjustments_requested=True)])
+    buffered = normalize_timecards([{**PAYLOAD, "_includeAdjustmentsRequested": True}])
+    columns = [column for column in buffered.columns if column != "raw"]
+    assert streamed[columns].equals(buffered[columns])
+
+
+def test_stream_falls_back_to_requested_date_and_rejects_reuse() -> None:
+    stream = TimecardStream(
+        [b'{"timeCardDetails": [{"tcId": 1}]}'], loc_ref="9", requested_bus_dt="2026-07-03"
+    )
+    assert list(stream) == [("9", "2026-07-03", {"tcId": 1})]
+    with pytest.raises(RuntimeError):
+        list(stream)
+
+
+def test_client_stream_timecards_reads_the_response_incrementally() -> None:
+    from datetime import date
+
+    from oracle_bi.client import OracleBIClient, OracleBIConfig, TokenBundle
+
+    class _StreamingResponse:
+        status_code = 200
+        headers: dict = {}
+        closed = False
+
+        def iter_content(self, chunk_size):
+            yield from _chunks(PAYLOAD, 16)
+
+        def close(self) -> None:
+            self.closed = True
+
+    response = _StreamingResponse()
+
+    class _Session:
+        def post(self, *args, **kwargs):
+            assert kwargs["stream"] is True
+            return response
+
+    client = OracleBIClient(
+        OracleBIConfig(
+            auth_server="https://auth.example",
+            application_server="https://app.example",
+            org_identifier="BYC",
+            client_id="client",
+            username="bi-user",
+            password="secret",
+        )
+    )
+    client.tokens = TokenBundle("token", "refresh", float("inf"))
+    client.session = _Session()
+
+    rows = list(iter_timecards([client.stream_timecards("8", date(2026, 7, 1))]))
+    assert [card["tcId"] for _, _, card in rows] == [10, 11]
+    assert all(card["_adjustmentsRequested"] is True for _, _, card in rows)
+    assert response.closed
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from oracle_bi.cache import DimensionCache
+from oracle_bi.metrics import LatencyHistory
+from oracle_bi.client import OracleBIClient, OracleBIConfig, OracleBIError, TokenBundle
+from oracle_bi.throttle import CircuitBreaker, RetryPolicy, TokenBucket, parse_retry_after
+
+
+class _Response:
+    def __init__(self, status_code: int, payload: dict | None = None, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._payload = payload if payload is not None else {}
+        self.text = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return self._payload
+
+    def close(self) -> None:
+        pass
+
+
+class _ScriptedSession:
+    def __init__(self, outcomes: list) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def post(self, *args, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _client(outcomes: list, **overrides) -> tuple[OracleBIClient, _ScriptedSession]:
+    config = OracleBIConfig(
+        auth_server="https://auth.example",
+        application_server="https://app.example",
+        org_identifier="BYC",
+        client_id="client",
+        username="bi-user",
+        password="secret",
+        backoff_seconds=0.0,
+        requests_per_second=1000.0,
+        **overrides,
+    )
+    client = OracleBIClient(config)
+    client.tokens = TokenBundle("token", "refresh", float("inf"))
+    client.dimension_cache = DimensionCache()
+    session = _ScriptedSession(outcomes)
+    client.session = session
+    return client, session
+
+
+def test_post_retries_throttling_server_errors_and_timeouts() -> None:
+    client, session = _client(
+        [
+            _Response(429, headers={"Retry-After": "0"}),
+            requests.Timeout("slow"),
+            _Response(503),
+            _Response(200, {"locations": []}),
+        ]
+    )
+    assert client.get_locations() == {"locations": []}
+    assert session.calls == 4
+    bucket = client.rate_limiter.bucket("getLocationDimensions")
+    assert bucket.rate < bucket.maximum_rate
+
+
+def test_post_raises_after_retry_budget_is_spent() -> None:
+    client, session = _client([_Response(503), _Response(503), _Response(503)], max_retries=2)
+    try:
+        client.get_locations()
+    except OracleBIError as error:
+        assert "HTTP 503" in str(error)
+    else:  # pragma: no cover - defensive
+        raise AssertionError("expected OracleBIError")
+    assert session.calls == 3
+
+
+def test_client_errors_are_not_retried() -> None:
+    client, session = _client([_Response(400, {"detail": "bad locRef"})])
+    try:
+        client.get_employees("X")
+    except OracleBIError as error:
+        assert "bad locRef" in str(error)
+    assert session.calls == 1
+
+
+def test_local_throttle_wait_is_not_recorded_as_store_latency() -> None:
+    client, session = _client(
+        [_Response(200, {"locRef": "8", "businessDates": []})],
+        endpoint_rate_limits={"getTimeCardDetails": 5.0},
+    )
+    client.latency_history = LatencyHistory()
+    bucket = client.rate_limiter.bucket("getTimeCardDetails")
+    for _ in range(6):
+        bucket.reserve()
+
+    started = time.perf_counter()
+    client.post("getTimeCardDetails", {"locRef": "8", "busDt": "2026-07-01"})
+
+    assert time.perf_counter() - started >= 0.3
+    assert session.calls == 1
+    assert client.latency_history.estimate("8") < 0.1
+
+
+def test_clients_of_one_tenant_share_rate_limits_and_throttling() -> None:
+    first, _ = _client([_Response(429, headers={"Retry-After": "0"}), _Response(200, {"locations": []})])
+    second, _ = _client([])
+    other_tenant = OracleBIClient(
+        OracleBIConfig(
+            auth_server="https://auth.example",
+            application_server="https://app.example",
+            org_identifier="OTHER",
+            client_id="client",
+            username="bi-user",
+            password="secret",
+            requests_per_second=1000.0,
+        )
+    )
+
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is not other_tenant.rate_limiter
+    rate_before = second.rate_limiter.bucket("getLocationDimensions").rate
+    first.get_locations()
+    assert second.rate_limiter.bucket("getLocationDimensions").rate < rate_before
+    assert other_tenant.rate_limiter.bucket("getLocationDimensions").rate == 1000.0
+
+
+def test_token_bucket_spaces_requests_and_adapts_rate() -> None:
+    now = [0.0]
+    bucket = TokenBucket(2.0, capacity=1.0, clock=lambda: now[0])
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+    bucket.throttle(pause_seconds=3.0)
+    assert bucket.rate == 1.0
+    assert bucket.reserve() >= 3.0
+    for _ in range(40):
+        bucket.recover()
+    assert bucket.rate == 2.0
+
+
+def test_retry_policy_honours_retry_after() -> None:
+    policy = RetryPolicy(backoff_seconds=0.1, backoff_max_seconds=10.0)
+    assert policy.delay(0, retry_after=4.0) >= 4.0
+    assert 0.0 <= policy.delay(3) <= 0.8
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_circuit_breaker_opens_then_admits_one_trial_after_reset() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(2, 60.0, clock=lambda: now[0])
+    assert breaker.record_failure("9") is False
+    assert breaker.record_failure("9") is True
+    assert not breaker.allow("9")
+    assert breaker.allow("8")
+
+    now[0] = 61.0
+    assert breaker.allow("9")
+    assert breaker.record_failure("9") is True
+    assert not breaker.allow("9")
+
+    now[0] = 200.0
+    assert breaker.allow("9")
+    breaker.record_success("9")
+    assert breaker.record_failure("9") is False
+    assert CircuitBreaker(0).record_failure("9") is False
+
+
+def test_half_open_circuit_admits_a_single_trial_across_threads() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(1, 60.0, clock=lambda: now[0])
+    breaker.record_failure("9")
+    now[0] = 61.0
+    barrier = threading.Barrier(16)
+
+    def attempt(_: int) -> bool:
+        barrier.wait()
+        return breaker.allow("9")
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        admitted = list(pool.map(attempt, range(16)))
+
+    assert admitted.count(True) == 1
+    assert not breaker.allow("9")
+    breaker.record_success("9")
+    assert breaker.allow("9") and breaker.allow("9")
+
+    breaker.record_failure("9")
+    now[0] = 130.0
+    assert breaker.allow("9")
+    now[0] = 200.0
+    # The trial never reported back; after another reset period a new one is admitted.
+    assert breaker.allow("9")
+    assert not breaker.allow("9")
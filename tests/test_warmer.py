@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+from datetime import date
+
+import pytest
+
+from oracle_bi.cache import DimensionCache
+from oracle_bi.client import OracleBIClient, OracleBIConfig, config_fingerprint
+from oracle_bi.warmer import _WARMERS, CacheWarmer, ensure_cache_warmer
+
+
+class _TenantClient(OracleBIClient):
+    def __init__(self, config: OracleBIConfig) -> None:
+        super().__init__(config)
+        self.dimension_cache = DimensionCache()
+        self.calls: list[tuple[str, str]] = []
+
+    def post(self, endpoint, payload):
+        self.calls.append((endpoint, payload.get("busDt", "")))
+        if endpoint == "getLocationDimensions":
+            return {"locations": [{"locRef": "8", "active": True}, {"locRef": "9", "active": False}]}
+        if endpoint == "getLatestBusDt":
+            return {"locRef": payload["locRef"], "latestBusDt": "2026-07-10"}
+        if endpoint in ("getEmployeeDimensions", "getJobCodeDimensions"):
+            return {"locRef": payload["locRef"], "employees": [], "jobCodes": []}
+        return {
+            "locRef": payload["locRef"],
+            "businessDates": [{"busDt": payload["busDt"], "timeCardDetails": [{"tcId": 1}]}],
+        }
+
+
+def _client(tmp_path, **overrides) -> _TenantClient:
+    values = {
+        "auth_server": "https://auth.example",
+        "application_server": "https://app.example",
+        "org_identifier": "BYC",
+        "client_id": "client",
+        "username": "warm-user",
+        "password": "secret",
+        "cache_directory": str(tmp_path / "cache"),
+    }
+    values.update(overrides)
+    return _TenantClient(OracleBIConfig(**values))
+
+
+def test_warmer_prefetches_newly_closed_days_once(tmp_path) -> None:
+    client = _client(tmp_path)
+    warmer = CacheWarmer(client, lookback_days=2)
+
+    report = warmer.warm_once()
+
+    assert report.warmed_units == [("8", date(2026, 7, 8)), ("8", date(2026, 7, 9))]
+    assert ("getEmployeeDimensions", "") in client.calls
+    assert ("getJobCodeDimensions", "") in client.calls
+
+    client.calls.clear()
+    report = warmer.warm_once(["8"])
+    assert report.warmed_units == []
+    assert report.already_warm == 2
+    assert [endpoint for endpoint, _ in client.calls] == ["getLatestBusDt"]
+
+
+def test_seeded_interactive_client_reads_warm_days_without_oracle(tmp_path) -> None:
+    warmer = CacheWarmer(_client(tmp_path))
+    warmer.warm_once(["8"])
+
+    interactive = _client(tmp_path)
+    assert warmer.seed(interactive) == 1
+    payload = interactive.get_timecards("8", date(2026, 7, 9))
+
+    assert payload["businessDates"][0]["busDt"] == "2026-07-09"
+    assert interactive.calls == []
+
+
+def test_warmer_requires_a_disk_cache(tmp_path) -> None:
+    with pytest.raises(ValueError, match="cache_directory"):
+        CacheWarmer(_client(tmp_path, cache_directory=""))
+
+
+class _FullDiskCache:
+    def get(self, *args, **kwargs):
+        return None
+
+    def put(self, *args, **kwargs):
+        raise OSError(28, "No space left on device")
+
+
+def test_warmer_thread_survives_unexpected_errors_and_is_restarted(tmp_path) -> None:
+    client = _client(tmp_path, username="full-disk-user")
+    client.cache = _FullDiskCache()
+    warmer = CacheWarmer(client).start()
+    try:
+        deadline = time.monotonic() + 5
+        while warmer.last_error is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert warmer.last_error == "OSError: [Errno 28] No space left on device"
+        assert warmer.last_report.errors == {"": warmer.last_error}
+        assert warmer.running
+    finally:
+        warmer.stop(timeout=5)
+
+    assert not warmer.running
+    _WARMERS[config_fingerprint(client.config)] = warmer
+    try:
+        assert ensure_cache_warmer(client.config) is warmer
+        assert warmer.running
+    finally:
+        warmer.stop(timeout=5)
+        _WARMERS.pop(config_fingerprint(client.config), None)
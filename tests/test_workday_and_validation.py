@@ -48,6 +48,24 @@ def test_timecard_crossing_workday_boundary_is_split() -> None:
     assert result["workday_config_verified"].all()
 
 
+def test_multi_day_timecard_is_split_once_per_workday() -> None:
+    long_card = raw_card("2026-07-01 20:00", "2026-07-03 02:00", tc="7")
+    long_card.update(regular_hours=24.0, premium_hours=1.0, adjustment_count=1, adjustments=[{"adjNum": 1}])
+    untimed = raw_card("2026-07-01 08:00", "2026-07-01 12:00", tc="8")
+    untimed["clock_in_local"] = pd.NaT
+    result = assign_legal_workdays(pd.DataFrame([untimed, long_card]))
+    split = result[result["source_timecard_id"] == "7"]
+    assert list(split["timecard_id"]) == ["7::SEG1", "7::SEG2", "7::SEG3"]
+    assert list(split["legal_workday_date"]) == [date(2026, 7, 1), date(2026, 7, 2), date(2026, 7, 3)]
+    assert [round(hours, 6) for hours in split["regular_hours"]] == [3.2, 19.2, 1.6]
+    assert list(split["premium_hours"]) == [1.0, 0.0, 0.0]
+    assert list(split["adjustments"]) == [[{"adjNum": 1}], [], []]
+    assert list(split["is_primary_segment"]) == [True, False, False]
+    row = result[result["source_timecard_id"] == "8"].iloc[0]
+    assert row["segment_count"] == 1 and row["legal_workday_date"] == date(2026, 7, 1)
+    assert not row["business_date_match"]
+
+
 def test_unconfigured_location_is_marked_unverified() -> None:
     result = assign_legal_workdays(pd.DataFrame([raw_card("2026-07-01 08:00", "2026-07-01 12:00")]))
     assert not bool(result.iloc[0]["workday_config_verified"])